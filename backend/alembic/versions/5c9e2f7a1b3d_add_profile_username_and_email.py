@@ -0,0 +1,59 @@
+"""add profile username and email
+
+Adds profiles.username (unique, required) and profiles.email to databases
+created from the original schema. Existing profiles have no username, so
+they get ``profile<id>`` before the column is made NOT NULL.
+
+Revision ID: 5c9e2f7a1b3d
+Revises:
+Create Date: 2026-10-18 10:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c9e2f7a1b3d'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ix_profiles_username"
+
+BACKFILL_USERNAMES = """
+    UPDATE profiles SET username = 'profile' || CAST(id AS VARCHAR(16))
+    WHERE username IS NULL
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    if "profiles" not in inspector.get_table_names():
+        # Fresh database: init_db creates the table with the columns.
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("profiles")}
+    if "email" not in columns:
+        op.add_column("profiles", sa.Column("email", sa.String(254), nullable=True))
+
+    if "username" not in columns:
+        op.add_column("profiles", sa.Column("username", sa.String(16), nullable=True))
+        op.execute(BACKFILL_USERNAMES)
+        with op.batch_alter_table("profiles") as batch_op:
+            batch_op.alter_column("username", existing_type=sa.String(16), nullable=False)
+
+    indexes = {index["name"] for index in sa.inspect(op.get_bind()).get_indexes("profiles")}
+    if INDEX_NAME not in indexes:
+        op.create_index(INDEX_NAME, "profiles", ["username"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(INDEX_NAME, table_name="profiles")
+    with op.batch_alter_table("profiles") as batch_op:
+        batch_op.drop_column("email")
+        batch_op.drop_column("username")
@@ -0,0 +1,79 @@
+"""aggregate ip sightings
+
+Turns ip_addresses from one row per sighting into one row per
+(profile_id, ip_address) with first_seen, last_seen and hit_count.
+Duplicate rows are folded into the oldest one before the unique index is
+created. Profile IP history keeps paging on (timestamp, id), which upserts
+never change, so its index is left as it is.
+
+Revision ID: a1e4c7b2d9f3
+Revises: d4e7a9c2f1b6
+Create Date: 2026-10-18 14:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1e4c7b2d9f3'
+down_revision: Union[str, None] = 'd4e7a9c2f1b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UNIQUE_INDEX = "uq_ip_addresses_profile_id_ip_address"
+
+FOLD_DUPLICATES = """
+    UPDATE ip_addresses SET
+        first_seen = (SELECT MIN(d.timestamp) FROM ip_addresses d
+                      WHERE d.profile_id = ip_addresses.profile_id AND d.ip_address = ip_addresses.ip_address),
+        last_seen = (SELECT MAX(d.timestamp) FROM ip_addresses d
+                     WHERE d.profile_id = ip_addresses.profile_id AND d.ip_address = ip_addresses.ip_address),
+        hit_count = (SELECT COUNT(*) FROM ip_addresses d
+                     WHERE d.profile_id = ip_addresses.profile_id AND d.ip_address = ip_addresses.ip_address)
+"""
+
+DELETE_DUPLICATES = """
+    DELETE FROM ip_addresses WHERE id NOT IN (
+        SELECT keep_id FROM (
+            SELECT MIN(id) AS keep_id FROM ip_addresses GROUP BY profile_id, ip_address
+        ) AS survivors
+    )
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    if "ip_addresses" not in inspector.get_table_names():
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("ip_addresses")}
+    if "hit_count" in columns:
+        return
+
+    # SQLite cannot add a column with a non-constant default, so the
+    # timestamps are added nullable, backfilled, then made NOT NULL.
+    op.add_column("ip_addresses", sa.Column("first_seen", sa.DateTime(), nullable=True))
+    op.add_column("ip_addresses", sa.Column("last_seen", sa.DateTime(), nullable=True))
+    op.add_column("ip_addresses", sa.Column("hit_count", sa.Integer(), nullable=False, server_default="1"))
+
+    op.execute(FOLD_DUPLICATES)
+    op.execute(DELETE_DUPLICATES)
+
+    with op.batch_alter_table("ip_addresses") as batch_op:
+        batch_op.alter_column("first_seen", existing_type=sa.DateTime(), nullable=False, server_default=sa.func.now())
+        batch_op.alter_column("last_seen", existing_type=sa.DateTime(), nullable=False, server_default=sa.func.now())
+
+    op.create_index(UNIQUE_INDEX, "ip_addresses", ["profile_id", "ip_address"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema. Folded duplicate sightings are not restored."""
+    op.drop_index(UNIQUE_INDEX, table_name="ip_addresses")
+    with op.batch_alter_table("ip_addresses") as batch_op:
+        batch_op.drop_column("hit_count")
+        batch_op.drop_column("last_seen")
+        batch_op.drop_column("first_seen")
@@ -0,0 +1,93 @@
+"""add ip_numeric to ip_addresses
+
+Stores every sighting's address as a 16-byte big-endian integer next to
+the text column, indexes it, and backfills existing rows in batches.
+
+Revision ID: a3f1c9e2b7d4
+Revises: 5c9e2f7a1b3d
+Create Date: 2026-10-18 10:30:00.000000
+
+"""
+import ipaddress
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f1c9e2b7d4'
+down_revision: Union[str, None] = '5c9e2f7a1b3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 5000
+INDEX_NAME = "ix_ip_addresses_ip_numeric_profile_id"
+IP_NUMERIC_WIDTH = 16
+
+
+def pack_ip_address(address: str) -> Optional[bytes]:
+    """Encode an address as 16 big-endian bytes, IPv4 mapped into IPv6.
+
+    A copy of the encoding as of this revision, so later changes to the
+    application's ``app.utils.ip`` do not change what this migration writes.
+    """
+    try:
+        parsed = ipaddress.ip_address(address.strip())
+    except (AttributeError, ValueError):
+        return None
+    if isinstance(parsed, ipaddress.IPv4Address):
+        parsed = ipaddress.IPv6Address(f"::ffff:{parsed}")
+    return parsed.packed
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "ip_addresses" not in inspector.get_table_names():
+        # Fresh database: the table is created with the column by init_db.
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("ip_addresses")}
+    if "ip_numeric" not in columns:
+        op.add_column(
+            "ip_addresses",
+            sa.Column("ip_numeric", sa.LargeBinary(IP_NUMERIC_WIDTH), nullable=True),
+        )
+
+    indexes = {index["name"] for index in inspector.get_indexes("ip_addresses")}
+    if INDEX_NAME not in indexes:
+        op.create_index(INDEX_NAME, "ip_addresses", ["ip_numeric", "profile_id"])
+
+    ip_addresses = sa.table(
+        "ip_addresses",
+        sa.column("id", sa.Integer),
+        sa.column("ip_address", sa.String),
+        sa.column("ip_numeric", sa.LargeBinary),
+    )
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(ip_addresses.c.id, ip_addresses.c.ip_address)
+            .where(ip_addresses.c.id > last_id, ip_addresses.c.ip_numeric.is_(None))
+            .order_by(ip_addresses.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+
+        bind.execute(
+            sa.update(ip_addresses)
+            .where(ip_addresses.c.id == sa.bindparam("row_id"))
+            .values(ip_numeric=sa.bindparam("packed")),
+            [{"row_id": row.id, "packed": pack_ip_address(row.ip_address)} for row in rows],
+        )
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(INDEX_NAME, table_name="ip_addresses")
+    with op.batch_alter_table("ip_addresses") as batch_op:
+        batch_op.drop_column("ip_numeric")
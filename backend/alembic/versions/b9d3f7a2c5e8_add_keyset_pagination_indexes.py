@@ -0,0 +1,44 @@
+"""add keyset pagination indexes
+
+Composite indexes backing the keyset-paginated listings: profiles and
+users newest first, and each profile's IP address history.
+
+Revision ID: b9d3f7a2c5e8
+Revises: f2a6c8e4b1d7
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9d3f7a2c5e8'
+down_revision: Union[str, None] = 'f2a6c8e4b1d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ("ix_profiles_created_at_id", "profiles", ["created_at", "id"]),
+    ("ix_users_timestamp_id", "users", ["timestamp", "id"]),
+    ("ix_ip_addresses_profile_id_timestamp_id", "ip_addresses", ["profile_id", "timestamp", "id"]),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+    for name, table, columns in INDEXES:
+        if table not in tables:
+            continue
+        if name not in {index["name"] for index in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
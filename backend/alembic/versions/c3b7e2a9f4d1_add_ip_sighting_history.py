@@ -0,0 +1,65 @@
+"""add ip sighting history
+
+Adds ip_sightings_raw, one row per observation recorded through the
+sightings API, and ip_sightings_daily, the per-day aggregates the
+retention job rolls old observations into.
+
+Revision ID: c3b7e2a9f4d1
+Revises: a1e4c7b2d9f3
+Create Date: 2026-10-18 16:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3b7e2a9f4d1'
+down_revision: Union[str, None] = 'a1e4c7b2d9f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    tables = sa.inspect(op.get_bind()).get_table_names()
+    if "profiles" not in tables:
+        return
+
+    if "ip_sightings_raw" not in tables:
+        op.create_table(
+            "ip_sightings_raw",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("profile_id", sa.Integer(), sa.ForeignKey("profiles.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("ip_address", sa.String(45), nullable=False),
+            sa.Column("seen_at", sa.DateTime(), nullable=False),
+        )
+        op.create_index("ix_ip_sightings_raw_seen_at_id", "ip_sightings_raw", ["seen_at", "id"])
+        op.create_index("ix_ip_sightings_raw_profile_id_seen_at", "ip_sightings_raw", ["profile_id", "seen_at"])
+
+    if "ip_sightings_daily" not in tables:
+        op.create_table(
+            "ip_sightings_daily",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("profile_id", sa.Integer(), sa.ForeignKey("profiles.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("ip_address", sa.String(45), nullable=False),
+            sa.Column("day", sa.Date(), nullable=False),
+            sa.Column("first_seen", sa.DateTime(), nullable=False),
+            sa.Column("last_seen", sa.DateTime(), nullable=False),
+            sa.Column("hit_count", sa.Integer(), nullable=False),
+        )
+        op.create_index(
+            "uq_ip_sightings_daily_profile_id_ip_address_day",
+            "ip_sightings_daily",
+            ["profile_id", "ip_address", "day"],
+            unique=True,
+        )
+        op.create_index("ix_ip_sightings_daily_profile_id_day", "ip_sightings_daily", ["profile_id", "day"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("ip_sightings_daily")
+    op.drop_table("ip_sightings_raw")
@@ -0,0 +1,110 @@
+"""add fulltext search indexes
+
+Creates the FTS5 trigram indexes over profiles and accounts with their
+sync triggers, and indexes the rows that already exist (SQLite only).
+The profile index covers profiles.username, added by 5c9e2f7a1b3d.
+
+Revision ID: c7d2e4f1a9b3
+Revises: a3f1c9e2b7d4
+Create Date: 2026-10-18 10:45:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d2e4f1a9b3'
+down_revision: Union[str, None] = 'a3f1c9e2b7d4'
+branch_labels: Union[str, Sequence[str], None] = None
+# Indexes profiles.username
+depends_on: Union[str, Sequence[str], None] = '5c9e2f7a1b3d'
+
+# The schema as of this revision; app.db.fulltext may change later
+FULLTEXT_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS profiles_fts USING fts5(
+        username, full_name, content='profiles', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS profiles_fts_ai AFTER INSERT ON profiles BEGIN
+        INSERT INTO profiles_fts(rowid, username, full_name)
+        VALUES (new.id, new.username, new.full_name);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS profiles_fts_ad AFTER DELETE ON profiles BEGIN
+        INSERT INTO profiles_fts(profiles_fts, rowid, username, full_name)
+        VALUES ('delete', old.id, old.username, old.full_name);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS profiles_fts_au AFTER UPDATE OF username, full_name ON profiles BEGIN
+        INSERT INTO profiles_fts(profiles_fts, rowid, username, full_name)
+        VALUES ('delete', old.id, old.username, old.full_name);
+        INSERT INTO profiles_fts(rowid, username, full_name)
+        VALUES (new.id, new.username, new.full_name);
+    END
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS accounts_fts USING fts5(
+        nickname, content='accounts', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS accounts_fts_ai AFTER INSERT ON accounts BEGIN
+        INSERT INTO accounts_fts(rowid, nickname) VALUES (new.id, new.nickname);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS accounts_fts_ad AFTER DELETE ON accounts BEGIN
+        INSERT INTO accounts_fts(accounts_fts, rowid, nickname) VALUES ('delete', old.id, old.nickname);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS accounts_fts_au AFTER UPDATE OF nickname ON accounts BEGIN
+        INSERT INTO accounts_fts(accounts_fts, rowid, nickname) VALUES ('delete', old.id, old.nickname);
+        INSERT INTO accounts_fts(rowid, nickname) VALUES (new.id, new.nickname);
+    END
+    """,
+]
+
+FULLTEXT_REBUILD = [
+    "INSERT INTO profiles_fts(profiles_fts) VALUES ('rebuild')",
+    "INSERT INTO accounts_fts(accounts_fts) VALUES ('rebuild')",
+]
+
+FULLTEXT_DROP = [
+    "DROP TABLE IF EXISTS profiles_fts",
+    "DROP TABLE IF EXISTS accounts_fts",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name != "sqlite":
+        return
+
+    tables = sa.inspect(bind).get_table_names()
+    if "profiles" not in tables or "accounts" not in tables:
+        # Fresh database: init_db creates the indexes with the tables.
+        return
+
+    for statement in FULLTEXT_DDL + FULLTEXT_REBUILD:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    for trigger in ("profiles_fts_ai", "profiles_fts_ad", "profiles_fts_au",
+                    "accounts_fts_ai", "accounts_fts_ad", "accounts_fts_au"):
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    for statement in FULLTEXT_DROP:
+        op.execute(statement)
@@ -0,0 +1,41 @@
+"""add profile version
+
+Adds profiles.version, bumped whenever a profile's accounts, IP addresses
+or cluster change; profile reads derive their ETag from it.
+
+Revision ID: d4e7a9c2f1b6
+Revises: b9d3f7a2c5e8
+Create Date: 2026-10-18 12:45:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e7a9c2f1b6'
+down_revision: Union[str, None] = 'b9d3f7a2c5e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    if "profiles" not in inspector.get_table_names():
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("profiles")}
+    if "version" not in columns:
+        op.add_column(
+            "profiles",
+            sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("profiles") as batch_op:
+        batch_op.drop_column("version")
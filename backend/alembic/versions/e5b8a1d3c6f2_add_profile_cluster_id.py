@@ -0,0 +1,48 @@
+"""add profile cluster_id
+
+Adds profiles.cluster_id and the indexes used for incremental clustering.
+Populate existing rows afterwards with ``python -m app.cli.rebuild_clusters``.
+
+Revision ID: e5b8a1d3c6f2
+Revises: c7d2e4f1a9b3
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b8a1d3c6f2'
+down_revision: Union[str, None] = 'c7d2e4f1a9b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    tables = inspector.get_table_names()
+
+    if "profiles" in tables:
+        columns = {column["name"] for column in inspector.get_columns("profiles")}
+        if "cluster_id" not in columns:
+            op.add_column("profiles", sa.Column("cluster_id", sa.Integer(), nullable=True))
+        indexes = {index["name"] for index in inspector.get_indexes("profiles")}
+        if "ix_profiles_cluster_id" not in indexes:
+            op.create_index("ix_profiles_cluster_id", "profiles", ["cluster_id"])
+
+    if "accounts" in tables:
+        indexes = {index["name"] for index in inspector.get_indexes("accounts")}
+        if "ix_accounts_nickname" not in indexes:
+            op.create_index("ix_accounts_nickname", "accounts", ["nickname"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_accounts_nickname", table_name="accounts")
+    op.drop_index("ix_profiles_cluster_id", table_name="profiles")
+    with op.batch_alter_table("profiles") as batch_op:
+        batch_op.drop_column("cluster_id")
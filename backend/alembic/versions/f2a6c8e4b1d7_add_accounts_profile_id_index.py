@@ -0,0 +1,37 @@
+"""add accounts profile_id index
+
+Indexes accounts.profile_id so eager loading a page of profiles is an
+index lookup per profile instead of a scan of accounts.
+
+Revision ID: f2a6c8e4b1d7
+Revises: e5b8a1d3c6f2
+Create Date: 2026-10-18 11:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a6c8e4b1d7'
+down_revision: Union[str, None] = 'e5b8a1d3c6f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    if "accounts" not in inspector.get_table_names():
+        return
+
+    indexes = {index["name"] for index in inspector.get_indexes("accounts")}
+    if "ix_accounts_profile_id" not in indexes:
+        op.create_index("ix_accounts_profile_id", "accounts", ["profile_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_accounts_profile_id", table_name="accounts")
@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import math
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import get_db
+from app.db import get_read_db
 from app.repository import UserRepository
-from app.services.auth.password_service import verify_password
+from app.exceptions import PasswordHashQueueFullException
+from app.services.auth.login_limiter import login_limiter
+from app.services.auth.password_service import verify_password_async
 from app.services.auth.token_service import create_access_token
 from app.schemas.token import Token
 
@@ -19,8 +23,9 @@ router = APIRouter()
     # summary="Generate access token",
     # description="Generate an access token using username and password.",
 )
-def login_for_access_token(
-    db: Session = Depends(get_db),
+async def login_for_access_token(
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
     form_data: OAuth2PasswordRequestForm = Depends(),
 ):
     """
@@ -35,15 +40,36 @@ def login_for_access_token(
     
     ## Errors
     - **401 Unauthorized**: Invalid credentials
+    - **429 Too Many Requests**: Too many attempts for this username or client address
+    - **503 Service Unavailable**: Password hashing queue is full
     """
-    user = UserRepository.get_by_username(db, username=form_data.username)
+    client_ip = request.client.host if request.client else None
+    retry_after = login_limiter.acquire(form_data.username, client_ip)
+    if retry_after > 0:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts, try again later",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+    
+    user = await UserRepository.get_by_username(db, username=form_data.username)
+    
+    try:
+        is_valid = user is not None and await verify_password_async(form_data.password, user.hashed_password)
+    except PasswordHashQueueFullException as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=e.message,
+            headers={"Retry-After": "1"},
+        )
     
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not is_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    login_limiter.reset_username(form_data.username)
     access_token = create_access_token(data={"sub": user.username})
     return {"access_token": access_token, "token_type": "bearer"}
\ No newline at end of file
@@ -0,0 +1,125 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_db, get_read_db
+from app.repository import IPRepository
+from app.schemas.ip_address_schema import IPAddressResponse, IPProfileLookupResponse, IPIndexStats, IPSightingBatch, IPSightingReport
+from app.services.ip_index_service import ip_index
+from app.api.dependencies import get_current_user
+
+router = APIRouter()
+
+@router.get(
+    "/search",
+    response_model=list[IPAddressResponse],
+    summary="Search IP address sightings",
+    description="Find sightings by exact address, IPv4 prefix or CIDR block.",
+)
+async def search_ip_addresses(
+    q: str = Query(..., description="Address, prefix (177.12.) or CIDR block (177.12.0.0/16)"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of sightings"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user = Depends(get_current_user),
+) -> list[IPAddressResponse]:
+    """
+    Search IP address sightings.
+    
+    ## Query Parameters
+    - **q**: `177.12.4.2` (exact), `177.12.` (prefix) or `177.12.0.0/16` (CIDR)
+    - **limit**: Maximum number of sightings (1-1000)
+    
+    ## Returns
+    Matching sightings ordered by address.
+    
+    ## Errors
+    - **400 Bad Request**: Invalid address, prefix or network
+    """
+    try:
+        return await IPRepository.search(db, query=q, limit=limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+@router.get(
+    "/profiles",
+    response_model=IPProfileLookupResponse,
+    summary="Find profiles by IP address",
+    description="List the profiles seen on an address, IPv4 prefix or CIDR block.",
+)
+async def get_profiles_by_ip(
+    q: str = Query(..., description="Address, prefix (177.12.) or CIDR block (177.12.0.0/16)"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user = Depends(get_current_user),
+) -> IPProfileLookupResponse:
+    """
+    Find profiles by IP address.
+    
+    Served from the in-memory IP index once it is built, from the database otherwise.
+    
+    ## Query Parameters
+    - **q**: `177.12.4.2` (exact), `177.12.` (prefix) or `177.12.0.0/16` (CIDR)
+    
+    ## Returns
+    The query and the sorted IDs of matching profiles.
+    
+    ## Errors
+    - **400 Bad Request**: Invalid address, prefix or network
+    """
+    try:
+        if ip_index.ready:
+            profile_ids = ip_index.lookup(q)
+        else:
+            profile_ids = await IPRepository.get_profile_ids(db, query=q)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    return IPProfileLookupResponse(query=q, profile_ids=profile_ids)
+
+@router.post(
+    "/sightings",
+    response_model=IPSightingReport,
+    summary="Record IP address sightings",
+    description="Record a batch of IP address observations, aggregated per profile and address.",
+)
+async def record_sightings(
+    batch: IPSightingBatch,
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_user),
+) -> IPSightingReport:
+    """
+    Record IP address sightings.
+    
+    ## Request Body
+    - **sightings**: List of `{profile_id, ip_address, seen_at}`; `seen_at` defaults to now
+    
+    ## Returns
+    Number of sightings received, number of distinct (profile, address)
+    pairs written and the IDs of unknown profiles, whose sightings are skipped.
+    Each pair keeps its first and last sighting and a hit count, so repeated
+    sightings never add rows.
+    
+    ## Errors
+    - **422 Unprocessable Entity**: Invalid address or too many sightings
+    """
+    return await IPRepository.record_sightings(db, batch.sightings)
+
+@router.get(
+    "/index",
+    response_model=IPIndexStats,
+    summary="IP index statistics",
+    description="Report the size, memory footprint and build time of the in-memory IP index.",
+)
+async def get_ip_index_stats(
+    current_user = Depends(get_current_user),
+) -> IPIndexStats:
+    """
+    Report in-memory IP index statistics.
+    
+    ## Returns
+    Address, entry and node counts, estimated memory in bytes and last build time.
+    """
+    return IPIndexStats(**ip_index.stats())
@@ -1,10 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+import ipaddress
+from typing import Literal, Optional, Union
 
-from app.db.session import get_db
-from app.models import Profile
-from app.schemas.profile_schema import ProfileSchema, ProfileResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_db, get_read_db
+from app.repository import ProfileRepository, ClusterRepository, IPRepository
+from app.schemas.profile_schema import ProfileSchema, ProfileResponse, ProfileImportReport, ProfileSearchResult, ProfileClusterResponse, ProfileDetail
+from app.schemas.ip_address_schema import IPAddressResponse, IPDailyActivity
+from app.schemas.pagination import Page
+from app.services.profile_import_service import ProfileImportService
+from app.services.profile_export_service import ProfileExportService
 from app.api.dependencies import get_current_user
+from app.api.responses import MSGPACK_MEDIA_TYPE, MSGPACK_RESPONSES, negotiate, preferred_media_type
+from app.utils.etag import etag_matches, make_etag
 
 router = APIRouter()
 
@@ -15,9 +25,9 @@ router = APIRouter()
     summary="Create a new profile",
     description="Create a new profile with the given details.",
 )
-def create_profile(
+async def create_profile(
     profile_in: ProfileSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_user),
 ) -> ProfileResponse:
     """
@@ -39,7 +49,7 @@ def create_profile(
     - **409 Conflict**: Username already exists
     - **500 Internal Server Error**: Database operation failed
     """
-    existing_profile = db.query(Profile).filter(Profile.username == profile_in.username).first()
+    existing_profile = await ProfileRepository.get_by_username(db, username=profile_in.username)
     
     if existing_profile:
         raise HTTPException(
@@ -47,9 +57,307 @@ def create_profile(
             detail="Username already exists",
         )
     
-    new_profile = Profile(**profile_in.dict())
-    db.add(new_profile)
-    db.commit()
-    db.refresh(new_profile)
+    return await ProfileRepository.create_profile(db, profile=profile_in)
+
+@router.post(
+    "/import",
+    response_model=ProfileImportReport,
+    summary="Bulk import profiles",
+    description="Import profiles from an NDJSON request body, one profile per line.",
+)
+async def import_profiles(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_user),
+) -> ProfileImportReport:
+    """
+    Bulk import profiles from NDJSON.
+    
+    ## Request Body
+    One JSON object per line, each with the same fields as **/profiles/create**.
+    The body is read as a stream and written in batched transactions.
+    
+    ## Returns
+    Import report with processed, created and failed counters and per-line errors.
+    Invalid lines and existing usernames are skipped without aborting the import.
+    """
+    return await ProfileImportService.import_ndjson(db, request.stream())
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export all profiles",
+    description="Stream every profile with its accounts and IP addresses as NDJSON or CSV, optionally compressed.",
+)
+async def export_profiles(
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Output format"),
+    compression: Optional[Literal["gzip", "zstd"]] = Query(None, description="Stream compression"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    Export all profiles.
+    
+    Rows are read from the database in batches and written to the response
+    as they are encoded, so memory use does not depend on the number of profiles.
+    
+    ## Query Parameters
+    - **format**: `ndjson` (one profile per line, importable with **/profiles/import**) or `csv`
+    - **compression**: `gzip` or `zstd` (optional)
+    
+    ## Returns
+    The export as an attachment.
+    
+    ## Errors
+    - **400 Bad Request**: Compression not available on this server
+    """
+    try:
+        body = ProfileExportService.export(db, export_format=format, compression=compression)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    filename = ProfileExportService.filename(format, compression)
+    return StreamingResponse(
+        body,
+        media_type=ProfileExportService.media_type(format, compression),
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+@router.get(
+    "/search",
+    response_model=list[ProfileSearchResult],
+    summary="Search profiles",
+    description="Ranked substring or fuzzy search over usernames, full names and account nicknames.",
+)
+async def search_profiles(
+    q: str = Query(..., min_length=3, max_length=128, description="Search text"),
+    fuzzy: bool = Query(False, description="Match on shared trigrams to tolerate misspellings"),
+    limit: int = Query(20, ge=1, le=100, description="Page size"),
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user = Depends(get_current_user),
+) -> list[ProfileSearchResult]:
+    """
+    Search profiles.
+    
+    ## Query Parameters
+    - **q**: Search text (3-128 characters)
+    - **fuzzy**: Rank by shared trigrams instead of requiring the exact substring
+    - **limit**: Page size (1-100)
+    - **offset**: Number of results to skip
+    
+    ## Returns
+    Matching profiles, best match first.
+    
+    ## Errors
+    - **400 Bad Request**: Fewer than 3 characters once whitespace is collapsed
+    """
+    try:
+        results = await ProfileRepository.search(db, query=q, fuzzy=fuzzy, limit=limit, offset=offset)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    return [
+        ProfileSearchResult(id=profile.id, username=profile.username, full_name=profile.full_name, score=score)
+        for profile, score in results
+    ]
+
+@router.get(
+    "/{profile_id}/cluster",
+    response_model=ProfileClusterResponse,
+    summary="Get a profile's actor cluster",
+    description="List the profiles linked to this one by shared IP addresses or account nicknames.",
+    responses=MSGPACK_RESPONSES,
+)
+async def get_profile_cluster(
+    request: Request,
+    profile_id: int,
+    limit: int = Query(1000, ge=1, le=10000, description="Maximum number of members"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user = Depends(get_current_user),
+) -> Response:
+    """
+    Get the actor cluster of a profile.
+    
+    ## Path Parameters
+    - **profile_id**: Unique identifier for the profile
+    
+    ## Returns
+    The cluster ID and its member profiles.
+    
+    ## Errors
+    - **404 Not Found**: Profile not found
+    """
+    cluster = await ClusterRepository.get_cluster_members(db, profile_id=profile_id, limit=limit)
+    if cluster is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Profile with ID '{profile_id}' not found",
+        )
+    
+    cluster_id, members = cluster
+    return negotiate(request, ProfileClusterResponse(cluster_id=cluster_id, profiles=members))
+
+@router.get(
+    "/{profile_id}/ip-addresses",
+    response_model=Union[Page[IPAddressResponse], Page[IPDailyActivity]],
+    summary="List a profile's IP address history",
+    description=(
+        "List the IP addresses seen on a profile, or how often each was seen per day, "
+        "newest first, with keyset pagination."
+    ),
+    responses=MSGPACK_RESPONSES,
+)
+async def list_profile_ip_addresses(
+    request: Request,
+    profile_id: int,
+    granularity: Literal["address", "day"] = Query("address", description="One entry per address, or per day and address"),
+    ip_address: Optional[str] = Query(None, description="Only report this address"),
+    limit: int = Query(100, ge=1, le=1000, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Cursor returned with the previous page"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user = Depends(get_current_user),
+) -> Response:
+    """
+    List a profile's IP address history.
+    
+    With `granularity=day` the whole history is reported per day: days past
+    the raw retention period come from the daily roll-ups, recent days from
+    the raw sightings.
+    
+    ## Path Parameters
+    - **profile_id**: Unique identifier for the profile
+    
+    ## Query Parameters
+    - **granularity**: `address` (default) for one entry per address with its
+      first/last sighting and hit count, `day` for one entry per day and address
+    - **ip_address**: Only report this address
+    - **limit**: Page size (1-1000)
+    - **cursor**: `next_cursor` of the previous page; omit for the first page
+    
+    ## Returns
+    A page of sightings and the cursor of the next page (null on the last page).
+    
+    ## Errors
+    - **400 Bad Request**: Invalid IP address or cursor
+    """
+    try:
+        if ip_address is not None:
+            ip_address = str(ipaddress.ip_address(ip_address.strip()))
+        if granularity == "day":
+            activity, next_cursor = await IPRepository.list_daily_for_profile(
+                db, profile_id=profile_id, ip_address=ip_address, limit=limit, cursor=cursor
+            )
+            return negotiate(request, Page[IPDailyActivity](items=activity, next_cursor=next_cursor))
+        sightings, next_cursor = await IPRepository.list_for_profile(
+            db, profile_id=profile_id, ip_address=ip_address, limit=limit, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    return negotiate(request, Page[IPAddressResponse](items=sightings, next_cursor=next_cursor))
+
+@router.get(
+    "",
+    response_model=Page[ProfileDetail],
+    summary="List profiles",
+    description="List complete profile documents, newest first, with keyset pagination.",
+    responses=MSGPACK_RESPONSES,
+)
+async def list_profiles(
+    request: Request,
+    limit: int = Query(50, ge=1, le=500, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Cursor returned with the previous page"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user = Depends(get_current_user),
+) -> Response:
+    """
+    List profiles.
     
-    return new_profile
\ No newline at end of file
+    Pages are keyed on `(created_at, id)`, so fetching a deep page costs the
+    same as fetching the first one. Accounts and IP addresses for the whole
+    page are loaded with one query per relationship.
+    
+    ## Query Parameters
+    - **limit**: Page size (1-500)
+    - **cursor**: `next_cursor` of the previous page; omit for the first page
+    
+    ## Returns
+    A page of complete profile documents and the cursor of the next page (null on the last page),
+    as JSON or, with `Accept: application/msgpack`, MessagePack.
+    
+    ## Errors
+    - **400 Bad Request**: Invalid cursor
+    """
+    try:
+        profiles, next_cursor = await ProfileRepository.list_details(db, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    return negotiate(request, Page[ProfileDetail](items=profiles, next_cursor=next_cursor))
+
+@router.get(
+    "/{profile_id}",
+    response_model=ProfileDetail,
+    summary="Get a profile",
+    description="Get a complete profile document with accounts and IP addresses.",
+    responses={
+        **MSGPACK_RESPONSES,
+        status.HTTP_304_NOT_MODIFIED: {"description": "The cached copy named by If-None-Match is current"},
+    },
+)
+async def get_profile(
+    request: Request,
+    profile_id: int,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user = Depends(get_current_user),
+) -> Response:
+    """
+    Get a profile.
+    
+    The response carries an `ETag` derived from the profile version, which
+    changes whenever the profile, its accounts or its IP addresses change.
+    Send it back in `If-None-Match` to get a `304 Not Modified` without the
+    document being rebuilt.
+    
+    ## Path Parameters
+    - **profile_id**: Unique identifier for the profile
+    
+    ## Returns
+    The profile with its current, previous and fake accounts and IP addresses,
+    as JSON or, with `Accept: application/msgpack`, MessagePack.
+    
+    ## Errors
+    - **404 Not Found**: Profile not found
+    """
+    # Each representation gets its own strong ETag.
+    representation = ("msgpack",) if preferred_media_type(request) == MSGPACK_MEDIA_TYPE else ()
+    if if_none_match:
+        version = await ProfileRepository.get_version(db, profile_id=profile_id)
+        if version is not None:
+            etag = make_etag(profile_id, version, *representation)
+            if etag_matches(if_none_match, etag):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED,
+                    headers={"ETag": etag, "Cache-Control": "private, no-cache", "Vary": "Accept"},
+                )
+    
+    profile = await ProfileRepository.get_detail(db, profile_id=profile_id)
+    if profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Profile with ID '{profile_id}' not found",
+        )
+    return negotiate(request, ProfileDetail.model_validate(profile), headers={
+        "ETag": make_etag(profile.id, profile.version, *representation),
+        "Cache-Control": "private, no-cache",
+    })
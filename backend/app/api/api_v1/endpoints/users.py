@@ -1,15 +1,55 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import Any
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Optional
 
-from app.db.session import get_db
-from app.schemas.user import UserSchema, UserResponse, UserPublic
+from app.db.session import get_db, get_read_db
+from app.repository import UserRepository
+from app.schemas.pagination import Page
+from app.schemas.user import UserSchema, UserResponse, UserPublic, UserBatchCreate, UserBatchReport
 from app.services.user_service import UserService
-from app.exceptions import UserAlreadyExistsException, DatabaseOperationException, UserNotFoundException
-from app.api.dependencies import get_current_user
+from app.exceptions import UserAlreadyExistsException, DatabaseOperationException, UserNotFoundException, PasswordHashQueueFullException
+from app.api.dependencies import get_current_user, get_current_admin
+from app.api.responses import MSGPACK_RESPONSES, negotiate
 
 router = APIRouter()
 
+@router.get(
+    "",
+    response_model=Page[UserPublic],
+    summary="List users",
+    description="List users, newest first, with keyset pagination. Administrators only.",
+    responses=MSGPACK_RESPONSES,
+)
+async def list_users(
+    request: Request,
+    limit: int = Query(50, ge=1, le=500, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Cursor returned with the previous page"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user = Depends(get_current_admin),
+) -> Response:
+    """
+    List users.
+    
+    ## Query Parameters
+    - **limit**: Page size (1-500)
+    - **cursor**: `next_cursor` of the previous page; omit for the first page
+    
+    ## Returns
+    A page of users and the cursor of the next page (null on the last page).
+    
+    ## Errors
+    - **400 Bad Request**: Invalid cursor
+    - **403 Forbidden**: Current user is not an administrator
+    """
+    try:
+        users, next_cursor = await UserRepository.list_users(db, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    return negotiate(request, Page[UserPublic](items=users, next_cursor=next_cursor))
+
 @router.post(
     "/create",
     response_model=UserResponse,
@@ -17,9 +57,9 @@ router = APIRouter()
     summary="Register a new user",
     description="Create a new user with a username and password.",
 )
-def create_user(
+async def create_user(
     user_in: UserSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
     Create a new user account.
@@ -34,9 +74,10 @@ def create_user(
     ## Errors
     - **409 Conflict**: Username already exists
     - **500 Internal Server Error**: Database operation failed
+    - **503 Service Unavailable**: Password hashing queue is full
     """
     try:
-        user = UserService.create_user(db=db, user_data=user_in)
+        user = await UserService.create_user(db=db, user_data=user_in)
         return user
     except UserAlreadyExistsException as e:
         raise HTTPException(
@@ -48,13 +89,56 @@ def create_user(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=e.message
         )
+    except PasswordHashQueueFullException as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=e.message,
+            headers={"Retry-After": "1"},
+        )
+
+@router.post(
+    "/batch",
+    response_model=UserBatchReport,
+    summary="Create users in bulk",
+    description="Create many user accounts in one request, with a result per account. Administrators only.",
+)
+async def create_users(
+    batch: UserBatchCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_admin),
+) -> UserBatchReport:
+    """
+    Create many user accounts at once.
+    
+    ## Request Body
+    - **users**: List of accounts, each with the same fields as **/users/create**
+    
+    ## Returns
+    Report with created and failed counters and one result per account, in
+    request order. Existing usernames and usernames repeated within the batch
+    are rejected without affecting the other accounts; all accepted accounts
+    are created in a single transaction.
+    
+    ## Errors
+    - **403 Forbidden**: Current user is not an administrator
+    - **422 Unprocessable Entity**: Invalid account or too many accounts
+    - **503 Service Unavailable**: Password hashing queue is full
+    """
+    try:
+        return await UserService.create_users(db=db, users=batch.users)
+    except PasswordHashQueueFullException as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=e.message,
+            headers={"Retry-After": "1"},
+        )
         
 @router.put(
     "/{user_id}", response_model=UserPublic)
-def update_user(
+async def update_user(
     user_id: int,
     user_data: UserSchema,
-    session: Session = Depends(get_db),
+    session: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_user),
 ) -> Any:
     """
@@ -73,6 +157,7 @@ def update_user(
     ## Errors
     - **404 Not Found**: User not found
     - **500 Internal Server Error**: Database operation failed
+    - **503 Service Unavailable**: Password hashing queue is full
     """
     if current_user.id != user_id:
         raise HTTPException(
@@ -81,7 +166,7 @@ def update_user(
         )
     
     try:
-        user = UserService.update_user(db=session, user_id=user_id, user_data=user_data)
+        user = await UserService.update_user(db=session, user_id=user_id, user_data=user_data)
         return user
     except UserNotFoundException as e:
         raise HTTPException(
@@ -92,4 +177,10 @@ def update_user(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=e.message
+        )
+    except PasswordHashQueueFullException as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=e.message,
+            headers={"Retry-After": "1"},
         )
\ No newline at end of file
@@ -4,9 +4,11 @@ from app.api.api_v1.endpoints import (
     users,
     auth,
     profiles,
+    ip_addresses,
 )
 
 api_router = APIRouter()
 api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
-api_router.include_router(profiles.router, prefix="/profiles", tags=["profiles"])
\ No newline at end of file
+api_router.include_router(profiles.router, prefix="/profiles", tags=["profiles"])
+api_router.include_router(ip_addresses.router, prefix="/ip-addresses", tags=["ip-addresses"])
\ No newline at end of file
@@ -3,19 +3,26 @@ from fastapi.security import OAuth2PasswordBearer
 from jwt import decode
 from jwt.exceptions import PyJWTError
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Annotated
 
-from app.db.session import get_db
+from app.db.session import get_read_db
 from app.models import User
 from app.repository import UserRepository
+from app.schemas.user import UserPublic
+from app.services.auth.token_cache import token_cache
 from app.core.config import settings
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token")
 
-def get_current_user(
-    session: Session = Depends(get_db),
-    token: str = Depends(oauth2_scheme)):
+async def get_current_user(
+    session: AsyncSession = Depends(get_read_db),
+    token: str = Depends(oauth2_scheme)) -> UserPublic:
+    cached = token_cache.get(token)
+    if cached is not None:
+        _, current_user = cached
+        return current_user
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -23,8 +30,7 @@ def get_current_user(
     )
     try:
         payload = decode(token, settings.TOKEN_SECRET_KEY, algorithms=[settings.TOKEN_ALGORITHM])
-        print(payload)
-        
+
         username: str = payload.get("sub")
         if not username:
             raise credentials_exception
@@ -32,8 +38,18 @@ def get_current_user(
     except PyJWTError:
         raise credentials_exception
 
-    user = UserRepository.get_by_username(session, username=username)
+    user = await UserRepository.get_by_username(session, username=username)
     if user is None:
         raise credentials_exception
-    
-    return user
\ No newline at end of file
+
+    current_user = UserPublic.model_validate(user)
+    token_cache.set(token, payload, current_user)
+    return current_user
+
+async def get_current_admin(current_user: UserPublic = Depends(get_current_user)) -> UserPublic:
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Administrator privileges required",
+        )
+    return current_user
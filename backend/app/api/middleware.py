@@ -0,0 +1,154 @@
+import logging
+import re
+import time
+import uuid
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.logging_config import request_id_var
+from app.core.metrics import (
+    RequestDatabaseStats,
+    http_request_db_queries,
+    http_request_db_seconds,
+    http_request_duration_seconds,
+    http_requests_in_progress,
+    http_requests_repeated_queries_total,
+    http_requests_total,
+    request_database_stats,
+)
+
+logger = logging.getLogger(__name__)
+access_logger = logging.getLogger("app.access")
+
+UNMATCHED_ROUTE = "unmatched"
+REQUEST_ID_HEADER = b"x-request-id"
+REQUEST_ID_PATTERN = re.compile(r"[A-Za-z0-9._-]{1,128}")
+
+def route_template(scope: Scope) -> str:
+    """
+    Full path template of the route that served a request.
+
+    Routes of included routers keep their router-relative template (e.g.
+    ``/{profile_id}``), so the prefix is taken from the request path: the
+    template's trailing segments replace as many segments of the path.
+
+    Args:
+        scope: ASGI scope, after routing
+
+    Returns:
+        Template such as ``/api/v1/profiles/{profile_id}``, or ``unmatched``
+    """
+    template = getattr(scope.get("route"), "path", None)
+    if template is None:
+        return UNMATCHED_ROUTE
+    segments = template.rstrip("/").count("/")
+    prefix = scope["path"].rstrip("/")
+    if segments:
+        prefix = prefix.rsplit("/", segments)[0]
+    return prefix + template
+
+class RequestContextMiddleware:
+    """
+    Tag every request with an ID and log it once it is served, with its timing.
+
+    The ID is taken from the ``X-Request-ID`` header when it is well formed
+    (so IDs set by a proxy carry through) and generated otherwise. It is
+    echoed in the response and attached to every log record written while
+    the request is served.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = next((value.decode("latin-1") for name, value in scope["headers"] if name == REQUEST_ID_HEADER), "")
+        if not REQUEST_ID_PATTERN.fullmatch(request_id):
+            request_id = uuid.uuid4().hex
+        status_code = 500
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [*message.get("headers", []), (REQUEST_ID_HEADER, request_id.encode())]
+            await send(message)
+
+        token = request_id_var.set(request_id)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            duration_ms = round((time.perf_counter() - started) * 1000, 2)
+            access_logger.info(
+                f"{scope['method']} {scope['path']} {status_code} {duration_ms}ms",
+                extra={
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status_code,
+                    "duration_ms": duration_ms,
+                },
+            )
+            request_id_var.reset(token)
+
+class MetricsMiddleware:
+    """
+    Record latency, status codes, in-flight requests and database work per route.
+
+    Written as a plain ASGI middleware rather than ``BaseHTTPMiddleware`` so
+    it adds no extra task or body buffering. Requests are labelled with the
+    route template (``/api/v1/profiles/{profile_id}``), never the raw path,
+    so label cardinality stays bounded; requests that match no route share
+    the ``unmatched`` label. Requests that run one statement
+    ``N_PLUS_ONE_THRESHOLD`` times or more are logged as N+1 candidates.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = RequestDatabaseStats()
+        token = request_database_stats.set(stats)
+        in_progress = http_requests_in_progress.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            in_progress.dec()
+            request_database_stats.reset(token)
+
+            route = route_template(scope)
+            http_requests_total.labels(method, route, str(status_code)).inc()
+            http_request_duration_seconds.labels(method, route).observe(elapsed)
+            http_request_db_queries.labels(method, route).observe(stats.queries)
+            http_request_db_seconds.labels(method, route).observe(stats.seconds)
+            if settings.N_PLUS_ONE_THRESHOLD > 0:
+                self._report_repeated(method, route, stats)
+
+    @staticmethod
+    def _report_repeated(method: str, route: str, stats: RequestDatabaseStats) -> None:
+        repeated = stats.repeated(settings.N_PLUS_ONE_THRESHOLD)
+        if not repeated:
+            return
+        http_requests_repeated_queries_total.labels(method, route).inc()
+        for statement, count in repeated:
+            logger.warning(f"Possible N+1 in {method} {route}: statement ran {count} times: {statement}")
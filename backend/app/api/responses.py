@@ -0,0 +1,100 @@
+from typing import Any, Mapping, Optional
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack")
+
+# Advertised in the OpenAPI schema of endpoints that can answer in MessagePack.
+MSGPACK_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {"content": {MSGPACK_MEDIA_TYPE: {}}},
+}
+
+class MsgPackResponse(Response):
+    """
+    MessagePack response. Content must already be made of plain types
+    (e.g. ``model_dump(mode="json")``).
+    """
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, use_bin_type=True)
+
+def _accept_quality(accept: str) -> dict[str, float]:
+    qualities: dict[str, float] = {}
+    for part in accept.split(","):
+        media_type, *params = [item.strip() for item in part.split(";")]
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_type:
+            qualities[media_type.lower()] = max(quality, qualities.get(media_type.lower(), 0.0))
+    return qualities
+
+def preferred_media_type(request: Request) -> str:
+    """
+    Pick the response format from the request's ``Accept`` header.
+
+    MessagePack is chosen only when the client names it explicitly and does
+    not rank ``application/json`` higher; wildcards keep the JSON default.
+    It is never chosen if the ``msgpack`` package is not installed.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        ``application/msgpack`` or ``application/json``
+    """
+    accept = request.headers.get("accept")
+    if msgpack is None or not accept:
+        return JSON_MEDIA_TYPE
+
+    qualities = _accept_quality(accept)
+    msgpack_quality = max(qualities.get(media_type, 0.0) for media_type in MSGPACK_MEDIA_TYPES)
+    if msgpack_quality > 0 and msgpack_quality >= qualities.get(JSON_MEDIA_TYPE, 0.0):
+        return MSGPACK_MEDIA_TYPE
+    return JSON_MEDIA_TYPE
+
+def negotiate(
+    request: Request,
+    content: BaseModel,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """
+    Serialize a response model in the format the client asked for.
+
+    The model is serialized straight to bytes by pydantic-core (JSON) or to
+    plain types for MessagePack, skipping FastAPI's response model
+    revalidation and ``jsonable_encoder``.
+
+    Args:
+        request: Incoming request
+        content: Response model instance
+        status_code: HTTP status code
+        headers: Extra response headers
+
+    Returns:
+        JSON or MessagePack response, with ``Vary: Accept``
+    """
+    response_headers = {"Vary": "Accept", **(headers or {})}
+    if preferred_media_type(request) == MSGPACK_MEDIA_TYPE:
+        return MsgPackResponse(content.model_dump(mode="json"), status_code=status_code, headers=response_headers)
+    return Response(
+        content.model_dump_json(),
+        status_code=status_code,
+        headers=response_headers,
+        media_type=JSON_MEDIA_TYPE,
+    )
@@ -0,0 +1,86 @@
+"""
+Streaming export of every profile with its accounts and IP addresses.
+
+Usage:
+    python -m app.cli.export_profiles profiles.ndjson.gz [--format ndjson|csv] [--compression gzip|zstd]
+
+Use ``-`` to write to standard output. Format and compression default to
+the ones implied by the file extension (``.csv``, ``.gz``, ``.zst``).
+"""
+import argparse
+import asyncio
+import sys
+from typing import BinaryIO, Optional
+
+from app.db.database import ReadSessionLocal, read_engine
+from app.services.profile_export_service import ProfileExportService
+
+EXTENSION_COMPRESSIONS = {".gz": "gzip", ".zst": "zstd"}
+
+def infer_options(path: str) -> tuple[str, Optional[str]]:
+    """
+    Infer the export format and compression from a file name.
+
+    Args:
+        path: Output path
+
+    Returns:
+        Tuple of (format, compression or None)
+    """
+    compression = None
+    for extension, name in EXTENSION_COMPRESSIONS.items():
+        if path.endswith(extension):
+            compression = name
+            path = path[:-len(extension)]
+    return ("csv" if path.endswith(".csv") else "ndjson"), compression
+
+async def run(path: str, export_format: str, compression: Optional[str], batch_size: Optional[int] = None) -> int:
+    """
+    Export the configured database to a file.
+
+    Args:
+        path: Output path, or ``-`` for standard output
+        export_format: ``ndjson`` or ``csv``
+        compression: ``gzip``, ``zstd`` or None
+        batch_size: Number of profiles per batch
+
+    Returns:
+        Number of bytes written
+    """
+    stream: BinaryIO = sys.stdout.buffer if path == "-" else open(path, "wb")
+    written = 0
+    try:
+        async with ReadSessionLocal() as db:
+            body = ProfileExportService.export(db, export_format, compression, batch_size=batch_size)
+            async for chunk in body:
+                await asyncio.to_thread(stream.write, chunk)
+                written += len(chunk)
+        await asyncio.to_thread(stream.flush)
+    finally:
+        if stream is not sys.stdout.buffer:
+            stream.close()
+        await read_engine.dispose()
+    return written
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Export all profiles as NDJSON or CSV.")
+    parser.add_argument("path", help="Output file, or - for stdout")
+    parser.add_argument("--format", choices=("ndjson", "csv"), default=None, help="Output format")
+    parser.add_argument("--compression", choices=("gzip", "zstd", "none"), default=None, help="Stream compression")
+    parser.add_argument("--batch-size", type=int, default=None, help="Profiles per batch")
+    args = parser.parse_args(argv)
+
+    export_format, compression = infer_options(args.path)
+    export_format = args.format or export_format
+    if args.compression is not None:
+        compression = None if args.compression == "none" else args.compression
+
+    try:
+        written = asyncio.run(run(args.path, export_format, compression, batch_size=args.batch_size))
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"{written} bytes written", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+Bulk import of profiles from an NDJSON dump.
+
+Usage:
+    python -m app.cli.import_profiles profiles.ndjson [--batch-size 1000]
+
+Use ``-`` to read from standard input.
+"""
+import argparse
+import asyncio
+import sys
+from typing import AsyncIterator, BinaryIO
+
+from app.db.database import SessionLocal, engine
+from app.db.init_db import init_db
+from app.schemas.profile_schema import ProfileImportReport
+from app.services.profile_import_service import ProfileImportService
+
+CHUNK_SIZE = 1 << 16
+
+async def read_chunks(stream: BinaryIO) -> AsyncIterator[bytes]:
+    """
+    Read a binary stream in fixed-size chunks without blocking the event loop.
+    
+    Args:
+        stream: Binary file object
+        
+    Yields:
+        Chunks of at most CHUNK_SIZE bytes
+    """
+    while chunk := await asyncio.to_thread(stream.read, CHUNK_SIZE):
+        yield chunk
+
+async def run(path: str, batch_size: int | None = None) -> ProfileImportReport:
+    """
+    Import the given NDJSON file into the configured database.
+    
+    Args:
+        path: Path to the NDJSON file, or ``-`` for standard input
+        batch_size: Number of profiles per transaction
+        
+    Returns:
+        Import report
+    """
+    await init_db()
+    stream = sys.stdin.buffer if path == "-" else open(path, "rb")
+    try:
+        async with SessionLocal() as db:
+            return await ProfileImportService.import_ndjson(db, read_chunks(stream), batch_size=batch_size)
+    finally:
+        if stream is not sys.stdin.buffer:
+            stream.close()
+        await engine.dispose()
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Import profiles from an NDJSON file.")
+    parser.add_argument("path", help="NDJSON file to import, or - for stdin")
+    parser.add_argument("--batch-size", type=int, default=None, help="Profiles per transaction")
+    args = parser.parse_args(argv)
+    
+    report = asyncio.run(run(args.path, batch_size=args.batch_size))
+    print(report.model_dump_json(indent=2))
+    return 1 if report.failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
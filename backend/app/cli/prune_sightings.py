@@ -0,0 +1,34 @@
+"""
+Roll up raw IP sightings past the retention period and reclaim their space.
+
+Usage:
+    python -m app.cli.prune_sightings
+
+Does once what the application does every RETENTION_INTERVAL_SECONDS; use
+it from cron when the in-process job is disabled (RETENTION_INTERVAL_SECONDS=0).
+"""
+import asyncio
+import sys
+
+from app.db.database import SessionLocal, engine
+from app.services.retention_service import SightingRetentionService
+
+async def run() -> int:
+    """
+    Run the retention job on the configured database.
+    
+    Returns:
+        Number of raw sightings rolled up
+    """
+    try:
+        return await SightingRetentionService.run(SessionLocal)
+    finally:
+        await engine.dispose()
+
+def main() -> int:
+    moved = asyncio.run(run())
+    print(f"{moved} sightings rolled up")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
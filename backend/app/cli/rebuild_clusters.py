@@ -0,0 +1,35 @@
+"""
+Recompute every actor cluster from scratch.
+
+Usage:
+    python -m app.cli.rebuild_clusters
+
+Run once after upgrading an existing database; new sightings and accounts
+are clustered incrementally afterwards.
+"""
+import asyncio
+import sys
+
+from app.db.database import SessionLocal, engine
+from app.repository import ClusterRepository
+
+async def run() -> int:
+    """
+    Rebuild the clusters of the configured database.
+    
+    Returns:
+        Number of clusters
+    """
+    try:
+        async with SessionLocal() as db:
+            return await ClusterRepository.rebuild(db)
+    finally:
+        await engine.dispose()
+
+def main() -> int:
+    clusters = asyncio.run(run())
+    print(f"{clusters} clusters")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+"""
+Production server: pre-forked uvicorn workers sharing one listening socket.
+
+Usage:
+    python -m app.cli.serve [--host HOST] [--port PORT] [--workers N]
+
+The master process imports the application, checks the database schema and
+builds the IP index once, then forks the workers, which inherit all of it
+copy-on-write instead of each importing and loading it again. Workers that
+exit are replaced; each one exits on its own after serving
+WEB_WORKER_MAX_REQUESTS requests (plus up to WEB_WORKER_MAX_REQUESTS_JITTER,
+so they do not all recycle together), which caps memory growth.
+
+SIGTERM or SIGINT drains the server: workers stop accepting connections and
+finish in-flight requests for up to WEB_GRACEFUL_TIMEOUT_SECONDS before the
+master exits. Requires a platform with ``fork()`` (Linux, macOS).
+
+All processes append to the same log file, which is not rotated by the
+server; rotate it externally (e.g. logrotate), the file is reopened when it
+is moved.
+"""
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import random
+import signal
+import socket
+import time
+from typing import Optional
+
+import uvicorn
+
+from app.core.config import settings
+from app.core.logging_config import stop_listener, use_watched_log_file
+
+logger = logging.getLogger(__name__)
+
+# Workers that die faster than this are failing at boot; respawn them slowly
+MIN_WORKER_LIFETIME_SECONDS = 1.0
+REAP_INTERVAL_SECONDS = 0.2
+
+async def preload() -> None:
+    """
+    Do the one-off startup work in the master, before forking.
+
+    Database connections are closed afterwards: neither sockets nor the
+    aiosqlite threads that own them survive ``fork()``.
+    """
+    from app.db.database import ReadSessionLocal, engine, read_engine
+    from app.db.init_db import init_db
+    from app.services.ip_index_service import ip_index
+
+    await init_db()
+    if settings.IP_INDEX_ENABLED:
+        async with ReadSessionLocal() as db:
+            await ip_index.rebuild(db)
+    await engine.dispose()
+    await read_engine.dispose()
+
+class WorkerSupervisor:
+    """
+    Fork, watch and replace uvicorn workers serving the same sockets.
+    """
+
+    def __init__(
+        self,
+        app,
+        sockets: list[socket.socket],
+        workers: int,
+        max_requests: int = 0,
+        max_requests_jitter: int = 0,
+        graceful_timeout: float = 30,
+        keepalive_timeout: int = 5,
+    ):
+        self.app = app
+        self.sockets = sockets
+        self.workers = workers
+        self.max_requests = max_requests
+        self.max_requests_jitter = max_requests_jitter
+        self.graceful_timeout = graceful_timeout
+        self.keepalive_timeout = keepalive_timeout
+        self.running = False
+        # pid -> start time
+        self._children: dict[int, float] = {}
+
+    def run(self) -> int:
+        """
+        Serve until SIGTERM or SIGINT, then drain the workers.
+
+        Returns:
+            Process exit code
+        """
+        self.running = True
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, self._handle_stop)
+
+        logger.info(f"Master {os.getpid()} starting {self.workers} workers")
+        for _ in range(self.workers):
+            self.spawn()
+
+        while self.running:
+            self._reap(respawn=True)
+            time.sleep(REAP_INTERVAL_SECONDS)
+
+        self.drain()
+        return 0
+
+    def spawn(self) -> int:
+        """
+        Fork one worker.
+
+        Returns:
+            PID of the new worker
+        """
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                self._serve()
+                exit_code = 0
+            except BaseException:
+                logger.exception("Worker crashed")
+            finally:
+                stop_listener()
+                os._exit(exit_code)
+
+        self._children[pid] = time.monotonic()
+        return pid
+
+    def drain(self) -> None:
+        """
+        Ask every worker to finish its in-flight requests and exit, killing
+        those that are still running after the graceful timeout.
+        """
+        logger.info(f"Draining {len(self._children)} workers")
+        self._signal_children(signal.SIGTERM)
+        # Workers stop after the graceful timeout themselves; allow for their shutdown
+        deadline = time.monotonic() + self.graceful_timeout + 5
+        while self._children and time.monotonic() < deadline:
+            self._reap(respawn=False)
+            time.sleep(REAP_INTERVAL_SECONDS / 2)
+
+        if self._children:
+            logger.warning(f"Killing {len(self._children)} workers that did not drain in time")
+            self._signal_children(signal.SIGKILL)
+            while self._children:
+                self._reap(respawn=False)
+                time.sleep(REAP_INTERVAL_SECONDS / 2)
+        logger.info("All workers stopped")
+
+    def _serve(self) -> None:
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, signal.SIG_DFL)
+        gc.enable()
+
+        limit = None
+        if self.max_requests > 0:
+            limit = self.max_requests + random.randint(0, max(self.max_requests_jitter, 0))
+        config = uvicorn.Config(
+            self.app,
+            limit_max_requests=limit,
+            timeout_graceful_shutdown=self.graceful_timeout,
+            timeout_keep_alive=self.keepalive_timeout,
+            log_config=None,
+            access_log=False,
+        )
+        uvicorn.Server(config).run(sockets=self.sockets)
+
+    def _reap(self, respawn: bool) -> None:
+        while self._children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self._children.clear()
+                return
+            if pid == 0:
+                return
+
+            started = self._children.pop(pid, None)
+            if started is None:
+                continue
+            exit_code = os.waitstatus_to_exitcode(status)
+            lifetime = time.monotonic() - started
+            if not (respawn and self.running):
+                continue
+            if exit_code == 0:
+                logger.info(f"Worker {pid} exited after {lifetime:.0f}s; starting a replacement")
+            else:
+                logger.error(f"Worker {pid} exited with code {exit_code}; starting a replacement")
+                if lifetime < MIN_WORKER_LIFETIME_SECONDS:
+                    time.sleep(MIN_WORKER_LIFETIME_SECONDS)
+            self.spawn()
+
+    def _signal_children(self, signum: int) -> None:
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
+
+    def _handle_stop(self, signum, frame) -> None:
+        self.running = False
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the S.I.E.N.A API with pre-forked workers.")
+    parser.add_argument("--host", default=settings.WEB_HOST, help="Bind address")
+    parser.add_argument("--port", type=int, default=settings.WEB_PORT, help="Bind port")
+    parser.add_argument("--workers", type=int, default=settings.WEB_WORKERS, help="Number of worker processes")
+    args = parser.parse_args(argv)
+    workers = max(args.workers, 1)
+    use_watched_log_file()
+
+    # Every worker gets its own password hashing pool; share the cores out
+    # unless the pool size was set explicitly.
+    if "PASSWORD_HASH_WORKERS" not in os.environ:
+        settings.PASSWORD_HASH_WORKERS = max((os.cpu_count() or 1) // workers, 1)
+
+    from main import app
+
+    asyncio.run(preload())
+
+    sock = uvicorn.Config(
+        app, host=args.host, port=args.port, backlog=settings.WEB_BACKLOG, log_config=None
+    ).bind_socket()
+    logger.info(f"Listening on http://{args.host}:{args.port}")
+
+    # Keep the preloaded objects out of the collector's reach so that
+    # collections in the workers do not write to (and copy) shared pages.
+    gc.disable()
+    gc.freeze()
+
+    supervisor = WorkerSupervisor(
+        app,
+        sockets=[sock],
+        workers=workers,
+        max_requests=settings.WEB_WORKER_MAX_REQUESTS,
+        max_requests_jitter=settings.WEB_WORKER_MAX_REQUESTS_JITTER,
+        graceful_timeout=settings.WEB_GRACEFUL_TIMEOUT_SECONDS,
+        keepalive_timeout=settings.WEB_KEEPALIVE_SECONDS,
+    )
+    try:
+        return supervisor.run()
+    finally:
+        sock.close()
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,10 +6,70 @@ load_dotenv()
 
 class Settings(BaseSettings):
     SQLITE_DATABASE_URL: str = os.getenv("SQLITE_DATABASE_URL", "")
+    DATABASE_URL: str = os.getenv("DATABASE_URL", SQLITE_DATABASE_URL)
+    SQLITE_JOURNAL_MODE: str = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    SQLITE_CACHE_SIZE: int = int(os.getenv("SQLITE_CACHE_SIZE", "-64000"))
+    SQLITE_MMAP_SIZE: int = int(os.getenv("SQLITE_MMAP_SIZE", "268435456"))
+    SQLITE_READ_POOL_SIZE: int = int(os.getenv("SQLITE_READ_POOL_SIZE", "8"))
+
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT_SECONDS: float = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+    DB_POOL_RECYCLE_SECONDS: int = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
 
     TOKEN_SECRET_KEY: str = os.getenv("TOKEN_SECRET_KEY", "")
     TOKEN_ALGORITHM: str = os.getenv("TOKEN_ALGORITHM", "")
     TOKEN_EXPIRE_MINUTES: str = os.getenv("TOKEN_EXPIRE_MINUTES", "")
+    TOKEN_CACHE_TTL_SECONDS: int = int(os.getenv("TOKEN_CACHE_TTL_SECONDS", "60"))
+    TOKEN_CACHE_MAX_SIZE: int = int(os.getenv("TOKEN_CACHE_MAX_SIZE", "10000"))
+
+    LOGIN_LIMIT_USERNAME_BURST: int = int(os.getenv("LOGIN_LIMIT_USERNAME_BURST", "5"))
+    LOGIN_LIMIT_USERNAME_PER_MINUTE: float = float(os.getenv("LOGIN_LIMIT_USERNAME_PER_MINUTE", "5"))
+    LOGIN_LIMIT_IP_BURST: int = int(os.getenv("LOGIN_LIMIT_IP_BURST", "20"))
+    LOGIN_LIMIT_IP_PER_MINUTE: float = float(os.getenv("LOGIN_LIMIT_IP_PER_MINUTE", "20"))
+    LOGIN_LIMIT_MAX_KEYS: int = int(os.getenv("LOGIN_LIMIT_MAX_KEYS", "100000"))
+
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 1))
+    PASSWORD_HASH_QUEUE_SIZE: int = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", "64"))
+
+    USER_BATCH_MAX_SIZE: int = int(os.getenv("USER_BATCH_MAX_SIZE", "1000"))
+
+    PROFILE_IMPORT_BATCH_SIZE: int = int(os.getenv("PROFILE_IMPORT_BATCH_SIZE", "1000"))
+    PROFILE_IMPORT_MAX_ERRORS: int = int(os.getenv("PROFILE_IMPORT_MAX_ERRORS", "1000"))
+    PROFILE_IMPORT_MAX_LINE_BYTES: int = int(os.getenv("PROFILE_IMPORT_MAX_LINE_BYTES", "1048576"))
+
+    IP_INDEX_ENABLED: bool = os.getenv("IP_INDEX_ENABLED", "true").lower() == "true"
+    IP_INDEX_REFRESH_SECONDS: int = int(os.getenv("IP_INDEX_REFRESH_SECONDS", "30"))
+    IP_INDEX_SYNC_OVERLAP_SECONDS: int = int(os.getenv("IP_INDEX_SYNC_OVERLAP_SECONDS", "300"))
+    IP_SIGHTING_BATCH_MAX_SIZE: int = int(os.getenv("IP_SIGHTING_BATCH_MAX_SIZE", "10000"))
+    IP_SIGHTING_RAW_RETENTION_DAYS: int = int(os.getenv("IP_SIGHTING_RAW_RETENTION_DAYS", "30"))
+
+    RETENTION_INTERVAL_SECONDS: int = int(os.getenv("RETENTION_INTERVAL_SECONDS", "3600"))
+    RETENTION_BATCH_SIZE: int = int(os.getenv("RETENTION_BATCH_SIZE", "5000"))
+    SQLITE_INCREMENTAL_VACUUM_PAGES: int = int(os.getenv("SQLITE_INCREMENTAL_VACUUM_PAGES", "4096"))
+
+    PROFILE_EXPORT_BATCH_SIZE: int = int(os.getenv("PROFILE_EXPORT_BATCH_SIZE", "1000"))
+    PROFILE_EXPORT_ZSTD_LEVEL: int = int(os.getenv("PROFILE_EXPORT_ZSTD_LEVEL", "3"))
+
+    WEB_HOST: str = os.getenv("WEB_HOST", "0.0.0.0")
+    WEB_PORT: int = int(os.getenv("WEB_PORT", "8000"))
+    WEB_WORKERS: int = int(os.getenv("WEB_WORKERS", os.cpu_count() or 1))
+    WEB_BACKLOG: int = int(os.getenv("WEB_BACKLOG", "2048"))
+    WEB_KEEPALIVE_SECONDS: int = int(os.getenv("WEB_KEEPALIVE_SECONDS", "5"))
+    WEB_WORKER_MAX_REQUESTS: int = int(os.getenv("WEB_WORKER_MAX_REQUESTS", "10000"))
+    WEB_WORKER_MAX_REQUESTS_JITTER: int = int(os.getenv("WEB_WORKER_MAX_REQUESTS_JITTER", "1000"))
+    WEB_GRACEFUL_TIMEOUT_SECONDS: int = int(os.getenv("WEB_GRACEFUL_TIMEOUT_SECONDS", "30"))
+
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "json")
+    LOG_QUEUE_SIZE: int = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    SLOW_QUERY_THRESHOLD_MS: float = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+    N_PLUS_ONE_THRESHOLD: int = int(os.getenv("N_PLUS_ONE_THRESHOLD", "10"))
 
     class Config:
         env_file = ".env"
@@ -1,19 +1,156 @@
+import atexit
+import copy
+import json
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, WatchedFileHandler
+from typing import Optional
+
+from app.core.config import settings
+from app.core.metrics import log_records_dropped_total
 
 LOG_DIR = os.path.join(os.path.dirname(__file__), '..', 'logs')
 os.makedirs(LOG_DIR, exist_ok=True)
 
 LOG_FILE = os.path.join(LOG_DIR, 'app.log')
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
-    handlers=[
+TEXT_FORMAT = "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
+
+# Set by the request context middleware for the duration of each HTTP request
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# Attributes every LogRecord has; anything else was passed through ``extra``
+_RECORD_ATTRIBUTES = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime", "request_id"}
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format records as one JSON object per line.
+
+    Every record carries its timestamp (UTC), level, logger, message and,
+    when logged while serving a request, the request ID. Fields passed with
+    ``extra`` (e.g. ``duration_ms``) are included as they are.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            entry["request_id"] = request_id
+        entry.update(
+            (key, value) for key, value in record.__dict__.items() if key not in _RECORD_ATTRIBUTES
+        )
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = record.stack_info
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Hand records to the listener thread without ever blocking the caller.
+
+    Only work that must happen on the calling thread is done here: merging
+    the message arguments, rendering the traceback and reading the request
+    ID. When the bounded queue is full the record is dropped and counted
+    instead of waiting for the disk.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        record.request_id = request_id_var.get()
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            log_records_dropped_total.labels(record.levelname).inc()
+
+def _build_handlers() -> list[logging.Handler]:
+    formatter = JsonFormatter() if settings.LOG_FORMAT == "json" else logging.Formatter(TEXT_FORMAT)
+    handlers = [
         RotatingFileHandler(LOG_FILE, maxBytes=5_000_000, backupCount=5),
-        logging.StreamHandler()
+        logging.StreamHandler(),
     ]
-)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    return handlers
+
+# Records are written to the file and the console by a background thread;
+# request handlers only enqueue them.
+log_queue: queue.Queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+queue_handler = NonBlockingQueueHandler(log_queue)
+listener = QueueListener(log_queue, *_build_handlers(), respect_handler_level=True)
+
+logging.basicConfig(level=settings.LOG_LEVEL.upper(), handlers=[queue_handler], force=True)
+listener.start()
+
+def stop_listener() -> None:
+    """
+    Write out every queued record and stop the listener thread.
+    """
+    listener.stop()
+
+def use_watched_log_file() -> None:
+    """
+    Stop rotating the log file in-process, for servers with several processes.
+
+    A ``RotatingFileHandler`` per forked worker means every worker renames
+    the file under the others, which keep writing to the rotated copy. The
+    file is instead written through a ``WatchedFileHandler``, which reopens
+    it whenever it is moved, so rotation is left to an external tool such as
+    logrotate (without ``copytruncate``). Call before forking.
+    """
+    global listener
+    listener.stop()
+    handlers = []
+    for handler in listener.handlers:
+        if isinstance(handler, RotatingFileHandler):
+            watched = WatchedFileHandler(handler.baseFilename)
+            watched.setFormatter(handler.formatter)
+            handler.close()
+            handler = watched
+        handlers.append(handler)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+
+def _restart_listener_in_child() -> None:
+    """
+    Give a forked worker its own queue and listener thread.
+
+    Threads do not survive ``fork()``, so the inherited listener would never
+    drain the queue; the inherited queue may also hold records (and a lock
+    state) from the parent.
+    """
+    global log_queue, listener
+    log_queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+    queue_handler.queue = log_queue
+    listener = QueueListener(log_queue, *listener.handlers, respect_handler_level=True)
+    listener.start()
+
+atexit.register(stop_listener)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listener_in_child)
 
 logger = logging.getLogger("backend")
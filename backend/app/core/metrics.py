@@ -0,0 +1,302 @@
+import threading
+from bisect import bisect_left
+from collections import Counter as StatementCounter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Sequence
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if value == int(value):
+        return f"{int(value)}.0"
+    return repr(value)
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+class _Metric:
+    """
+    Base class of a metric family: one child per combination of label values.
+    """
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), registry: Optional["MetricsRegistry"] = None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        (registry if registry is not None else REGISTRY).register(self)
+
+    def labels(self, *values: str):
+        """
+        Get the child for a combination of label values, creating it on first use.
+
+        Args:
+            values: One value per label name, in declaration order
+
+        Returns:
+            Child metric to update
+        """
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def clear(self) -> None:
+        with self._lock:
+            self._children.clear()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _samples(self) -> list[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+class _Value:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+class Counter(_Metric):
+    """
+    Monotonically increasing count, e.g. requests served.
+    """
+    type = "counter"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def _samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"
+            for values, child in list(self._children.items())
+        ]
+
+class Gauge(Counter):
+    """
+    Value that goes up and down, e.g. requests in flight.
+    """
+    type = "gauge"
+
+class _HistogramValue:
+    __slots__ = ("upper_bounds", "counts", "sum", "_lock")
+
+    def __init__(self, upper_bounds: tuple[float, ...]):
+        self.upper_bounds = upper_bounds
+        self.counts = [0] * (len(upper_bounds) + 1)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        # Only the matching bucket is touched; cumulative counts are built at scrape time
+        index = bisect_left(self.upper_bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+class Histogram(_Metric):
+    """
+    Distribution of observations over fixed buckets, e.g. request latency.
+    """
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+        registry: Optional["MetricsRegistry"] = None,
+    ):
+        self.upper_bounds = tuple(sorted(float(bucket) for bucket in buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_child(self) -> _HistogramValue:
+        return _HistogramValue(self.upper_bounds)
+
+    def _samples(self) -> list[str]:
+        lines = []
+        labelnames = self.labelnames + ("le",)
+        for values, child in list(self._children.items()):
+            with child._lock:
+                counts = list(child.counts)
+                total = child.sum
+            cumulative = 0
+            for upper_bound, count in zip(self.upper_bounds + (float("inf"),), counts):
+                cumulative += count
+                bucket_labels = _format_labels(labelnames, values + (_format_value(upper_bound),))
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+class MetricsRegistry:
+    """
+    Set of metric families rendered together in the Prometheus text format.
+
+    Collectors are callbacks run before every render, for values that are
+    cheaper to read on scrape than to track on every change (pool sizes).
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: dict[str, Callable[[], None]] = {}
+
+    def register(self, metric: _Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric '{metric.name}' is already registered")
+        self._metrics[metric.name] = metric
+
+    def add_collector(self, name: str, collector: Callable[[], None]) -> None:
+        """
+        Register (or replace) a callback run before each render.
+
+        Args:
+            name: Collector key; registering the same key again replaces it
+            collector: Callback updating gauges
+        """
+        self._collectors[name] = collector
+
+    def render(self) -> str:
+        """
+        Render every metric family.
+
+        Returns:
+            Exposition text, terminated by a newline
+        """
+        for collector in list(self._collectors.values()):
+            collector()
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+REGISTRY = MetricsRegistry()
+
+http_requests_total = Counter(
+    "siena_http_requests_total",
+    "HTTP requests served, by route template and status code.",
+    ("method", "route", "status"),
+)
+http_request_duration_seconds = Histogram(
+    "siena_http_request_duration_seconds",
+    "HTTP request latency in seconds, until the response body is sent.",
+    ("method", "route"),
+)
+http_requests_in_progress = Gauge(
+    "siena_http_requests_in_progress",
+    "HTTP requests currently being served.",
+    ("method",),
+)
+http_request_db_queries = Histogram(
+    "siena_http_request_db_queries",
+    "Database queries executed while serving one HTTP request.",
+    ("method", "route"),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+http_request_db_seconds = Histogram(
+    "siena_http_request_db_seconds",
+    "Time spent in database queries while serving one HTTP request.",
+    ("method", "route"),
+)
+http_requests_repeated_queries_total = Counter(
+    "siena_http_requests_repeated_queries_total",
+    "HTTP requests that ran one statement at least N_PLUS_ONE_THRESHOLD times (N+1 candidates).",
+    ("method", "route"),
+)
+db_queries_total = Counter(
+    "siena_db_queries_total",
+    "Database queries executed, by engine.",
+    ("engine",),
+)
+db_slow_queries_total = Counter(
+    "siena_db_slow_queries_total",
+    "Database queries slower than SLOW_QUERY_THRESHOLD_MS, by engine.",
+    ("engine",),
+)
+db_query_duration_seconds = Histogram(
+    "siena_db_query_duration_seconds",
+    "Database query execution time in seconds, by engine.",
+    ("engine",),
+)
+db_pool_checkout_seconds = Histogram(
+    "siena_db_pool_checkout_seconds",
+    "Time spent waiting for a pooled connection, by engine.",
+    ("engine",),
+)
+db_pool_connections = Gauge(
+    "siena_db_pool_connections",
+    "Pooled connections by state (checked_out, idle, overflow) and engine.",
+    ("engine", "state"),
+)
+log_records_dropped_total = Counter(
+    "siena_log_records_dropped_total",
+    "Log records dropped because the logging queue was full, by level.",
+    ("level",),
+)
+startup_duration_seconds = Gauge(
+    "siena_startup_duration_seconds",
+    "Time this process spent in each startup phase (imports, schema_check, ip_index).",
+    ("phase",),
+)
+
+@dataclass
+class RequestDatabaseStats:
+    """
+    Database work attributed to the request being served.
+    """
+    queries: int = 0
+    seconds: float = 0.0
+    statements: StatementCounter = field(default_factory=StatementCounter)
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """
+        Statements executed at least ``threshold`` times, most repeated first.
+
+        The same SQL text with different parameters, run over and over in
+        one request, is the signature of a lazy load inside a loop (N+1).
+
+        Args:
+            threshold: Minimum number of executions
+
+        Returns:
+            (statement, count) pairs
+        """
+        return [(statement, count) for statement, count in self.statements.most_common() if count >= threshold]
+
+# Set by the metrics middleware for the duration of each HTTP request
+request_database_stats: ContextVar[Optional[RequestDatabaseStats]] = ContextVar("request_database_stats", default=None)
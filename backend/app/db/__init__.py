@@ -3,7 +3,8 @@ DB module initialization file.
 Exposes the main classes and functions to facilitate imports.
 """
 
-from app.db.database import Base, engine
-from app.db.session import get_db
+from app.db.database import Base, engine, read_engine
+from app.db import fulltext
+from app.db.session import get_db, get_read_db
 
-__all__ = ["Base", "engine", "get_db"]
+__all__ = ["Base", "engine", "read_engine", "get_db", "get_read_db"]
@@ -1,13 +1,148 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base 
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
 
 from app.core.config import settings
+from app.db.instrumentation import InstrumentedAsyncQueuePool, instrument_engine
 
-engine = create_engine(
-    settings.SQLITE_DATABASE_URL,
-    connect_args={"check_same_thread": False}
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+def get_async_database_url(database_url: str) -> str:
+    """
+    Translate a database URL into its asyncio driver equivalent.
+
+    Args:
+        database_url: URL as configured (e.g. ``sqlite:///app/database.db``)
+
+    Returns:
+        The same URL using an asyncio driver (aiosqlite, asyncpg). URLs
+        that already name an explicit driver are returned unchanged.
+    """
+    url = make_url(database_url)
+    if "+" in url.drivername:
+        return database_url
+
+    drivername = ASYNC_DRIVERS.get(url.drivername, url.drivername)
+    return url.set(drivername=drivername).render_as_string(hide_password=False)
+
+def is_sqlite_file(database_url: str) -> bool:
+    """
+    Check whether a URL points to an on-disk SQLite database.
+
+    Args:
+        database_url: Database URL
+
+    Returns:
+        True for file-backed SQLite URLs, False for in-memory SQLite and other dialects
+    """
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:")
+
+def configure_sqlite_connection(dbapi_connection, read_only: bool = False) -> None:
+    """
+    Apply the configured SQLite pragmas to a new DBAPI connection.
+
+    Args:
+        dbapi_connection: Raw DBAPI connection being opened
+        read_only: Whether the connection belongs to the reader pool
+    """
+    cursor = dbapi_connection.cursor()
+    if not read_only:
+        # Must precede journal_mode, which creates a new file: freed pages can
+        # then be returned with ``PRAGMA incremental_vacuum``. Existing files
+        # switch at their next VACUUM.
+        cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.execute(f"PRAGMA cache_size={settings.SQLITE_CACHE_SIZE}")
+    cursor.execute(f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}")
+    if read_only:
+        cursor.execute("PRAGMA query_only=ON")
+    cursor.close()
+
+def build_engine(database_url: str, read_only: bool = False) -> AsyncEngine:
+    """
+    Create an async engine for the given URL.
+
+    Server databases (PostgreSQL) get a queue pool sized by ``DB_POOL_SIZE``
+    and ``DB_MAX_OVERFLOW``, whose connections are checked with a ping
+    before use and replaced after ``DB_POOL_RECYCLE_SECONDS`` so restarts
+    and idle timeouts on the server side never reach a request.
+    File-backed SQLite engines get the tuning pragmas on every new connection.
+    The writer engine keeps a single connection so writes queue in-process
+    instead of fighting over the database lock; reader engines get a pool of
+    query-only connections that never wait for the writer under WAL.
+    With metrics enabled, pooled engines time every connection checkout.
+
+    Args:
+        database_url: Async database URL
+        read_only: Whether to build the reader engine
+
+    Returns:
+        Configured AsyncEngine
+    """
+    pool_options = {}
+    if settings.METRICS_ENABLED:
+        pool_options = {
+            "poolclass": InstrumentedAsyncQueuePool,
+            "metrics_label": "reader" if read_only else "writer",
+        }
+
+    if make_url(database_url).get_backend_name() != "sqlite":
+        return create_async_engine(
+            database_url,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+            **pool_options,
+        )
+
+    if not is_sqlite_file(database_url):
+        return create_async_engine(database_url, connect_args={"check_same_thread": False})
+
+    new_engine = create_async_engine(
+        database_url,
+        connect_args={"check_same_thread": False},
+        pool_size=settings.SQLITE_READ_POOL_SIZE if read_only else 1,
+        max_overflow=0,
+        **pool_options,
+    )
+
+    @event.listens_for(new_engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        configure_sqlite_connection(dbapi_connection, read_only=read_only)
+
+    return new_engine
+
+DATABASE_URL = get_async_database_url(settings.DATABASE_URL)
+
+engine = build_engine(DATABASE_URL)
+read_engine = build_engine(DATABASE_URL, read_only=True) if is_sqlite_file(DATABASE_URL) else engine
+
+if settings.METRICS_ENABLED:
+    instrument_engine(engine, "writer")
+    if read_engine is not engine:
+        instrument_engine(read_engine, "reader")
+
+SessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = async_sessionmaker(
+    bind=read_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
-Base = declarative_base()
\ No newline at end of file
+Base = declarative_base()
@@ -0,0 +1,209 @@
+"""
+SQLite FTS5 indexes over profile names and account nicknames.
+
+Both indexes are external-content FTS5 tables using the trigram tokenizer,
+so they store only the index (the text stays in ``profiles``/``accounts``)
+and answer substring queries. Triggers keep them in sync with every insert,
+update and delete, including bulk inserts that bypass the ORM.
+
+Other databases (PostgreSQL) have no FTS5 tables and are searched with
+case-insensitive ``LIKE`` over the same columns, ranked by shared trigrams.
+"""
+import operator
+from functools import reduce
+
+from sqlalchemy import Float, Integer, case, cast, event, func, literal, or_, select, text, union_all
+
+from app.db.database import Base
+
+FULLTEXT_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS profiles_fts USING fts5(
+        username, full_name, content='profiles', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS profiles_fts_ai AFTER INSERT ON profiles BEGIN
+        INSERT INTO profiles_fts(rowid, username, full_name)
+        VALUES (new.id, new.username, new.full_name);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS profiles_fts_ad AFTER DELETE ON profiles BEGIN
+        INSERT INTO profiles_fts(profiles_fts, rowid, username, full_name)
+        VALUES ('delete', old.id, old.username, old.full_name);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS profiles_fts_au AFTER UPDATE OF username, full_name ON profiles BEGIN
+        INSERT INTO profiles_fts(profiles_fts, rowid, username, full_name)
+        VALUES ('delete', old.id, old.username, old.full_name);
+        INSERT INTO profiles_fts(rowid, username, full_name)
+        VALUES (new.id, new.username, new.full_name);
+    END
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS accounts_fts USING fts5(
+        nickname, content='accounts', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS accounts_fts_ai AFTER INSERT ON accounts BEGIN
+        INSERT INTO accounts_fts(rowid, nickname) VALUES (new.id, new.nickname);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS accounts_fts_ad AFTER DELETE ON accounts BEGIN
+        INSERT INTO accounts_fts(accounts_fts, rowid, nickname) VALUES ('delete', old.id, old.nickname);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS accounts_fts_au AFTER UPDATE OF nickname ON accounts BEGIN
+        INSERT INTO accounts_fts(accounts_fts, rowid, nickname) VALUES ('delete', old.id, old.nickname);
+        INSERT INTO accounts_fts(rowid, nickname) VALUES (new.id, new.nickname);
+    END
+    """,
+]
+
+FULLTEXT_REBUILD = [
+    "INSERT INTO profiles_fts(profiles_fts) VALUES ('rebuild')",
+    "INSERT INTO accounts_fts(accounts_fts) VALUES ('rebuild')",
+]
+
+FULLTEXT_DROP = [
+    "DROP TABLE IF EXISTS profiles_fts",
+    "DROP TABLE IF EXISTS accounts_fts",
+]
+
+@event.listens_for(Base.metadata, "after_create")
+def create_fulltext_indexes(target, connection, **kw) -> None:
+    """
+    Create the FTS5 tables and sync triggers after the ORM tables (SQLite only).
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    for statement in FULLTEXT_DDL:
+        connection.execute(text(statement))
+
+@event.listens_for(Base.metadata, "before_drop")
+def drop_fulltext_indexes(target, connection, **kw) -> None:
+    """
+    Drop the FTS5 tables before the ORM tables (SQLite only).
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    for statement in FULLTEXT_DROP:
+        connection.execute(text(statement))
+
+SEARCH_SQL = """
+    SELECT profile_id, MIN(score) AS score FROM (
+        SELECT profiles_fts.rowid AS profile_id, bm25(profiles_fts) AS score
+        FROM profiles_fts WHERE profiles_fts MATCH :match
+        UNION ALL
+        SELECT accounts.profile_id AS profile_id, bm25(accounts_fts) AS score
+        FROM accounts_fts JOIN accounts ON accounts.id = accounts_fts.rowid
+        WHERE accounts_fts MATCH :match
+    )
+    GROUP BY profile_id
+"""
+
+# Shortest query, after collapsing whitespace, that has a trigram
+MIN_QUERY_LENGTH = 3
+
+def _trigrams(query: str) -> list[str]:
+    return list(dict.fromkeys(query[i:i + 3] for i in range(len(query) - 2)))
+
+def normalize_query(query: str) -> str:
+    """
+    Collapse runs of whitespace and lower-case a search query.
+
+    Args:
+        query: Raw search text
+
+    Returns:
+        Normalized text
+
+    Raises:
+        ValueError: If fewer than ``MIN_QUERY_LENGTH`` characters are left
+    """
+    query = " ".join(query.split()).lower()
+    if len(query) < MIN_QUERY_LENGTH:
+        raise ValueError(f"Search text must have at least {MIN_QUERY_LENGTH} characters besides surrounding whitespace")
+    return query
+
+def search_matches(dialect_name: str, query: str, fuzzy: bool = False):
+    """
+    Build the subquery of profiles matching a search, with their score.
+
+    SQLite uses the FTS5 indexes and ranks by bm25. Other dialects match
+    the lower-cased text with ``LIKE``: the whole query in substring mode,
+    any of its trigrams in fuzzy mode, scored by how many trigrams a
+    profile or account shares with the query. Either way a lower score is
+    a better match.
+
+    Args:
+        dialect_name: Dialect of the session the query will run on
+        query: Raw search text (at least 3 characters)
+        fuzzy: Whether to match on shared trigrams instead of the whole phrase
+
+    Returns:
+        Subquery named ``matches`` with ``profile_id`` and ``score`` columns
+
+    Raises:
+        ValueError: If the normalized query is shorter than 3 characters
+    """
+    if dialect_name == "sqlite":
+        return (
+            text(SEARCH_SQL)
+            .bindparams(match=build_match_query(query, fuzzy=fuzzy))
+            .columns(profile_id=Integer, score=Float)
+            .subquery("matches")
+        )
+
+    from app.models import Account, Profile
+
+    query = normalize_query(query)
+    terms = _trigrams(query) if fuzzy else [query]
+
+    def matching(profile_id, *columns):
+        found = [
+            or_(*(func.lower(column).contains(term, autoescape=True) for column in columns))
+            for term in terms
+        ]
+        shared = reduce(operator.add, (case((condition, 1), else_=0) for condition in found), literal(0))
+        return select(profile_id.label("profile_id"), cast(-shared, Float).label("score")).where(or_(*found))
+
+    candidates = union_all(
+        matching(Profile.id, Profile.username, Profile.full_name),
+        matching(Account.profile_id, Account.nickname),
+    ).subquery("candidates")
+    return (
+        select(candidates.c.profile_id, func.min(candidates.c.score).label("score"))
+        .group_by(candidates.c.profile_id)
+        .subquery("matches")
+    )
+
+def build_match_query(query: str, fuzzy: bool = False) -> str:
+    """
+    Build an FTS5 MATCH expression for a user query.
+    
+    Substring mode matches the query as one phrase (with the trigram
+    tokenizer that is a case-insensitive substring match). Fuzzy mode ORs
+    every trigram of the query, so bm25 ranks candidates by how many
+    trigrams they share and misspellings still match.
+    
+    Args:
+        query: Raw search text (at least 3 characters)
+        fuzzy: Whether to match on shared trigrams instead of the whole phrase
+        
+    Returns:
+        MATCH expression with every term quoted
+        
+    Raises:
+        ValueError: If the normalized query is shorter than 3 characters
+    """
+    query = normalize_query(query)
+    if not fuzzy:
+        return '"' + query.replace('"', '""') + '"'
+    
+    return " OR ".join('"' + trigram.replace('"', '""') + '"' for trigram in _trigrams(query))
@@ -1,36 +1,127 @@
 import logging
-from typing import Callable
-from sqlalchemy.orm import Session
+import re
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+from sqlalchemy import Connection, inspect, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import DatabaseSchemaException
 
 logger = logging.getLogger(__name__)
 
-def init_db() -> None:
+VERSIONS_DIR = Path(__file__).resolve().parents[2] / "alembic" / "versions"
+VERSION_TABLE = "alembic_version"
+
+_REVISION_PATTERN = re.compile(r"^revision(?:\s*:[^=]+)?=\s*['\"](\w+)['\"]", re.MULTILINE)
+_DOWN_REVISION_PATTERN = re.compile(r"^down_revision(?:\s*:[^=]+)?=(.*)$", re.MULTILINE)
+
+def get_head_revision(versions_dir: Path = VERSIONS_DIR) -> str:
+    """
+    Find the alembic head revision by reading the migration scripts.
+
+    The scripts' ``revision``/``down_revision`` lines are parsed directly
+    instead of loading alembic's script directory, which would add its
+    import time to every worker boot.
+
+    Args:
+        versions_dir: Directory of alembic migration scripts
+
+    Returns:
+        The single revision no other script revises
+
+    Raises:
+        RuntimeError: If there is not exactly one head
+    """
+    revisions = set()
+    revised = set()
+    for path in versions_dir.glob("*.py"):
+        source = path.read_text(encoding="utf-8")
+        revision = _REVISION_PATTERN.search(source)
+        if revision is None:
+            continue
+        revisions.add(revision.group(1))
+        down_revision = _DOWN_REVISION_PATTERN.search(source)
+        if down_revision is not None:
+            revised.update(re.findall(r"['\"](\w+)['\"]", down_revision.group(1)))
+
+    heads = revisions - revised
+    if len(heads) != 1:
+        raise RuntimeError(f"Expected one alembic head in {versions_dir}, found {sorted(heads)}")
+    return heads.pop()
+
+def _inspect_schema(connection: Connection) -> tuple[set[str], Optional[str]]:
+    tables = set(inspect(connection).get_table_names())
+    revision = None
+    if VERSION_TABLE in tables:
+        revision = connection.execute(text(f"SELECT version_num FROM {VERSION_TABLE}")).scalar()
+    return tables, revision
+
+def _create_schema(connection: Connection, revision: str) -> None:
+    from app.db.database import Base
+
+    Base.metadata.create_all(connection)
+    connection.execute(text(
+        f"CREATE TABLE {VERSION_TABLE} (version_num VARCHAR(32) NOT NULL, "
+        f"CONSTRAINT {VERSION_TABLE}_pkc PRIMARY KEY (version_num))"
+    ))
+    connection.execute(text(f"INSERT INTO {VERSION_TABLE} (version_num) VALUES (:revision)"), {"revision": revision})
+
+async def init_db() -> None:
     """
     Initialize the database.
-    Creates all tables if they don't exist.
+
+    Compares the schema version stored by alembic with the head revision of
+    the migration scripts, which costs one catalog query and one select, and
+    does nothing else when they match. An empty database gets every table
+    and is stamped at the head revision. Any other database is left
+    untouched, since migrations are applied with ``alembic upgrade head``.
+
+    Raises:
+        DatabaseSchemaException: If the database has tables but no stored
+            version (created before migrations were tracked), or is stored
+            at a revision other than the head; requests would fail on the
+            columns and tables it lacks, so it must be migrated first
     """
-    from app.db.database import Base, engine
-    
-    logger.info("Creating database tables")
-    Base.metadata.create_all(bind=engine)
-    logger.info("Tables created successfully")
+    from app.db.database import engine
+
+    head = get_head_revision()
+    async with engine.begin() as conn:
+        tables, revision = await conn.run_sync(_inspect_schema)
+        if revision == head:
+            logger.info(f"Database schema is up to date (revision {head})")
+            return
 
-def run_migration(func: Callable[[Session], None]) -> None:
+        if not tables:
+            logger.info("Creating database tables")
+            await conn.run_sync(_create_schema, head)
+            logger.info(f"Tables created successfully (revision {head})")
+            return
+
+        if revision is None:
+            raise DatabaseSchemaException(
+                "Database has tables but no schema version; run `alembic upgrade head` "
+                "to migrate it before starting the application"
+            )
+
+    raise DatabaseSchemaException(
+        f"Database schema is at revision {revision} but the code expects {head}; "
+        "run `alembic upgrade head` before starting the application"
+    )
+
+async def run_migration(func: Callable[[AsyncSession], Awaitable[None]]) -> None:
     """
     Execute a manual database migration.
-    
+
     Args:
-        func: A function that takes a database session and executes operations.
+        func: A coroutine function that takes a database session and executes operations.
     """
     from app.db.session import SessionLocal
-    
-    db = SessionLocal()
-    try:
-        func(db)
-        db.commit()
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Error during migration: {e}")
-        raise
-    finally:
-        db.close()
+
+    async with SessionLocal() as db:
+        try:
+            await func(db)
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Error during migration: {e}")
+            raise
@@ -0,0 +1,181 @@
+import logging
+import time
+from collections import Counter
+from typing import Any, Optional, Union
+
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+from app.core.metrics import (
+    REGISTRY,
+    db_pool_checkout_seconds,
+    db_pool_connections,
+    db_queries_total,
+    db_query_duration_seconds,
+    db_slow_queries_total,
+    request_database_stats,
+)
+
+logger = logging.getLogger(__name__)
+
+EXPLAINABLE_STATEMENTS = ("select", "with", "update", "delete")
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that records how long each checkout waits for a connection.
+
+    The label is passed to ``create_async_engine`` as ``metrics_label`` and
+    survives ``engine.dispose()``, which recreates the pool.
+    """
+
+    def __init__(self, creator, metrics_label: str = "default", **kwargs):
+        super().__init__(creator, **kwargs)
+        self.metrics_label = metrics_label
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_pool_checkout_seconds.labels(self.metrics_label).observe(time.perf_counter() - started)
+
+    def recreate(self) -> "InstrumentedAsyncQueuePool":
+        pool = super().recreate()
+        pool.metrics_label = self.metrics_label
+        return pool
+
+# SQLAlchemy names pool loggers after the pool's module, so this subclass
+# would escape the WARN default SQLAlchemy gives its own "sqlalchemy" loggers.
+logging.getLogger(f"{__name__}.{InstrumentedAsyncQueuePool.__name__}").setLevel(logging.WARN)
+
+def explain(conn, statement: str, parameters: Any) -> Optional[str]:
+    """
+    Get the query plan of a statement that was just executed.
+
+    The plan is read through a separate DBAPI cursor, so it does not go
+    through (or trigger) the engine's events. ``EXPLAIN QUERY PLAN`` is
+    used on SQLite and ``EXPLAIN`` elsewhere; neither runs the statement.
+
+    Args:
+        conn: SQLAlchemy connection the statement ran on
+        statement: SQL text as sent to the driver
+        parameters: Bound parameters as sent to the driver
+
+    Returns:
+        One plan step per line, or None if the statement cannot be explained
+    """
+    if not statement.lstrip().lower().startswith(EXPLAINABLE_STATEMENTS):
+        return None
+    prefix = "EXPLAIN QUERY PLAN" if conn.dialect.name == "sqlite" else "EXPLAIN"
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(f"{prefix} {statement}", parameters)
+        return "\n".join(str(row[-1]) for row in cursor.fetchall())
+    except Exception as e:
+        return f"(plan unavailable: {e})"
+    finally:
+        cursor.close()
+
+def instrument_engine(engine: AsyncEngine, name: str) -> None:
+    """
+    Record query counts and durations for an engine and log slow queries.
+
+    Every query is counted and timed per engine and, when it runs inside an
+    HTTP request, added to that request's ``RequestDatabaseStats`` (which
+    also counts repeated statements for N+1 detection). Queries slower than
+    ``SLOW_QUERY_THRESHOLD_MS`` are logged with their plan. Pool occupancy
+    is read on scrape. The hooks cost two ``perf_counter`` calls and a few
+    dict lookups per query.
+
+    Args:
+        engine: Engine to instrument
+        name: Value of the ``engine`` label (``writer``, ``reader``)
+    """
+    queries_total = db_queries_total.labels(name)
+    query_duration = db_query_duration_seconds.labels(name)
+    slow_queries = db_slow_queries_total.labels(name)
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started_at"].pop()
+        queries_total.inc()
+        query_duration.observe(elapsed)
+        stats = request_database_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.seconds += elapsed
+            stats.statements[statement] += 1
+
+        threshold_ms = settings.SLOW_QUERY_THRESHOLD_MS
+        if threshold_ms > 0 and elapsed * 1000 >= threshold_ms:
+            slow_queries.inc()
+            plan = None if executemany else explain(conn, statement, parameters)
+            logger.warning(
+                f"Slow query on {name} engine ({elapsed * 1000:.1f} ms): {statement}"
+                + (f"\nQuery plan:\n{plan}" if plan else "")
+            )
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _handle_error(exception_context):
+        started = exception_context.connection.info.get("query_started_at") if exception_context.connection else None
+        if started:
+            started.pop()
+
+    def collect_pool() -> None:
+        pool = sync_engine.pool
+        if not isinstance(pool, QueuePool):
+            return
+        db_pool_connections.labels(name, "checked_out").set(pool.checkedout())
+        db_pool_connections.labels(name, "idle").set(pool.checkedin())
+        db_pool_connections.labels(name, "overflow").set(max(pool.overflow(), 0))
+
+    REGISTRY.add_collector(f"pool:{name}", collect_pool)
+
+class QueryCounter:
+    """
+    Record every statement an engine executes inside a ``with`` block.
+
+    Independent of ``instrument_engine``, so it also works on engines built
+    for tests::
+
+        with QueryCounter(engine) as queries:
+            await client.get("/api/v1/profiles")
+        assert queries.count <= 3
+    """
+
+    def __init__(self, engine: Union[AsyncEngine, Engine]):
+        self.engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+        self.statements: list[str] = []
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        self.statements.append(statement)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def repeated(self, threshold: int = 2) -> dict[str, int]:
+        """
+        Statements executed at least ``threshold`` times.
+
+        Args:
+            threshold: Minimum number of executions
+
+        Returns:
+            Mapping of statement to execution count
+        """
+        return {statement: count for statement, count in Counter(self.statements).items() if count >= threshold}
@@ -1,14 +1,28 @@
-from app.db.database import SessionLocal
+from typing import AsyncIterator
 
-def get_db():
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import SessionLocal, ReadSessionLocal
+
+async def get_db() -> AsyncIterator[AsyncSession]:
     """
     Dependency to obtain a database session.
-    
+
+    Yields:
+        SQLAlchemy AsyncSession: A database session.
+    """
+    async with SessionLocal() as db:
+        yield db
+
+async def get_read_db() -> AsyncIterator[AsyncSession]:
+    """
+    Dependency to obtain a read-only database session.
+
+    Sessions come from the reader pool, so read endpoints never queue
+    behind writes.
+
     Yields:
-        SQLAlchemy Session: A database session.
+        SQLAlchemy AsyncSession: A read-only database session.
     """
-    db = SessionLocal()
-    try:
+    async with ReadSessionLocal() as db:
         yield db
-    finally:
-        db.close()
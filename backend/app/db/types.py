@@ -0,0 +1,13 @@
+from sqlalchemy import DateTime
+from sqlalchemy.dialects import sqlite
+
+# SQLite stores datetimes as text and compares them as strings. Server
+# defaults (CURRENT_TIMESTAMP) write "YYYY-MM-DD HH:MM:SS", so bound values
+# must use the same format or keyset comparisons such as
+# ``(created_at, id) < (:created_at, :id)`` misorder rows that share a second.
+SQLITE_TIMESTAMP_FORMAT = "%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"
+
+Timestamp = DateTime().with_variant(
+    sqlite.DATETIME(storage_format=SQLITE_TIMESTAMP_FORMAT),
+    "sqlite",
+)
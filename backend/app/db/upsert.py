@@ -0,0 +1,52 @@
+"""
+Dialect-neutral ``INSERT ... ON CONFLICT``.
+
+SQLite and PostgreSQL share the ``ON CONFLICT (...) DO UPDATE/NOTHING``
+syntax, but SQLAlchemy only exposes it through each dialect's own
+``insert()``. Repositories call ``upsert_insert`` instead of importing a
+dialect, so the same statement runs on either database.
+"""
+from typing import Any, Callable, Union
+
+from sqlalchemy import Connection, Engine
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+UPSERT_INSERTS: dict[str, Callable[[Any], Any]] = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+def dialect_name(bind: Union[AsyncSession, AsyncConnection, Connection, Engine]) -> str:
+    """
+    Name of the database dialect behind a session, connection or engine.
+
+    Args:
+        bind: Session, connection or engine
+
+    Returns:
+        Dialect name, e.g. ``sqlite`` or ``postgresql``
+    """
+    if isinstance(bind, AsyncSession):
+        bind = bind.get_bind()
+    return bind.dialect.name
+
+def upsert_insert(bind: Union[AsyncSession, AsyncConnection, Connection, Engine, str], table):
+    """
+    Build an INSERT that supports ``on_conflict_do_update``/``on_conflict_do_nothing``.
+
+    Args:
+        bind: Session, connection or engine the statement will run on, or a dialect name
+        table: Mapped class or Table to insert into
+
+    Returns:
+        Dialect-specific Insert; ``.excluded`` refers to the proposed row
+
+    Raises:
+        NotImplementedError: If the dialect has no ``ON CONFLICT`` clause
+    """
+    name = bind if isinstance(bind, str) else dialect_name(bind)
+    try:
+        return UPSERT_INSERTS[name](table)
+    except KeyError:
+        raise NotImplementedError(f"Upserts are not supported on the '{name}' dialect") from None
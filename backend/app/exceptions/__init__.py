@@ -15,6 +15,12 @@ from .user_exceptions import (
 from .database_exceptions import (
     DatabaseException,
     DatabaseOperationException,
+    DatabaseSchemaException,
+)
+
+from .auth_exceptions import (
+    AuthException,
+    PasswordHashQueueFullException,
 )
 
 __all__ = [
@@ -24,4 +30,7 @@ __all__ = [
     "UserNotFoundException",
     "DatabaseException",
     "DatabaseOperationException",
+    "DatabaseSchemaException",
+    "AuthException",
+    "PasswordHashQueueFullException",
 ]
\ No newline at end of file
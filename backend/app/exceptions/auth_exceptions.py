@@ -0,0 +1,9 @@
+class AuthException(Exception):
+    """Base class for authentication-related exceptions."""
+    pass
+
+class PasswordHashQueueFullException(AuthException):
+    """Exception raised when the password hashing pool cannot accept more work."""
+    def __init__(self):
+        self.message = "Password hashing is busy, please retry shortly"
+        super().__init__(self.message)
@@ -6,4 +6,10 @@ class DatabaseOperationException(DatabaseException):
     """Exception raised when a database operation fails."""
     def __init__(self, message: str):
         self.message = message
-        super().__init__(self.message)
\ No newline at end of file
+        super().__init__(self.message)
+
+class DatabaseSchemaException(DatabaseException):
+    """Exception raised when the database schema cannot be used by this version of the code."""
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
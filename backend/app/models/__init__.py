@@ -1,6 +1,7 @@
 from .user import User
 from .profile import Profile
 from .ip_address import IPAddress
+from .ip_sighting import RawSighting, DailySighting
 from .account import Account, AccountType
 
-_all__ = ["User", "Profile", "IPAddress", "Account", "AccountType"]
\ No newline at end of file
+_all__ = ["User", "Profile", "IPAddress", "RawSighting", "DailySighting", "Account", "AccountType"]
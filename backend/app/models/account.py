@@ -25,12 +25,14 @@ class Account(Base):
     
     profile_id: Mapped[int] = mapped_column(
         ForeignKey("profiles.id"),
+        index=True,
         nullable=False,
         comment="Foreign key to the profile table"
     )
 
     nickname: Mapped[str] = mapped_column(
         String(16),
+        index=True,
         nullable=False,
         comment="Nickname of the account"
     )
@@ -47,3 +49,6 @@ class Account(Base):
         default=AccountType.PRIMARY.value,
         comment="Type of the account (primary, previous, fake)"
     )
+    
+    
+    profile = relationship("Profile", back_populates="accounts")
@@ -1,13 +1,31 @@
-from sqlalchemy import Integer, String, ForeignKey, DateTime, func
+from typing import Optional
+from sqlalchemy import Integer, String, ForeignKey, DateTime, LargeBinary, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.database import Base
+from app.db.types import Timestamp
+from app.utils.ip import IP_NUMERIC_WIDTH, pack_ip_address
+
+def _default_ip_numeric(context) -> Optional[bytes]:
+    """
+    Derive the packed address from the text address being inserted.
+    Runs for ORM, bulk and Core inserts alike.
+    """
+    return pack_ip_address(context.get_current_parameters()["ip_address"])
 
 class IPAddress(Base):
     """
-    Represents an IP address in the database.
+    Represents an IP address seen on a profile.
+
+    There is one row per (profile, address) pair; repeated sightings update
+    its ``last_seen`` and ``hit_count`` instead of adding rows.
     """
     __tablename__ = "ip_addresses"
+    __table_args__ = (
+        Index("ix_ip_addresses_ip_numeric_profile_id", "ip_numeric", "profile_id"),
+        Index("ix_ip_addresses_profile_id_timestamp_id", "profile_id", "timestamp", "id"),
+        Index("uq_ip_addresses_profile_id_ip_address", "profile_id", "ip_address", unique=True),
+    )
     
     id: Mapped[int] = mapped_column(
         Integer,
@@ -30,11 +48,41 @@ class IPAddress(Base):
     )
     
     
+    ip_numeric: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary(IP_NUMERIC_WIDTH),
+        nullable=True,
+        default=_default_ip_numeric,
+        comment="IP address as a 16-byte big-endian integer (IPv4 mapped into IPv6)"
+    )
+    
+    
     timestamp: Mapped[DateTime] = mapped_column(
-        DateTime,
+        Timestamp,
         server_default=func.now(),
         comment="Timestamp when the IP address was created"
     )
     
+    first_seen: Mapped[DateTime] = mapped_column(
+        Timestamp,
+        server_default=func.now(),
+        nullable=False,
+        comment="Earliest sighting of the address on the profile"
+    )
+    
+    last_seen: Mapped[DateTime] = mapped_column(
+        Timestamp,
+        server_default=func.now(),
+        nullable=False,
+        comment="Latest sighting of the address on the profile"
+    )
+    
+    hit_count: Mapped[int] = mapped_column(
+        Integer,
+        default=1,
+        server_default="1",
+        nullable=False,
+        comment="Number of sightings of the address on the profile"
+    )
+    
     
-    profile = relationship("Profile", back_populates="ip_addresses")
\ No newline at end of file
+    profile = relationship("Profile", back_populates="ip_adress")
\ No newline at end of file
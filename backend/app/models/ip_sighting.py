@@ -0,0 +1,95 @@
+from datetime import date, datetime
+from sqlalchemy import Date, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.database import Base
+from app.db.types import Timestamp
+
+class RawSighting(Base):
+    """
+    One observation of an IP address on a profile, kept for the retention period.
+
+    Rows older than ``IP_SIGHTING_RAW_RETENTION_DAYS`` are rolled up into
+    ``DailySighting`` and deleted by the retention job.
+    """
+    __tablename__ = "ip_sightings_raw"
+    __table_args__ = (
+        Index("ix_ip_sightings_raw_seen_at_id", "seen_at", "id"),
+        Index("ix_ip_sightings_raw_profile_id_seen_at", "profile_id", "seen_at"),
+    )
+
+    id: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+        comment="Unique identifier for the observation"
+    )
+
+    profile_id: Mapped[int] = mapped_column(
+        ForeignKey("profiles.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Foreign key referencing the profile"
+    )
+
+    ip_address: Mapped[str] = mapped_column(
+        String(45),
+        nullable=False,
+        comment="IP address in string format"
+    )
+
+    seen_at: Mapped[datetime] = mapped_column(
+        Timestamp,
+        nullable=False,
+        comment="When the address was seen on the profile"
+    )
+
+class DailySighting(Base):
+    """
+    Observations of an IP address on a profile during one (UTC) day, rolled up from raw sightings.
+    """
+    __tablename__ = "ip_sightings_daily"
+    __table_args__ = (
+        Index("uq_ip_sightings_daily_profile_id_ip_address_day", "profile_id", "ip_address", "day", unique=True),
+        Index("ix_ip_sightings_daily_profile_id_day", "profile_id", "day"),
+    )
+
+    id: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+        comment="Unique identifier for the daily aggregate"
+    )
+
+    profile_id: Mapped[int] = mapped_column(
+        ForeignKey("profiles.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Foreign key referencing the profile"
+    )
+
+    ip_address: Mapped[str] = mapped_column(
+        String(45),
+        nullable=False,
+        comment="IP address in string format"
+    )
+
+    day: Mapped[date] = mapped_column(
+        Date,
+        nullable=False,
+        comment="Day of the observations"
+    )
+
+    first_seen: Mapped[datetime] = mapped_column(
+        Timestamp,
+        nullable=False,
+        comment="Earliest observation of the day"
+    )
+
+    last_seen: Mapped[datetime] = mapped_column(
+        Timestamp,
+        nullable=False,
+        comment="Latest observation of the day"
+    )
+
+    hit_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Number of observations during the day"
+    )
@@ -1,12 +1,16 @@
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import Integer, String, ForeignKey, func, DateTime
+from sqlalchemy import Integer, String, ForeignKey, func, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.database import Base
+from app.db.types import Timestamp
 
 class Profile(Base):
     __tablename__ = "profiles"
+    __table_args__ = (
+        Index("ix_profiles_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(
         Integer,
@@ -16,12 +20,28 @@ class Profile(Base):
     )
     
     
+    username: Mapped[str] = mapped_column(
+        String(16),
+        unique=True,
+        index=True,
+        nullable=False,
+        comment="Unique username of the profile"
+    )
+    
+    
     full_name: Mapped[str] = mapped_column(
         String(128),
         nullable=True,
         comment="Full name of the profile"
     )
     
+    
+    email: Mapped[str] = mapped_column(
+        String(254),
+        nullable=True,
+        comment="Email address of the profile"
+    )
+    
 
     city: Mapped[str] = mapped_column(
         String(100),
@@ -38,17 +58,67 @@ class Profile(Base):
     
     
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        Timestamp,
         server_default=func.now(),
         comment="Timestamp when the profile was created"
     )
+    
+    
+    cluster_id: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        index=True,
+        nullable=True,
+        comment="Smallest profile ID of the actor cluster this profile belongs to"
+    )
+    
+    
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=1,
+        server_default="1",
+        comment="Incremented whenever the profile document (including accounts and IP addresses) changes"
+    )
 
     
     ip_adress: Mapped[list["IPAddress"]] = relationship( # type: ignore
         "IPAddress",
         back_populates="profile",
         cascade="all, delete-orphan",
-        lazy="dynamic"
+        order_by="IPAddress.id",
+    )
+    
+    
+    accounts: Mapped[list["Account"]] = relationship( # type: ignore
+        "Account",
+        back_populates="profile",
+        cascade="all, delete-orphan",
+    )
+    
+    
+    # Read-only views of `accounts` split by type in SQL, so each can be
+    # eager loaded with a single set-based query.
+    primary_accounts: Mapped[list["Account"]] = relationship( # type: ignore
+        "Account",
+        primaryjoin="and_(Account.profile_id == Profile.id, Account.account_type == 'primary', Account.is_active == True)",
+        order_by="Account.id",
+        viewonly=True,
+    )
+    
+    
+    previous_accounts: Mapped[list["Account"]] = relationship( # type: ignore
+        "Account",
+        primaryjoin="and_(Account.profile_id == Profile.id, Account.account_type == 'previous')",
+        order_by="Account.id",
+        viewonly=True,
+    )
+    
+    
+    fake_accounts: Mapped[list["Account"]] = relationship( # type: ignore
+        "Account",
+        primaryjoin="and_(Account.profile_id == Profile.id, Account.account_type == 'fake')",
+        order_by="Account.id",
+        viewonly=True,
     )
     
     
@@ -57,22 +127,4 @@ class Profile(Base):
         """
         Returns the current primary account associated with the profile.
         """
-        primary_accounts = [acc for acc in self.accounts 
-                          if acc.account_type == "primary" and acc.is_active]
-        return primary_accounts[0] if primary_accounts else None
-    
-    @property
-    def previous_accounts(self) -> list["Account"]:
-        """
-        Returns a list of previous accounts associated with the profile.
-        """
-        return [acc for acc in self.accounts 
-                if acc.account_type == "previous"]
-        
-    @property
-    def fake_accounts(self) -> list["Account"]:
-        """
-        Returns a list of fake accounts associated with the profile.
-        """
-        return [acc for acc in self.accounts 
-                if acc.account_type == "fake"]
\ No newline at end of file
+        return self.primary_accounts[0] if self.primary_accounts else None
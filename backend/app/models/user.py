@@ -1,14 +1,18 @@
 from datetime import datetime
-from sqlalchemy import Integer, String, ForeignKey, DateTime, func
+from sqlalchemy import Integer, String, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.database import Base
+from app.db.types import Timestamp
 
 class User(Base):
     """
     User model representing a user in the system.
     """
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_timestamp_id", "timestamp", "id"),
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, 
@@ -47,7 +51,7 @@ class User(Base):
     )
 
     timestamp: Mapped[datetime] = mapped_column(
-        DateTime, 
+        Timestamp,
         server_default=func.now(), 
         comment="Timestamp when the user was created"
     )
\ No newline at end of file
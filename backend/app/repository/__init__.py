@@ -1,3 +1,6 @@
 from .user_repository import UserRepository
+from .profile_repository import ProfileRepository
+from .ip_repository import IPRepository
+from .cluster_repository import ClusterRepository
 
-__all__ = ["UserRepository"]
\ No newline at end of file
+__all__ = ["UserRepository", "ProfileRepository", "IPRepository", "ClusterRepository"]
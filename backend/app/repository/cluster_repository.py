@@ -0,0 +1,166 @@
+from typing import Iterable, List, Optional
+
+from sqlalchemy import and_, bindparam, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.models import Account, IPAddress, Profile
+from app.utils.disjoint_set import DisjointSet
+
+REBUILD_BATCH_SIZE = 10_000
+
+class ClusterRepository:
+    """
+    Repository for actor clusters: profiles linked by a shared IP address
+    or a shared account nickname.
+
+    A cluster is identified by the smallest profile ID it contains, stored
+    in ``profiles.cluster_id`` for every member.
+    """
+
+    @staticmethod
+    async def link_profiles(db: AsyncSession, profile_ids: Iterable[int]) -> None:
+        """
+        Merge the clusters of profiles that just gained IP addresses or accounts.
+
+        Only the given profiles and the profiles they share an address or
+        nickname with are read; affected clusters are relabelled in place.
+        The caller commits.
+
+        Args:
+            db: Database session
+            profile_ids: Profiles whose sightings or accounts changed
+        """
+        profile_ids = list(set(profile_ids))
+        if not profile_ids:
+            return
+
+        own_ip, other_ip = aliased(IPAddress), aliased(IPAddress)
+        own_account, other_account = aliased(Account), aliased(Account)
+        edges = (await db.execute(
+            select(own_ip.profile_id, other_ip.profile_id)
+            .join(other_ip, and_(
+                other_ip.ip_numeric == own_ip.ip_numeric,
+                other_ip.profile_id != own_ip.profile_id,
+            ))
+            .where(own_ip.profile_id.in_(profile_ids))
+            .union(
+                select(own_account.profile_id, other_account.profile_id)
+                .join(other_account, and_(
+                    other_account.nickname == own_account.nickname,
+                    other_account.profile_id != own_account.profile_id,
+                ))
+                .where(own_account.profile_id.in_(profile_ids))
+            )
+        )).all()
+
+        involved = set(profile_ids)
+        involved.update(other for _, other in edges)
+        current = (await db.execute(
+            select(Profile.id, Profile.cluster_id).where(Profile.id.in_(involved))
+        )).all()
+
+        clusters = DisjointSet(profile_ids)
+        for profile_id, cluster_id in current:
+            clusters.union(profile_id, cluster_id or profile_id)
+        for profile_id, other in edges:
+            clusters.union(profile_id, other)
+
+        for group in clusters.groups():
+            root = min(group)
+            await db.execute(
+                update(Profile)
+                .where(
+                    or_(Profile.cluster_id.in_(group), Profile.id.in_(group)),
+                    or_(Profile.cluster_id.is_(None), Profile.cluster_id != root),
+                )
+                .values(cluster_id=root, version=Profile.version + 1)
+                .execution_options(synchronize_session=False)
+            )
+
+    @staticmethod
+    async def rebuild(db: AsyncSession) -> int:
+        """
+        Recompute every cluster from scratch and commit.
+
+        Sightings and accounts are streamed sorted by address and nickname,
+        so each shared value is a run of consecutive rows and the whole
+        rebuild is a single pass over each table. Only profiles whose
+        cluster changed are written (and have their version bumped).
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of clusters
+        """
+        clusters = DisjointSet()
+        profile_stream = await db.stream(
+            select(Profile.id).execution_options(yield_per=REBUILD_BATCH_SIZE)
+        )
+        async for rows in profile_stream.partitions():
+            for (profile_id,) in rows:
+                clusters.find(profile_id)
+
+        for key_column, profile_column in (
+            (IPAddress.ip_numeric, IPAddress.profile_id),
+            (Account.nickname, Account.profile_id),
+        ):
+            stream = await db.stream(
+                select(key_column, profile_column)
+                .where(key_column.is_not(None))
+                .order_by(key_column)
+                .execution_options(yield_per=REBUILD_BATCH_SIZE)
+            )
+            previous_key, previous_profile = None, None
+            async for rows in stream.partitions():
+                for key, profile_id in rows:
+                    if key == previous_key:
+                        clusters.union(previous_profile, profile_id)
+                    previous_key, previous_profile = key, profile_id
+
+        groups = clusters.groups()
+        assignments = [
+            {"member_id": profile_id, "root_id": min(group)}
+            for group in groups
+            for profile_id in group
+        ]
+        profiles = Profile.__table__
+        for start in range(0, len(assignments), REBUILD_BATCH_SIZE):
+            await db.execute(
+                update(profiles)
+                .where(
+                    profiles.c.id == bindparam("member_id"),
+                    or_(profiles.c.cluster_id.is_(None), profiles.c.cluster_id != bindparam("root_id")),
+                )
+                .values(cluster_id=bindparam("root_id"), version=profiles.c.version + 1),
+                assignments[start:start + REBUILD_BATCH_SIZE],
+            )
+        await db.commit()
+        return len(groups)
+
+    @staticmethod
+    async def get_cluster_members(db: AsyncSession, profile_id: int, limit: int = 1000) -> Optional[tuple[int, List[Profile]]]:
+        """
+        Retrieve the cluster a profile belongs to.
+
+        Args:
+            db: Database session
+            profile_id: ID of the profile
+            limit: Maximum number of members to return
+
+        Returns:
+            Tuple of (cluster ID, member profiles ordered by ID), or None if the profile does not exist
+        """
+        profile = await db.get(Profile, profile_id)
+        if profile is None:
+            return None
+
+        cluster_id = profile.cluster_id or profile.id
+        result = await db.execute(
+            select(Profile)
+            .where(or_(Profile.cluster_id == cluster_id, Profile.id == cluster_id))
+            .order_by(Profile.id)
+            .limit(limit)
+        )
+        return cluster_id, list(result.scalars().all())
@@ -1,7 +1,352 @@
-from typing import List, Optional
-from sqlalchemy import func, update
-from sqlalchemy.orm import Session
-from sqlalchemy.dialects.sqlite import insert
+from datetime import date, datetime, timezone
+from typing import Any, Iterable, List, Optional
+from sqlalchemy import Date, case, delete, func, insert, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import IPAddress
+from app.db.upsert import upsert_insert
+from app.models import DailySighting, IPAddress, Profile, RawSighting
+from app.repository.cluster_repository import ClusterRepository
+from app.repository.pagination import keyset_page
+from app.repository.profile_repository import ProfileRepository
+from app.schemas.ip_address_schema import IPDailyActivity, IPSighting, IPSightingReport
+from app.utils.cursor import decode_day_cursor, encode_day_cursor
+from app.utils.ip import parse_ip_query
 
+class IPRepository:
+    """
+    Repository for IP address sightings.
+    """
+
+    @staticmethod
+    async def search(db: AsyncSession, query: str, limit: int = 100) -> List[IPAddress]:
+        """
+        Retrieve sightings matching an exact address, an IPv4 prefix or a CIDR block.
+        
+        The query is turned into a packed [low, high] range over the indexed
+        ``ip_numeric`` column, so every form is an index range scan.
+        
+        Args:
+            db: Database session
+            query: Address, prefix (``177.12.``) or network (``177.12.0.0/16``)
+            limit: Maximum number of sightings to return
+            
+        Returns:
+            Matching IPAddress objects ordered by address
+            
+        Raises:
+            ValueError: If the query is not a valid address, prefix or network
+        """
+        low, high = parse_ip_query(query)
+        result = await db.execute(
+            select(IPAddress)
+            .where(IPAddress.ip_numeric.between(low, high))
+            .order_by(IPAddress.ip_numeric, IPAddress.profile_id, IPAddress.id)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def get_profile_ids(db: AsyncSession, query: str) -> List[int]:
+        """
+        Retrieve the IDs of profiles seen on an address, prefix or CIDR block.
+        
+        Args:
+            db: Database session
+            query: Address, prefix (``177.12.``) or network (``177.12.0.0/16``)
+            
+        Returns:
+            Sorted list of distinct profile IDs
+            
+        Raises:
+            ValueError: If the query is not a valid address, prefix or network
+        """
+        low, high = parse_ip_query(query)
+        result = await db.execute(
+            select(IPAddress.profile_id)
+            .where(IPAddress.ip_numeric.between(low, high))
+            .distinct()
+            .order_by(IPAddress.profile_id)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def list_for_profile(
+        db: AsyncSession,
+        profile_id: int,
+        ip_address: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> tuple[List[IPAddress], Optional[str]]:
+        """
+        Retrieve a page of a profile's IP address history.
+        
+        Addresses are listed by when they were first recorded on the profile
+        (``timestamp``, then ``id``), newest first. Unlike ``last_seen`` and
+        ``first_seen``, which sighting upserts move, that key never changes,
+        so concurrent sightings cannot push rows across the cursor.
+        
+        Args:
+            db: Database session
+            profile_id: ID of the profile
+            ip_address: Only report this (normalized) address
+            limit: Maximum number of sightings to return
+            cursor: Cursor returned with the previous page, None for the first page
+            
+        Returns:
+            Tuple of (addresses most recently recorded first, cursor for the next page or None)
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        statement = select(IPAddress).where(IPAddress.profile_id == profile_id)
+        if ip_address is not None:
+            statement = statement.where(IPAddress.ip_address == ip_address)
+        return await keyset_page(
+            db,
+            statement,
+            IPAddress.timestamp,
+            IPAddress.id,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    @staticmethod
+    async def upsert_sightings(
+        db: AsyncSession,
+        sightings: Iterable[IPSighting],
+        now: Optional[datetime] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Record sightings on their (profile, address) rows with one upsert.
+        
+        Sightings of the same pair are first folded together in memory, then
+        every pair is written by a single ``INSERT ... ON CONFLICT (profile_id,
+        ip_address) DO UPDATE`` executed for all rows at once: new pairs are
+        inserted, known ones get the earlier ``first_seen``, the later
+        ``last_seen`` and their hits added to ``hit_count``. The caller commits.
+        
+        Args:
+            db: Database session
+            sightings: Sightings of existing profiles
+            now: Time given to sightings without ``seen_at``; defaults to the current UTC time
+            
+        Returns:
+            The aggregated rows written, one per distinct pair
+        """
+        now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+        rows: dict[tuple[int, str], dict[str, Any]] = {}
+        for sighting in sightings:
+            seen_at = sighting.seen_at or now
+            row = rows.get((sighting.profile_id, sighting.ip_address))
+            if row is None:
+                rows[sighting.profile_id, sighting.ip_address] = {
+                    "profile_id": sighting.profile_id,
+                    "ip_address": sighting.ip_address,
+                    "first_seen": seen_at,
+                    "last_seen": seen_at,
+                    "hit_count": 1,
+                }
+            else:
+                row["first_seen"] = min(row["first_seen"], seen_at)
+                row["last_seen"] = max(row["last_seen"], seen_at)
+                row["hit_count"] += 1
+        if not rows:
+            return []
+        
+        statement = upsert_insert(db, IPAddress)
+        excluded = statement.excluded
+        statement = statement.on_conflict_do_update(
+            index_elements=[IPAddress.profile_id, IPAddress.ip_address],
+            set_={
+                "first_seen": case((excluded.first_seen < IPAddress.first_seen, excluded.first_seen), else_=IPAddress.first_seen),
+                "last_seen": case((excluded.last_seen > IPAddress.last_seen, excluded.last_seen), else_=IPAddress.last_seen),
+                "hit_count": IPAddress.hit_count + excluded.hit_count,
+            },
+        )
+        await db.execute(statement, list(rows.values()))
+        return list(rows.values())
+
+    @staticmethod
+    async def record_sightings(db: AsyncSession, sightings: list[IPSighting]) -> IPSightingReport:
+        """
+        Record a batch of sightings in one transaction.
+        
+        Sightings of profiles that do not exist are skipped and reported.
+        Besides the per-pair aggregates, every sighting is appended to the
+        raw journal, which the retention job later rolls up into daily
+        aggregates. The touched profiles get a new version (their address
+        history changed) and are re-linked to the clusters of profiles
+        sharing the new addresses.
+        
+        Args:
+            db: Database session
+            sightings: Sightings to record
+            
+        Returns:
+            Report with the number of sightings received and pairs written
+        """
+        profile_ids = {sighting.profile_id for sighting in sightings}
+        existing = set((await db.execute(select(Profile.id).where(Profile.id.in_(profile_ids)))).scalars().all())
+        known = [sighting for sighting in sightings if sighting.profile_id in existing]
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        rows = await IPRepository.upsert_sightings(db, known, now=now)
+        if known:
+            await db.execute(insert(RawSighting), [
+                {"profile_id": sighting.profile_id, "ip_address": sighting.ip_address, "seen_at": sighting.seen_at or now}
+                for sighting in known
+            ])
+        await ProfileRepository.bump_versions(db, existing)
+        await ClusterRepository.link_profiles(db, existing)
+        await db.commit()
+        return IPSightingReport(
+            received=len(sightings),
+            recorded=len(rows),
+            unknown_profile_ids=sorted(profile_ids - existing),
+        )
+
+    @staticmethod
+    async def roll_up_raw_sightings(db: AsyncSession, cutoff: datetime, batch_size: int) -> int:
+        """
+        Move the oldest raw sightings seen before ``cutoff`` into the daily aggregates.
+        
+        At most ``batch_size`` rows are removed by one ``DELETE ... RETURNING``
+        (oldest first, through the ``(seen_at, id)`` index), folded per
+        (profile, address, day) and added to ``ip_sightings_daily`` by one
+        upsert. Rows are claimed by deleting them, so concurrent runs never
+        count a sighting twice. The caller commits; keeping batches small
+        keeps the write lock short.
+        
+        Args:
+            db: Database session
+            cutoff: Sightings seen before this time are rolled up
+            batch_size: Maximum number of raw sightings to move
+            
+        Returns:
+            Number of raw sightings moved
+        """
+        oldest = (
+            select(RawSighting.id)
+            .where(RawSighting.seen_at < cutoff)
+            .order_by(RawSighting.seen_at, RawSighting.id)
+            .limit(batch_size)
+        )
+        result = await db.execute(
+            delete(RawSighting)
+            .where(RawSighting.id.in_(oldest.scalar_subquery()))
+            .returning(RawSighting.profile_id, RawSighting.ip_address, RawSighting.seen_at)
+            .execution_options(synchronize_session=False)
+        )
+        raw = result.all()
+        if not raw:
+            return 0
+        
+        days: dict[tuple[int, str, date], dict[str, Any]] = {}
+        for profile_id, ip_address, seen_at in raw:
+            row = days.get((profile_id, ip_address, seen_at.date()))
+            if row is None:
+                days[profile_id, ip_address, seen_at.date()] = {
+                    "profile_id": profile_id,
+                    "ip_address": ip_address,
+                    "day": seen_at.date(),
+                    "first_seen": seen_at,
+                    "last_seen": seen_at,
+                    "hit_count": 1,
+                }
+            else:
+                row["first_seen"] = min(row["first_seen"], seen_at)
+                row["last_seen"] = max(row["last_seen"], seen_at)
+                row["hit_count"] += 1
+        
+        statement = upsert_insert(db, DailySighting)
+        excluded = statement.excluded
+        statement = statement.on_conflict_do_update(
+            index_elements=[DailySighting.profile_id, DailySighting.ip_address, DailySighting.day],
+            set_={
+                "first_seen": case((excluded.first_seen < DailySighting.first_seen, excluded.first_seen), else_=DailySighting.first_seen),
+                "last_seen": case((excluded.last_seen > DailySighting.last_seen, excluded.last_seen), else_=DailySighting.last_seen),
+                "hit_count": DailySighting.hit_count + excluded.hit_count,
+            },
+        )
+        await db.execute(statement, list(days.values()))
+        return len(raw)
+
+    @staticmethod
+    async def list_daily_for_profile(
+        db: AsyncSession,
+        profile_id: int,
+        ip_address: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> tuple[List[IPDailyActivity], Optional[str]]:
+        """
+        Retrieve a page of a profile's sightings per address and day.
+        
+        Days already rolled up are read from ``ip_sightings_daily`` and the
+        rest is aggregated from the raw journal, so pages are the same before
+        and after the retention job runs. Both are ordered by the immutable
+        ``(day, ip_address)`` key, which the cursor continues from.
+        
+        Args:
+            db: Database session
+            profile_id: ID of the profile
+            ip_address: Only report this (normalized) address
+            limit: Maximum number of (day, address) entries to return
+            cursor: Cursor returned with the previous page, None for the first page
+            
+        Returns:
+            Tuple of (activity, most recent day first, cursor for the next page or None)
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        day = func.date(RawSighting.seen_at, type_=Date)
+        recent = (
+            select(
+                RawSighting.ip_address,
+                day.label("day"),
+                func.min(RawSighting.seen_at).label("first_seen"),
+                func.max(RawSighting.seen_at).label("last_seen"),
+                func.count().label("hit_count"),
+            )
+            .where(RawSighting.profile_id == profile_id)
+            .group_by(day, RawSighting.ip_address)
+            .order_by(day.desc(), RawSighting.ip_address.desc())
+            .limit(limit + 1)
+        )
+        rolled_up = (
+            select(
+                DailySighting.ip_address,
+                DailySighting.day,
+                DailySighting.first_seen,
+                DailySighting.last_seen,
+                DailySighting.hit_count,
+            )
+            .where(DailySighting.profile_id == profile_id)
+            .order_by(DailySighting.day.desc(), DailySighting.ip_address.desc())
+            .limit(limit + 1)
+        )
+        if ip_address is not None:
+            recent = recent.where(RawSighting.ip_address == ip_address)
+            rolled_up = rolled_up.where(DailySighting.ip_address == ip_address)
+        if cursor is not None:
+            after_day, after_ip_address = decode_day_cursor(cursor)
+            recent = recent.where(tuple_(day, RawSighting.ip_address) < (after_day, after_ip_address))
+            rolled_up = rolled_up.where(tuple_(DailySighting.day, DailySighting.ip_address) < (after_day, after_ip_address))
+        
+        # A day can be split between both tables while the job is catching up
+        activity: dict[tuple[date, str], dict[str, Any]] = {}
+        for query in (rolled_up, recent):
+            for row in (await db.execute(query)).mappings():
+                entry = activity.get((row["day"], row["ip_address"]))
+                if entry is None:
+                    activity[row["day"], row["ip_address"]] = dict(row)
+                else:
+                    entry["first_seen"] = min(entry["first_seen"], row["first_seen"])
+                    entry["last_seen"] = max(entry["last_seen"], row["last_seen"])
+                    entry["hit_count"] += row["hit_count"]
+        
+        keys = sorted(activity, reverse=True)
+        items = [IPDailyActivity(**activity[key]) for key in keys[:limit]]
+        if len(keys) <= limit:
+            return items, None
+        return items, encode_day_cursor(*keys[limit - 1])
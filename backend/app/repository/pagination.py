@@ -0,0 +1,54 @@
+from typing import Any, Optional
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.utils.cursor import decode_cursor, encode_cursor
+
+async def keyset_page(
+    db: AsyncSession,
+    statement: Select,
+    timestamp_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> tuple[list[Any], Optional[str]]:
+    """
+    Fetch one page of entities, newest first, continuing after a cursor.
+
+    Rows are ordered by ``(timestamp, id)`` descending and the cursor holds
+    the key of the last row returned, so every page is a range scan of the
+    matching composite index that starts where the previous one stopped,
+    however deep into the listing it is.
+
+    Args:
+        db: Database session
+        statement: Select of a single entity, with any filters and loader options
+        timestamp_column: Creation timestamp column of the entity
+        id_column: Primary key column of the entity
+        limit: Page size
+        cursor: Cursor returned with the previous page, None for the first page
+
+    Returns:
+        Tuple of (entities, cursor for the next page or None on the last page)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if cursor is not None:
+        timestamp, row_id = decode_cursor(cursor)
+        statement = statement.where(tuple_(timestamp_column, id_column) < (timestamp, row_id))
+
+    result = await db.execute(
+        statement
+        .order_by(timestamp_column.desc(), id_column.desc())
+        .limit(limit + 1)
+    )
+    items = list(result.scalars().all())
+    if len(items) <= limit:
+        return items, None
+
+    items = items[:limit]
+    last = items[-1]
+    return items, encode_cursor(getattr(last, timestamp_column.key), getattr(last, id_column.key))
@@ -1,39 +1,294 @@
-from typing import Optional
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Iterable, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from app.models import Profile
+from app.db.fulltext import search_matches
+from app.db.upsert import dialect_name
+from app.models import Profile, Account, AccountType, IPAddress, RawSighting
+from app.repository.cluster_repository import ClusterRepository
+from app.repository.pagination import keyset_page
 from app.schemas.profile_schema import ProfileSchema
 
+# Loads a complete profile document in a fixed number of queries: one per
+# relationship for the whole page of profiles, never one per profile.
+PROFILE_DETAIL_OPTIONS = (
+    selectinload(Profile.primary_accounts),
+    selectinload(Profile.previous_accounts),
+    selectinload(Profile.fake_accounts),
+    selectinload(Profile.ip_adress),
+)
+
 class ProfileRepository:
     @staticmethod
-    def get_by_username(db: Session, username: str) -> Optional[Profile]:
+    async def get_by_username(db: AsyncSession, username: str) -> Optional[Profile]:
         """
         Retrieve a profile by username.
-        
+
         Args:
             db: Database session
             username: Username of the profile to retrieve
+
+        Returns:
+            Profile object if found, None otherwise
+        """
+        result = await db.execute(select(Profile).where(Profile.username == username))
+        return result.scalars().first()
+
+    @staticmethod
+    async def get_detail(db: AsyncSession, profile_id: int) -> Optional[Profile]:
+        """
+        Retrieve a profile with its accounts and IP addresses loaded.
+        
+        Args:
+            db: Database session
+            profile_id: ID of the profile to retrieve
             
         Returns:
             Profile object if found, None otherwise
         """
-        return db.query(Profile).filter(Profile.username == username).first()
+        result = await db.execute(
+            select(Profile).where(Profile.id == profile_id).options(*PROFILE_DETAIL_OPTIONS)
+        )
+        return result.scalars().first()
     
     @staticmethod
-    def create_profile(db: Session, profile: ProfileSchema) -> Profile:
+    async def get_version(db: AsyncSession, profile_id: int) -> Optional[int]:
         """
-        Create a new profile in the database.
+        Retrieve the current version of a profile without loading it.
         
         Args:
             db: Database session
-            profile: Profile object to create
+            profile_id: ID of the profile
+            
+        Returns:
+            Version number if the profile exists, None otherwise
+        """
+        result = await db.execute(select(Profile.version).where(Profile.id == profile_id))
+        return result.scalar_one_or_none()
+    
+    @staticmethod
+    async def bump_versions(db: AsyncSession, profile_ids: Iterable[int]) -> None:
+        """
+        Mark profiles as changed after their accounts or IP addresses were written.
+        
+        Must run in the same transaction as the change. The caller commits.
+        
+        Args:
+            db: Database session
+            profile_ids: IDs of the changed profiles
+        """
+        profile_ids = list(set(profile_ids))
+        if not profile_ids:
+            return
+        await db.execute(
+            update(Profile)
+            .where(Profile.id.in_(profile_ids))
+            .values(version=Profile.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+    
+    @staticmethod
+    async def list_details(
+        db: AsyncSession,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[Profile], Optional[str]]:
+        """
+        Retrieve a page of profiles with their accounts and IP addresses loaded.
+        
+        Args:
+            db: Database session
+            limit: Maximum number of profiles to return
+            cursor: Cursor returned with the previous page, None for the first page
+            
+        Returns:
+            Tuple of (profiles newest first, cursor for the next page or None)
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        return await keyset_page(
+            db,
+            select(Profile).options(*PROFILE_DETAIL_OPTIONS),
+            Profile.created_at,
+            Profile.id,
+            limit=limit,
+            cursor=cursor,
+        )
+    
+    @staticmethod
+    async def get_existing_usernames(db: AsyncSession, usernames: Iterable[str]) -> set[str]:
+        """
+        Retrieve which of the given usernames already belong to a profile.
+
+        Args:
+            db: Database session
+            usernames: Usernames to check
+
+        Returns:
+            Set of usernames that already exist
+        """
+        result = await db.execute(select(Profile.username).where(Profile.username.in_(list(usernames))))
+        return set(result.scalars().all())
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        query: str,
+        fuzzy: bool = False,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> list[tuple[Profile, float]]:
+        """
+        Search profiles by username, full name or any account nickname.
+        
+        Args:
+            db: Database session
+            query: Search text (at least 3 characters)
+            fuzzy: Match on shared trigrams instead of the exact substring
+            limit: Maximum number of profiles to return
+            offset: Number of ranked profiles to skip
             
+        Returns:
+            List of (profile, score) tuples, best match first (lower score is better)
+            
+        Raises:
+            ValueError: If the query has fewer than 3 characters once whitespace is collapsed
+        """
+        matches = search_matches(dialect_name(db), query, fuzzy=fuzzy)
+        result = await db.execute(
+            select(Profile, matches.c.score)
+            .join(matches, Profile.id == matches.c.profile_id)
+            .order_by(matches.c.score, Profile.id)
+            .limit(limit)
+            .offset(offset)
+        )
+        return [(profile, score) for profile, score in result.all()]
+    
+    @staticmethod
+    async def create_profile(db: AsyncSession, profile: ProfileSchema) -> Profile:
+        """
+        Create a new profile in the database.
+
+        The profile username becomes its primary account, associated accounts
+        are stored as previous accounts and every IP address becomes a sighting,
+        also appended to the raw sighting journal.
+
+        Args:
+            db: Database session
+            profile: Profile object to create
+
         Returns:
             Created Profile object
         """
-        profile = Profile(**profile.model_dump())
-        db.add(profile)
-        db.commit()
-        db.refresh(profile)
-        return profile
\ No newline at end of file
+        new_profile = Profile(**ProfileRepository._profile_row(profile))
+        db.add(new_profile)
+        await db.flush()
+
+        await db.execute(insert(Account), ProfileRepository._account_rows(new_profile.id, profile))
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        ip_rows = ProfileRepository._ip_rows(new_profile.id, profile, now)
+        if ip_rows:
+            await db.execute(insert(IPAddress), ip_rows)
+            await db.execute(insert(RawSighting), ProfileRepository._raw_sighting_rows(new_profile.id, profile, now))
+        await ClusterRepository.link_profiles(db, [new_profile.id])
+        await db.commit()
+        await db.refresh(new_profile)
+        return new_profile
+
+    @staticmethod
+    async def bulk_create_profiles(db: AsyncSession, profiles: list[ProfileSchema]) -> dict[str, int]:
+        """
+        Create many profiles, with their accounts and IP addresses, in one transaction.
+
+        Each table is written with a single multi-row insert; IP addresses
+        are also appended to the raw sighting journal.
+
+        Args:
+            db: Database session
+            profiles: Validated profiles with unique, not yet stored usernames
+
+        Returns:
+            Mapping of username to the ID of the created profile
+        """
+        if not profiles:
+            return {}
+
+        result = await db.execute(
+            insert(Profile).returning(Profile.id, Profile.username),
+            [ProfileRepository._profile_row(profile) for profile in profiles],
+        )
+        profile_ids = {username: profile_id for profile_id, username in result.all()}
+
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        account_rows = []
+        ip_rows = []
+        raw_rows = []
+        for profile in profiles:
+            profile_id = profile_ids[profile.username]
+            account_rows.extend(ProfileRepository._account_rows(profile_id, profile))
+            ip_rows.extend(ProfileRepository._ip_rows(profile_id, profile, now))
+            raw_rows.extend(ProfileRepository._raw_sighting_rows(profile_id, profile, now))
+
+        await db.execute(insert(Account), account_rows)
+        if ip_rows:
+            await db.execute(insert(IPAddress), ip_rows)
+            await db.execute(insert(RawSighting), raw_rows)
+        await ClusterRepository.link_profiles(db, profile_ids.values())
+        await db.commit()
+        return profile_ids
+
+    @staticmethod
+    def _profile_row(profile: ProfileSchema) -> dict[str, Any]:
+        return {
+            "username": profile.username,
+            "full_name": profile.full_name,
+            "email": profile.email,
+            "city": profile.city,
+            "state": profile.state,
+        }
+
+    @staticmethod
+    def _account_rows(profile_id: int, profile: ProfileSchema) -> list[dict[str, Any]]:
+        rows = [{
+            "profile_id": profile_id,
+            "nickname": profile.username,
+            "is_active": True,
+            "account_type": AccountType.PRIMARY.value,
+        }]
+        rows.extend(
+            {
+                "profile_id": profile_id,
+                "nickname": nickname,
+                "is_active": True,
+                "account_type": AccountType.PREVIOUS.value,
+            }
+            for nickname in profile.associated_accounts or []
+        )
+        return rows
+
+    @staticmethod
+    def _ip_rows(profile_id: int, profile: ProfileSchema, seen_at: datetime) -> list[dict[str, Any]]:
+        # One row per distinct address; repeats only count as extra hits
+        return [
+            {
+                "profile_id": profile_id,
+                "ip_address": ip_address,
+                "first_seen": seen_at,
+                "last_seen": seen_at,
+                "hit_count": hits,
+            }
+            for ip_address, hits in Counter(profile.ip_addresses or []).items()
+        ]
+
+    @staticmethod
+    def _raw_sighting_rows(profile_id: int, profile: ProfileSchema, seen_at: datetime) -> list[dict[str, Any]]:
+        # One journal row per sighting, repeats included, like the sightings API
+        return [
+            {"profile_id": profile_id, "ip_address": ip_address, "seen_at": seen_at}
+            for ip_address in profile.ip_addresses or []
+        ]
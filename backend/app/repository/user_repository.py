@@ -1,7 +1,9 @@
-from typing import Optional
-from sqlalchemy.orm import Session
+from typing import Iterable, Optional
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import User
+from app.repository.pagination import keyset_page
 
 class UserRepository:
     """
@@ -9,7 +11,7 @@ class UserRepository:
     """
 
     @staticmethod
-    def get_by_username(db: Session, username: str) -> Optional[User]:
+    async def get_by_username(db: AsyncSession, username: str) -> Optional[User]:
         """
         Retrieve a user by username.
         
@@ -20,10 +22,11 @@ class UserRepository:
         Returns:
             User object if found, None otherwise
         """
-        return db.query(User).filter(User.username == username).first()
+        result = await db.execute(select(User).where(User.username == username))
+        return result.scalars().first()
     
     @staticmethod
-    def get_by_id(db: Session, user_id: int) -> Optional[User]:
+    async def get_by_id(db: AsyncSession, user_id: int) -> Optional[User]:
         """
         Retrieve a user by ID.
         
@@ -34,10 +37,48 @@ class UserRepository:
         Returns:
             User object if found, None otherwise
         """
-        return db.query(User).filter(User.id == user_id).first()
+        result = await db.execute(select(User).where(User.id == user_id))
+        return result.scalars().first()
     
     @staticmethod
-    def create_user(db: Session, username: str, hashed_password: str) -> User:
+    async def get_existing_usernames(db: AsyncSession, usernames: Iterable[str]) -> set[str]:
+        """
+        Retrieve which of the given usernames are already taken, in one query.
+        
+        Args:
+            db: Database session
+            usernames: Usernames to check
+            
+        Returns:
+            Set of usernames that already exist
+        """
+        result = await db.execute(select(User.username).where(User.username.in_(list(usernames))))
+        return set(result.scalars().all())
+    
+    @staticmethod
+    async def list_users(
+        db: AsyncSession,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[User], Optional[str]]:
+        """
+        Retrieve a page of users.
+        
+        Args:
+            db: Database session
+            limit: Maximum number of users to return
+            cursor: Cursor returned with the previous page, None for the first page
+            
+        Returns:
+            Tuple of (users newest first, cursor for the next page or None)
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        return await keyset_page(db, select(User), User.timestamp, User.id, limit=limit, cursor=cursor)
+    
+    @staticmethod
+    async def create_user(db: AsyncSession, username: str, hashed_password: str) -> User:
         """
         Create a new user in the database.
         
@@ -50,12 +91,35 @@ class UserRepository:
         """
         user = User(username=username, hashed_password=hashed_password)
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        await db.commit()
+        await db.refresh(user)
         return user
     
     @staticmethod
-    def update_user(db: Session, user: User, username: str, hashed_password: str) -> User:
+    async def bulk_create_users(db: AsyncSession, credentials: list[tuple[str, str]]) -> dict[str, User]:
+        """
+        Create many users with a single multi-row insert, in one transaction.
+        
+        Args:
+            db: Database session
+            credentials: (username, hashed password) pairs with unique, not yet stored usernames
+            
+        Returns:
+            Mapping of username to the created User object
+        """
+        if not credentials:
+            return {}
+        
+        result = await db.scalars(
+            insert(User).returning(User),
+            [{"username": username, "hashed_password": hashed_password} for username, hashed_password in credentials],
+        )
+        users = {user.username: user for user in result.all()}
+        await db.commit()
+        return users
+    
+    @staticmethod
+    async def update_user(db: AsyncSession, user: User, username: str, hashed_password: str) -> User:
         """
         Update an existing user in the database.
         
@@ -68,6 +132,6 @@ class UserRepository:
         """
         user.username = username
         user.hashed_password = hashed_password
-        db.commit()
-        db.refresh(user)
+        await db.commit()
+        await db.refresh(user)
         return user
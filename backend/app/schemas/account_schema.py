@@ -0,0 +1,28 @@
+from pydantic import BaseModel, ConfigDict
+
+class AccountResponse(BaseModel):
+    """
+    Response schema for an account attached to a profile.
+    
+    Attributes:
+        id: Unique identifier for the account
+        nickname: Nickname of the account
+        is_active: Indicates if the account is active
+        account_type: Type of the account (primary, previous, fake)
+    """
+    id: int
+    nickname: str
+    is_active: bool
+    account_type: str
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "id": 1,
+                "nickname": "johndoe",
+                "is_active": True,
+                "account_type": "primary"
+            }
+        }
+    )
@@ -0,0 +1,150 @@
+import ipaddress
+from datetime import date, datetime, timezone
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from app.core.config import settings
+
+class IPAddressResponse(BaseModel):
+    """
+    Response schema for an IP address seen on a profile.
+    
+    Attributes:
+        id: Unique identifier for the sighting
+        profile_id: Profile the address was seen on
+        ip_address: IP address in text form
+        timestamp: When the address was recorded
+        first_seen: Earliest sighting of the address on the profile
+        last_seen: Latest sighting of the address on the profile
+        hit_count: Number of sightings of the address on the profile
+    """
+    id: int
+    profile_id: int
+    ip_address: str
+    timestamp: datetime
+    first_seen: datetime
+    last_seen: datetime
+    hit_count: int
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "id": 1,
+                "profile_id": 1,
+                "ip_address": "177.12.4.2",
+                "timestamp": "2025-05-24T12:00:00",
+                "first_seen": "2025-05-24T12:00:00",
+                "last_seen": "2025-06-02T08:30:00",
+                "hit_count": 42
+            }
+        }
+    )
+
+class IPSighting(BaseModel):
+    """
+    Schema for one observation of an IP address on a profile.
+    
+    Attributes:
+        profile_id: Profile the address was seen on
+        ip_address: IPv4 or IPv6 address, normalized
+        seen_at: When it was seen (UTC); defaults to the time it is recorded
+    """
+    profile_id: int
+    ip_address: str
+    seen_at: Optional[datetime] = None
+
+    @field_validator("ip_address")
+    def validate_ip_address(cls, ip_address: str) -> str:
+        """
+        Validate and normalize the IP address.
+        
+        Raises:
+            ValueError: If the value is not a valid IPv4 or IPv6 address
+        """
+        return str(ipaddress.ip_address(ip_address.strip()))
+
+    @field_validator("seen_at")
+    def validate_seen_at(cls, seen_at: Optional[datetime]) -> Optional[datetime]:
+        """
+        Store times as naive UTC, like the database timestamps.
+        """
+        if seen_at is not None and seen_at.tzinfo is not None:
+            seen_at = seen_at.astimezone(timezone.utc).replace(tzinfo=None)
+        return seen_at
+
+class IPSightingBatch(BaseModel):
+    """
+    Schema for a batch of IP address sightings.
+    
+    Attributes:
+        sightings: Observations to record, in any order; repeats are aggregated
+    """
+    sightings: list[IPSighting] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.IP_SIGHTING_BATCH_MAX_SIZE,
+        description="Observations to record",
+    )
+
+class IPSightingReport(BaseModel):
+    """
+    Schema for the result of recording a batch of sightings.
+    
+    Attributes:
+        received: Number of sightings in the batch
+        recorded: Number of distinct (profile, address) pairs written
+        unknown_profile_ids: Profiles that do not exist; their sightings were skipped
+    """
+    received: int = 0
+    recorded: int = 0
+    unknown_profile_ids: list[int] = Field(default_factory=list)
+
+class IPDailyActivity(BaseModel):
+    """
+    Response schema for the sightings of an address on a profile during one day.
+    
+    Attributes:
+        ip_address: IP address in text form
+        day: Day of the sightings (UTC)
+        first_seen: Earliest sighting that day
+        last_seen: Latest sighting that day
+        hit_count: Number of sightings that day
+    """
+    ip_address: str
+    day: date
+    first_seen: datetime
+    last_seen: datetime
+    hit_count: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+class IPProfileLookupResponse(BaseModel):
+    """
+    Response schema for an IP to profile lookup.
+    
+    Attributes:
+        query: The address, prefix or CIDR block that was looked up
+        profile_ids: IDs of the profiles seen on it
+    """
+    query: str
+    profile_ids: list[int]
+
+class IPIndexStats(BaseModel):
+    """
+    Response schema for the in-memory IP index statistics.
+    
+    Attributes:
+        ready: Whether the index has been built
+        addresses: Number of distinct addresses indexed
+        entries: Number of (address, profile) pairs indexed
+        nodes: Number of trie nodes
+        memory_bytes: Estimated memory held by the trie
+        build_seconds: Duration of the last full build
+    """
+    ready: bool
+    addresses: int
+    entries: int
+    nodes: int
+    memory_bytes: int
+    build_seconds: Optional[float] = None
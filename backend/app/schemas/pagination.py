@@ -0,0 +1,15 @@
+from typing import Generic, Optional, TypeVar
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+class Page(BaseModel, Generic[T]):
+    """
+    Response schema for one page of a keyset-paginated listing.
+    
+    Attributes:
+        items: Entries of the page, newest first
+        next_cursor: Opaque cursor to pass as ``cursor`` for the next page, None on the last page
+    """
+    items: list[T]
+    next_cursor: Optional[str] = None
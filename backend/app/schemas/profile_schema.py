@@ -1,6 +1,11 @@
-from pydantic import BaseModel, EmailStr, Field
+import ipaddress
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 from typing import Optional
 
+from app.schemas.account_schema import AccountResponse
+from app.schemas.ip_address_schema import IPAddressResponse
+
 class ProfileSchema(BaseModel):
     """
     Schema for user profile data.
@@ -13,6 +18,17 @@ class ProfileSchema(BaseModel):
     associated_accounts: Optional[list[str]] = Field(None, description="List of associated accounts")
     ip_addresses: Optional[list[str]] = Field(None, description="List of IP addresses associated with the user")
     
+    @field_validator("ip_addresses")
+    def validate_ip_addresses(cls, ip_addresses: Optional[list[str]]) -> Optional[list[str]]:
+        """
+        Validate and normalize every IP address.
+        
+        Raises:
+            ValueError: If any entry is not a valid IPv4 or IPv6 address
+        """
+        if ip_addresses is None:
+            return None
+        return [str(ipaddress.ip_address(address.strip())) for address in ip_addresses]
 
     class Config:
         orm_mode = True
@@ -35,11 +51,99 @@ class ProfileResponse(BaseModel):
     id: int
     username: str
 
-    class Config:
-        orm_mode = True
-        schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "username": "johndoe",
             }
-        }
+        },
+    )
+
+class ProfileImportError(BaseModel):
+    """
+    Schema for a rejected line of a profile import.
+    
+    Attributes:
+        line: 1-based line number in the NDJSON input
+        error: Reason the line was rejected
+    """
+    line: int
+    error: str
+
+class ProfileImportReport(BaseModel):
+    """
+    Schema for the result of a profile import.
+    
+    Attributes:
+        processed: Number of non-empty lines read
+        created: Number of profiles created
+        failed: Number of lines rejected
+        errors: Details of rejected lines (truncated to the configured maximum)
+    """
+    processed: int = 0
+    created: int = 0
+    failed: int = 0
+    errors: list[ProfileImportError] = Field(default_factory=list)
+
+class ProfileSearchResult(BaseModel):
+    """
+    Schema for a ranked profile search hit.
+    
+    Attributes:
+        id: Unique identifier for the profile
+        username: Username of the profile
+        full_name: Full name of the profile
+        score: Relevance score, lower is better
+    """
+    id: int
+    username: str
+    full_name: Optional[str] = None
+    score: float
+
+class ProfileClusterResponse(BaseModel):
+    """
+    Response schema for an actor cluster.
+    
+    Attributes:
+        cluster_id: Smallest profile ID in the cluster
+        profiles: Member profiles ordered by ID
+    """
+    cluster_id: int
+    profiles: list[ProfileResponse]
+
+class ProfileDetail(BaseModel):
+    """
+    Schema for a complete profile document.
+    
+    Attributes:
+        id: Unique identifier for the profile
+        username: Username of the profile
+        full_name: Full name of the profile
+        email: Email address of the profile
+        city: City of the profile
+        state: State of the profile
+        created_at: When the profile was created
+        cluster_id: Actor cluster the profile belongs to
+        version: Incremented whenever the document changes
+        current_account: Active primary account, if any
+        previous_accounts: Accounts the actor used before
+        fake_accounts: Accounts known to be fake
+        ip_addresses: IP address sightings
+    """
+    id: int
+    username: str
+    full_name: Optional[str] = None
+    email: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    created_at: datetime
+    cluster_id: Optional[int] = None
+    version: int = 1
+    current_account: Optional[AccountResponse] = None
+    previous_accounts: list[AccountResponse] = Field(default_factory=list)
+    fake_accounts: list[AccountResponse] = Field(default_factory=list)
+    ip_addresses: list[IPAddressResponse] = Field(default_factory=list, validation_alias="ip_adress")
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
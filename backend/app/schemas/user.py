@@ -1,7 +1,9 @@
 import re
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
+from app.core.config import settings
+
 class UserSchema(BaseModel):
     """
     Schema for user creation requests.
@@ -116,4 +118,48 @@ class UserPublic(BaseModel):
                 "is_admin": False
             }
         }
-    )
\ No newline at end of file
+    )
+
+class UserBatchCreate(BaseModel):
+    """
+    Schema for batch user creation requests.
+    
+    Attributes:
+        users: Accounts to create, each validated like a single registration
+    """
+    users: list[UserSchema] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.USER_BATCH_MAX_SIZE,
+        description="Accounts to create",
+    )
+
+class UserBatchResult(BaseModel):
+    """
+    Schema for the outcome of one account of a batch creation.
+    
+    Attributes:
+        index: Position of the account in the request
+        username: Requested username
+        created: Whether the account was created
+        user: Created user, when created
+        error: Reason the account was rejected, when not created
+    """
+    index: int
+    username: str
+    created: bool
+    user: Optional[UserResponse] = None
+    error: Optional[str] = None
+
+class UserBatchReport(BaseModel):
+    """
+    Schema for the result of a batch user creation.
+    
+    Attributes:
+        created: Number of accounts created
+        failed: Number of accounts rejected
+        results: One result per requested account, in request order
+    """
+    created: int = 0
+    failed: int = 0
+    results: list[UserBatchResult] = Field(default_factory=list)
@@ -1,8 +1,21 @@
-from .password_service import get_password_hash, verify_password
+from .password_service import (
+    get_password_hash,
+    verify_password,
+    hash_password_async,
+    verify_password_async,
+)
 from .token_service import create_access_token
+from .token_cache import TokenCache, token_cache
+from .login_limiter import LoginRateLimiter, login_limiter
 
 __all__ = [
     "get_password_hash",
     "verify_password",
+    "hash_password_async",
+    "verify_password_async",
     "create_access_token",
+    "TokenCache",
+    "token_cache",
+    "LoginRateLimiter",
+    "login_limiter",
 ]
\ No newline at end of file
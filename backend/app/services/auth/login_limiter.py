@@ -0,0 +1,122 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from app.core.config import settings
+
+class LoginRateLimiter:
+    """
+    Token-bucket admission control for login attempts.
+
+    Every attempt takes one token from the bucket of its username and one
+    from the bucket of its client IP before any database lookup or password
+    hashing happens; buckets refill continuously at a fixed rate. A bucket is
+    two floats (tokens left, last update), and buckets are kept in
+    least-recently-updated order so those that have refilled completely,
+    which are indistinguishable from absent ones, are dropped from the front
+    in O(1). The number of tracked keys is also capped.
+    """
+
+    def __init__(
+        self,
+        username_burst: int,
+        username_per_minute: float,
+        ip_burst: int,
+        ip_per_minute: float,
+        max_keys: int,
+    ):
+        self.max_keys = max_keys
+        # scope -> (capacity, tokens per second); a burst or rate of 0 disables the scope
+        self._policies: dict[str, tuple[float, float]] = {
+            scope: (float(burst), per_minute / 60) if burst > 0 and per_minute > 0 else (0.0, 0.0)
+            for scope, burst, per_minute in (
+                ("username", username_burst, username_per_minute),
+                ("ip", ip_burst, ip_per_minute),
+            )
+        }
+        self._buckets: OrderedDict[tuple[str, str], tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, username: str, client_ip: Optional[str]) -> float:
+        """
+        Admit a login attempt if both its username and its client IP have a token left.
+
+        Tokens are taken from both buckets or from neither.
+
+        Args:
+            username: Submitted username
+            client_ip: Address of the client, None if unknown
+
+        Returns:
+            0 if the attempt is admitted, otherwise seconds until it would be
+        """
+        keys = [
+            (scope, value)
+            for scope, value in (("username", username), ("ip", client_ip))
+            if value and self._policies[scope][0] > 0
+        ]
+        if not keys:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+
+            levels = {key: self._level(key, now) for key in keys}
+            wait = max(
+                ((1 - level) / self._policies[key[0]][1] for key, level in levels.items() if level < 1),
+                default=0.0,
+            )
+            if wait > 0:
+                return wait
+
+            for key, level in levels.items():
+                self._buckets[key] = (level - 1, now)
+                self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return 0.0
+
+    def reset_username(self, username: str) -> None:
+        """
+        Refill a username's bucket, e.g. after a successful login.
+
+        Args:
+            username: Username to reset
+        """
+        with self._lock:
+            self._buckets.pop(("username", username), None)
+
+    def clear(self) -> None:
+        """
+        Drop every bucket.
+        """
+        with self._lock:
+            self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def _level(self, key: tuple[str, str], now: float) -> float:
+        capacity, rate = self._policies[key[0]]
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return capacity
+        tokens, updated = bucket
+        return min(capacity, tokens + (now - updated) * rate)
+
+    def _expire(self, now: float) -> None:
+        while self._buckets:
+            key = next(iter(self._buckets))
+            if self._level(key, now) < self._policies[key[0]][0]:
+                return
+            del self._buckets[key]
+
+login_limiter = LoginRateLimiter(
+    username_burst=settings.LOGIN_LIMIT_USERNAME_BURST,
+    username_per_minute=settings.LOGIN_LIMIT_USERNAME_PER_MINUTE,
+    ip_burst=settings.LOGIN_LIMIT_IP_BURST,
+    ip_per_minute=settings.LOGIN_LIMIT_IP_PER_MINUTE,
+    max_keys=settings.LOGIN_LIMIT_MAX_KEYS,
+)
@@ -1,28 +1,188 @@
-from passlib.context import CryptContext
+import asyncio
+import functools
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.config import settings
+from app.exceptions import PasswordHashQueueFullException
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+T = TypeVar("T")
+
+@functools.cache
+def get_pwd_context() -> "CryptContext":
+    """
+    Returns the bcrypt hashing context, importing passlib on first use.
+
+    passlib and its bcrypt backend are only needed to hash or verify a
+    password, so they stay out of worker startup.
+
+    Returns:
+        CryptContext: The shared hashing context.
+    """
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# Hashing runs in worker processes so bcrypt never holds the event loop's GIL.
+# The semaphore bounds running + queued jobs; beyond it callers are rejected.
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+_hash_slots = threading.BoundedSemaphore(
+    settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_QUEUE_SIZE
+)
 
 def get_password_hash(password: str) -> str:
     """
     Hashes a password using bcrypt.
-    
+
     Args:
         password (str): The password to hash.
-        
+
     Returns:
         str: The hashed password.
     """
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
+
+def get_password_hashes(passwords: list[str]) -> list[str]:
+    """
+    Hashes several passwords using bcrypt, in order.
+
+    Args:
+        passwords (list[str]): The passwords to hash.
+
+    Returns:
+        list[str]: The hashed passwords, in the same order.
+    """
+    context = get_pwd_context()
+    return [context.hash(password) for password in passwords]
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verifies a plain password against a hashed password.
-    
+
+    Args:
+        plain_password (str): The plain password to verify.
+        hashed_password (str): The hashed password to verify against.
+
+    Returns:
+        bool: True if the password is valid, False otherwise.
+    """
+    return get_pwd_context().verify(plain_password, hashed_password)
+
+def get_password_executor() -> ProcessPoolExecutor:
+    """
+    Returns the process pool used for password hashing, creating it on first use.
+
+    Returns:
+        ProcessPoolExecutor: The shared hashing executor.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+def shutdown_password_executor() -> None:
+    """
+    Shuts down the hashing process pool, if it was started.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True, cancel_futures=True)
+            _executor = None
+
+async def _run_in_hash_pool(func: Callable[..., T], *args: Any) -> T:
+    """
+    Runs a hashing function in the process pool without blocking the event loop.
+
+    Raises:
+        PasswordHashQueueFullException: If the pool already has its maximum
+            number of running and queued jobs.
+    """
+    if not _hash_slots.acquire(blocking=False):
+        raise PasswordHashQueueFullException()
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_password_executor(), func, *args)
+    finally:
+        _hash_slots.release()
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hashes a password using bcrypt in the hashing process pool.
+
+    Args:
+        password (str): The password to hash.
+
+    Returns:
+        str: The hashed password.
+
+    Raises:
+        PasswordHashQueueFullException: If the hashing queue is full.
+    """
+    return await _run_in_hash_pool(get_password_hash, password)
+
+async def hash_passwords_async(passwords: list[str]) -> list[str]:
+    """
+    Hashes many passwords in parallel across the hashing process pool.
+
+    The passwords are split into one chunk per pool worker and each chunk is
+    hashed by a single job, so a batch takes at most one queue slot per
+    worker and pays one round trip per chunk instead of one per password.
+
+    Args:
+        passwords (list[str]): The passwords to hash.
+
+    Returns:
+        list[str]: The hashed passwords, in the same order.
+
+    Raises:
+        PasswordHashQueueFullException: If the hashing queue cannot take
+            every chunk of the batch.
+    """
+    if not passwords:
+        return []
+    chunk_count = min(settings.PASSWORD_HASH_WORKERS, len(passwords))
+    chunk_size = -(-len(passwords) // chunk_count)
+    chunks = [passwords[start:start + chunk_size] for start in range(0, len(passwords), chunk_size)]
+
+    acquired = 0
+    try:
+        for _ in chunks:
+            if not _hash_slots.acquire(blocking=False):
+                raise PasswordHashQueueFullException()
+            acquired += 1
+        loop = asyncio.get_running_loop()
+        executor = get_password_executor()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(executor, get_password_hashes, chunk) for chunk in chunks)
+        )
+    finally:
+        for _ in range(acquired):
+            _hash_slots.release()
+    return [hashed for chunk in results for hashed in chunk]
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verifies a plain password against a hashed password in the hashing process pool.
+
     Args:
         plain_password (str): The plain password to verify.
         hashed_password (str): The hashed password to verify against.
-        
+
     Returns:
         bool: True if the password is valid, False otherwise.
+
+    Raises:
+        PasswordHashQueueFullException: If the hashing queue is full.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return await _run_in_hash_pool(verify_password, plain_password, hashed_password)
@@ -0,0 +1,120 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from app.core.config import settings
+from app.schemas.user import UserPublic
+
+class TokenCache:
+    """
+    TTL + LRU cache of verified access tokens.
+
+    Entries are keyed by the SHA-256 digest of the token (the raw token is never
+    kept) and hold the decoded claims together with a snapshot of the user, so
+    authenticated requests can skip both JWT decoding and the user lookup.
+    An entry never outlives the token's own ``exp`` claim.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any], UserPublic]] = OrderedDict()
+        self._keys_by_user: dict[int, set[str]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _digest(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[tuple[dict[str, Any], UserPublic]]:
+        """
+        Retrieve the cached claims and user snapshot for a token.
+
+        Args:
+            token: Raw bearer token
+
+        Returns:
+            Tuple of (claims, user) if cached and not expired, None otherwise
+        """
+        key = self._digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, claims, user = entry
+            if expires_at <= time.monotonic():
+                self._discard(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return claims, user
+
+    def set(self, token: str, claims: dict[str, Any], user: UserPublic) -> None:
+        """
+        Cache the verified claims and user snapshot for a token.
+
+        Args:
+            token: Raw bearer token
+            claims: Decoded JWT payload
+            user: Snapshot of the authenticated user
+        """
+        if self.max_size <= 0:
+            return
+
+        ttl = self.ttl_seconds
+        if "exp" in claims:
+            ttl = min(ttl, float(claims["exp"]) - time.time())
+        if ttl <= 0:
+            return
+
+        key = self._digest(token)
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (time.monotonic() + ttl, claims, user)
+            self._keys_by_user.setdefault(user.id, set()).add(key)
+
+            while len(self._entries) > self.max_size:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """
+        Drop every cached token belonging to a user.
+
+        Args:
+            user_id: ID of the user whose tokens should be dropped
+        """
+        with self._lock:
+            for key in list(self._keys_by_user.get(user_id, ())):
+                self._discard(key)
+
+    def clear(self) -> None:
+        """
+        Drop every cached token.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        user_id = entry[2].id
+        keys = self._keys_by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[user_id]
+
+token_cache = TokenCache(
+    max_size=settings.TOKEN_CACHE_MAX_SIZE,
+    ttl_seconds=settings.TOKEN_CACHE_TTL_SECONDS,
+)
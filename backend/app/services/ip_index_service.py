@@ -0,0 +1,193 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.core.config import settings
+from app.models import IPAddress
+from app.utils.ip import pack_ip_address, parse_ip_prefix
+from app.utils.ip_trie import IPTrie
+
+logger = logging.getLogger(__name__)
+
+LOAD_BATCH_SIZE = 10_000
+
+# Session.info key of the sightings written in the open transaction
+PENDING_SIGHTINGS_KEY = "ip_index_pending_sightings"
+
+class IPIndex:
+    """
+    In-process IP/subnet -> profile ID index backed by a Patricia trie.
+
+    The trie is built from ``ip_addresses`` at startup, extended when a
+    session of this process commits inserted sightings (see the session
+    event hooks below), and caught up periodically with rows
+    written by other workers (tracked by the highest ``ip_addresses.id`` seen).
+
+    IDs are handed out before commit (PostgreSQL sequences), so a row can
+    become visible after one with a higher ID was indexed. Each sync therefore
+    re-scans from the watermark it held ``overlap_seconds`` ago; adding a
+    sighting twice is a no-op. Only rows committed later than that behind a
+    higher ID wait for the next rebuild.
+    """
+
+    def __init__(self, overlap_seconds: float = settings.IP_INDEX_SYNC_OVERLAP_SECONDS):
+        self._trie = IPTrie()
+        self._last_id = 0
+        # (monotonic time, highest ID indexed by then), oldest first
+        self._watermarks: deque[tuple[float, int]] = deque()
+        self.overlap_seconds = overlap_seconds
+        self.ready = False
+        self.build_seconds: Optional[float] = None
+
+    async def rebuild(self, db: AsyncSession) -> None:
+        """
+        Build a fresh trie from every stored sighting and swap it in.
+
+        Args:
+            db: Database session
+        """
+        started = time.perf_counter()
+        trie = IPTrie()
+        last_id = await self._load(db, trie, after_id=0)
+        self._trie = trie
+        self._last_id = last_id
+        self._watermarks = deque([(time.monotonic(), last_id)])
+        self.ready = True
+        self.build_seconds = time.perf_counter() - started
+        logger.info(
+            f"IP index built: {len(trie)} addresses, {trie.entries} entries "
+            f"in {self.build_seconds:.3f}s (~{trie.memory_bytes() / 1_048_576:.1f} MiB)"
+        )
+
+    async def sync(self, db: AsyncSession) -> None:
+        """
+        Add sightings stored since the last build or sync.
+
+        Rows are read from the oldest watermark still inside the overlap
+        window, so sightings whose transaction committed after a higher ID
+        was indexed are picked up too.
+
+        Args:
+            db: Database session
+        """
+        now = time.monotonic()
+        while len(self._watermarks) > 1 and self._watermarks[1][0] <= now - self.overlap_seconds:
+            self._watermarks.popleft()
+        after_id = self._watermarks[0][1] if self._watermarks else self._last_id
+        last_id = await self._load(db, self._trie, after_id=after_id)
+        self._last_id = max(self._last_id, last_id)
+        self._watermarks.append((now, self._last_id))
+
+    async def refresh_periodically(self, session_factory: async_sessionmaker, interval: float) -> None:
+        """
+        Keep the index in sync with the database until cancelled.
+
+        Args:
+            session_factory: Factory for read sessions
+            interval: Seconds between syncs
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with session_factory() as db:
+                    await self.sync(db)
+            except Exception as e:
+                logger.error(f"Error refreshing IP index: {e}")
+
+    def add_many(self, rows: Iterable[dict[str, Any]]) -> None:
+        """
+        Add freshly inserted sightings to the index.
+
+        Args:
+            rows: Mappings with ``ip_address`` and ``profile_id`` keys; others are skipped
+        """
+        for row in rows:
+            if "ip_address" not in row or "profile_id" not in row:
+                continue
+            packed = pack_ip_address(row["ip_address"])
+            if packed is not None:
+                self._trie.add(int.from_bytes(packed, "big"), row["profile_id"])
+
+    def lookup(self, query: str) -> list[int]:
+        """
+        Retrieve the IDs of profiles seen on an address, prefix or CIDR block.
+
+        Args:
+            query: Address, prefix (``177.12.``) or network (``177.12.0.0/16``)
+
+        Returns:
+            Sorted list of distinct profile IDs
+
+        Raises:
+            ValueError: If the query is not a valid address, prefix or network
+        """
+        key, length = parse_ip_prefix(query)
+        return sorted(self._trie.get_prefix(key, length))
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Report the size of the index.
+
+        Returns:
+            Mapping with address, entry and node counts, estimated memory and build time
+        """
+        return {
+            "ready": self.ready,
+            "addresses": len(self._trie),
+            "entries": self._trie.entries,
+            "nodes": self._trie.node_count(),
+            "memory_bytes": self._trie.memory_bytes(),
+            "build_seconds": self.build_seconds,
+        }
+
+    @staticmethod
+    async def _load(db: AsyncSession, trie: IPTrie, after_id: int) -> int:
+        result = await db.stream(
+            select(IPAddress.id, IPAddress.ip_numeric, IPAddress.profile_id)
+            .where(IPAddress.id > after_id, IPAddress.ip_numeric.is_not(None))
+            .order_by(IPAddress.id)
+            .execution_options(yield_per=LOAD_BATCH_SIZE)
+        )
+        last_id = after_id
+        async for rows in result.partitions():
+            for row_id, ip_numeric, profile_id in rows:
+                trie.add(int.from_bytes(ip_numeric, "big"), profile_id)
+            last_id = rows[-1][0]
+        return last_id
+
+ip_index = IPIndex()
+
+@event.listens_for(Session, "do_orm_execute")
+def collect_inserted_sightings(state: ORMExecuteState) -> None:
+    """
+    Remember the sightings a session inserts, so they are indexed once it commits.
+
+    Repositories write ``ip_addresses`` with multi-row inserts and upserts;
+    their parameters are the rows to index.
+    """
+    if not state.is_insert or state.bind_mapper is not IPAddress.__mapper__ or not state.parameters:
+        return
+    rows = state.parameters if isinstance(state.parameters, list) else [state.parameters]
+    state.session.info.setdefault(PENDING_SIGHTINGS_KEY, []).extend(rows)
+
+@event.listens_for(Session, "after_commit")
+def index_committed_sightings(session: Session) -> None:
+    """
+    Add the sightings of a committed transaction to the index.
+    """
+    rows = session.info.pop(PENDING_SIGHTINGS_KEY, None)
+    if rows:
+        ip_index.add_many(rows)
+
+@event.listens_for(Session, "after_rollback")
+def discard_rolled_back_sightings(session: Session) -> None:
+    """
+    Forget the sightings of a rolled back transaction.
+    """
+    session.info.pop(PENDING_SIGHTINGS_KEY, None)
@@ -0,0 +1,251 @@
+import csv
+import io
+import json
+import zlib
+from typing import Any, AsyncIterator, Iterable, Optional, Protocol
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models import Profile
+from app.repository.profile_repository import PROFILE_DETAIL_OPTIONS
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+EXPORT_COMPRESSIONS = {
+    "gzip": ("application/gzip", ".gz"),
+    "zstd": ("application/zstd", ".zst"),
+}
+
+CSV_COLUMNS = (
+    "id",
+    "username",
+    "full_name",
+    "email",
+    "city",
+    "state",
+    "created_at",
+    "cluster_id",
+    "associated_accounts",
+    "fake_accounts",
+    "ip_addresses",
+)
+
+class _Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+    def flush(self) -> bytes: ...
+
+def _profile_record(profile: Profile) -> dict[str, Any]:
+    """
+    Flatten a loaded profile into an export record.
+
+    The record uses the field names of ``ProfileSchema``, so an NDJSON export
+    can be loaded back with the profile import.
+    """
+    return {
+        "id": profile.id,
+        "username": profile.username,
+        "full_name": profile.full_name,
+        "email": profile.email,
+        "city": profile.city,
+        "state": profile.state,
+        "created_at": profile.created_at.isoformat() if profile.created_at else None,
+        "cluster_id": profile.cluster_id,
+        "associated_accounts": [account.nickname for account in profile.previous_accounts],
+        "fake_accounts": [account.nickname for account in profile.fake_accounts],
+        "ip_addresses": [ip.ip_address for ip in profile.ip_adress],
+    }
+
+def encode_ndjson(records: Iterable[dict[str, Any]]) -> bytes:
+    """
+    Encode records as NDJSON, one object per line.
+
+    Uses orjson when it is installed; records are plain dicts, so this is
+    the one path where it beats pydantic-core serialization.
+
+    Args:
+        records: Export records
+
+    Returns:
+        UTF-8 encoded lines
+    """
+    if orjson is not None:
+        return b"".join(orjson.dumps(record) + b"\n" for record in records)
+    return b"".join(
+        json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode() + b"\n"
+        for record in records
+    )
+
+def encode_csv(records: Iterable[dict[str, Any]], header: bool = False) -> bytes:
+    """
+    Encode records as CSV rows. List fields are joined with commas.
+
+    Args:
+        records: Export records
+        header: Whether to start with the column names
+
+    Returns:
+        UTF-8 encoded rows
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(CSV_COLUMNS)
+    for record in records:
+        writer.writerow(
+            ",".join(value) if isinstance(value, list) else value
+            for value in (record[column] for column in CSV_COLUMNS)
+        )
+    return buffer.getvalue().encode()
+
+def _get_compressor(compression: Optional[str]) -> Optional[_Compressor]:
+    if compression is None:
+        return None
+    if compression == "gzip":
+        return zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ValueError("zstd compression requires the 'zstandard' package") from e
+        return zstandard.ZstdCompressor(level=settings.PROFILE_EXPORT_ZSTD_LEVEL).compressobj()
+    raise ValueError(f"Unsupported compression '{compression}'")
+
+class ProfileExportService:
+    """
+    Service for streaming full profile dumps, with accounts and IP addresses.
+    """
+
+    @staticmethod
+    def media_type(export_format: str, compression: Optional[str] = None) -> str:
+        """
+        Content type of an export.
+
+        Args:
+            export_format: ``ndjson`` or ``csv``
+            compression: ``gzip``, ``zstd`` or None
+
+        Returns:
+            MIME type of the (possibly compressed) body
+        """
+        if compression is not None:
+            return EXPORT_COMPRESSIONS[compression][0]
+        return EXPORT_FORMATS[export_format]
+
+    @staticmethod
+    def filename(export_format: str, compression: Optional[str] = None) -> str:
+        """
+        Suggested file name of an export.
+
+        Args:
+            export_format: ``ndjson`` or ``csv``
+            compression: ``gzip``, ``zstd`` or None
+
+        Returns:
+            File name such as ``profiles.ndjson.gz``
+        """
+        suffix = EXPORT_COMPRESSIONS[compression][1] if compression is not None else ""
+        return f"profiles.{export_format}{suffix}"
+
+    @staticmethod
+    async def iter_record_batches(
+        db: AsyncSession,
+        batch_size: Optional[int] = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Stream every profile as export records, ordered by ID.
+
+        Profiles are read from a server-side cursor ``batch_size`` rows at a
+        time and accounts and IP addresses are eager loaded once per batch.
+        Only plain records leave this function, so each batch of ORM objects
+        is expunged from the session as soon as it is serialized; the memory
+        held stays bounded by one batch however the objects are referenced.
+        The session should be dedicated to the export, since every object in
+        it is expunged.
+
+        Args:
+            db: Database session
+            batch_size: Number of profiles per batch
+
+        Yields:
+            Lists of at most ``batch_size`` records
+        """
+        batch_size = batch_size or settings.PROFILE_EXPORT_BATCH_SIZE
+        result = await db.stream(
+            select(Profile)
+            .options(*PROFILE_DETAIL_OPTIONS)
+            .order_by(Profile.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for partition in result.scalars().partitions():
+            records = [_profile_record(profile) for profile in partition]
+            # expunge_all() would swap the identity map under the open cursor;
+            # expunging a profile cascades to some of its children
+            for instance in list(db.identity_map.values()):
+                if instance in db:
+                    db.expunge(instance)
+            yield records
+
+    @staticmethod
+    def export(
+        db: AsyncSession,
+        export_format: str = "ndjson",
+        compression: Optional[str] = None,
+        batch_size: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Build the byte stream of a full profile export.
+
+        Options are validated eagerly, so an unsupported format or a missing
+        compression library is reported before any output is produced.
+
+        Args:
+            db: Database session
+            export_format: ``ndjson`` or ``csv``
+            compression: ``gzip``, ``zstd`` or None
+            batch_size: Number of profiles per batch
+
+        Returns:
+            Asynchronous iterator of output chunks, about one per batch
+
+        Raises:
+            ValueError: If the format or compression is not supported
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format '{export_format}'")
+        compressor = _get_compressor(compression)
+        return ProfileExportService._stream(db, export_format, compressor, batch_size)
+
+    @staticmethod
+    async def _stream(
+        db: AsyncSession,
+        export_format: str,
+        compressor: Optional[_Compressor],
+        batch_size: Optional[int],
+    ) -> AsyncIterator[bytes]:
+        first = True
+        async for records in ProfileExportService.iter_record_batches(db, batch_size):
+            if export_format == "csv":
+                chunk = encode_csv(records, header=first)
+            else:
+                chunk = encode_ndjson(records)
+            first = False
+            if compressor is not None:
+                chunk = compressor.compress(chunk)
+            if chunk:
+                yield chunk
+
+        if export_format == "csv" and first:
+            chunk = encode_csv([], header=True)
+            yield compressor.compress(chunk) if compressor is not None else chunk
+        if compressor is not None:
+            yield compressor.flush()
@@ -0,0 +1,155 @@
+from typing import AsyncIterable, AsyncIterator, Optional
+
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.repository import ProfileRepository
+from app.schemas.profile_schema import ProfileSchema, ProfileImportError, ProfileImportReport
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterable[bytes],
+    max_line_bytes: Optional[int] = None,
+) -> AsyncIterator[tuple[int, Optional[bytes]]]:
+    """
+    Split a stream of byte chunks into NDJSON lines without buffering the whole input.
+    
+    Only each new chunk is scanned for newlines; the unfinished line is kept
+    in a tail capped at ``max_line_bytes``. The rest of a longer line is
+    skipped, so memory stays bounded whatever the input.
+    
+    Args:
+        chunks: Byte chunks as they arrive (request body, file reads)
+        max_line_bytes: Longest accepted line, newline excluded
+        
+    Yields:
+        Tuples of (1-based line number, line content) for non-blank lines;
+        the content is None for lines longer than ``max_line_bytes``
+    """
+    max_line_bytes = max_line_bytes or settings.PROFILE_IMPORT_MAX_LINE_BYTES
+    tail = bytearray()
+    too_long = False
+    line_number = 0
+    async for chunk in chunks:
+        start = 0
+        end = chunk.find(b"\n")
+        while end != -1:
+            line_number += 1
+            if too_long or len(tail) + end - start > max_line_bytes:
+                yield line_number, None
+            else:
+                tail += chunk[start:end]
+                if tail.strip():
+                    yield line_number, bytes(tail)
+            tail.clear()
+            too_long = False
+            start = end + 1
+            end = chunk.find(b"\n", start)
+        
+        if not too_long:
+            if len(tail) + len(chunk) - start > max_line_bytes:
+                tail.clear()
+                too_long = True
+            else:
+                tail += chunk[start:]
+    
+    if too_long:
+        yield line_number + 1, None
+    elif tail.strip():
+        yield line_number + 1, bytes(tail)
+
+def _format_validation_error(error: ValidationError) -> str:
+    messages = []
+    for detail in error.errors():
+        location = ".".join(str(part) for part in detail["loc"])
+        messages.append(f"{location}: {detail['msg']}" if location else detail["msg"])
+    return "; ".join(messages)
+
+class ProfileImportService:
+    """
+    Service for bulk loading profiles from NDJSON dumps.
+    """
+    
+    @staticmethod
+    async def import_ndjson(
+        db: AsyncSession,
+        chunks: AsyncIterable[bytes],
+        batch_size: Optional[int] = None,
+    ) -> ProfileImportReport:
+        """
+        Import profiles, with their accounts and IP addresses, from an NDJSON stream.
+        
+        Lines are validated against ProfileSchema as they are read and written
+        in batches, one transaction per batch. Invalid or over-long lines and
+        usernames that already exist are reported and skipped; they never
+        abort the load.
+        
+        Args:
+            db: Database session
+            chunks: NDJSON input as a stream of byte chunks
+            batch_size: Number of profiles per transaction
+            
+        Returns:
+            Report with counters and per-line errors
+        """
+        batch_size = batch_size or settings.PROFILE_IMPORT_BATCH_SIZE
+        report = ProfileImportReport()
+        batch: list[tuple[int, ProfileSchema]] = []
+        
+        async for line_number, line in iter_ndjson_lines(chunks):
+            report.processed += 1
+            if line is None:
+                ProfileImportService._record_error(
+                    report, line_number, f"Line exceeds {settings.PROFILE_IMPORT_MAX_LINE_BYTES} bytes"
+                )
+                continue
+            try:
+                batch.append((line_number, ProfileSchema.model_validate_json(line)))
+            except ValidationError as e:
+                ProfileImportService._record_error(report, line_number, _format_validation_error(e))
+                continue
+            
+            if len(batch) >= batch_size:
+                await ProfileImportService._write_batch(db, batch, report)
+                batch = []
+        
+        await ProfileImportService._write_batch(db, batch, report)
+        return report
+    
+    @staticmethod
+    async def _write_batch(
+        db: AsyncSession,
+        batch: list[tuple[int, ProfileSchema]],
+        report: ProfileImportReport,
+    ) -> None:
+        if not batch:
+            return
+        
+        existing = await ProfileRepository.get_existing_usernames(db, (profile.username for _, profile in batch))
+        accepted: list[tuple[int, ProfileSchema]] = []
+        seen: set[str] = set()
+        for line_number, profile in batch:
+            if profile.username in existing or profile.username in seen:
+                ProfileImportService._record_error(
+                    report, line_number, f"Username '{profile.username}' already exists"
+                )
+                continue
+            seen.add(profile.username)
+            accepted.append((line_number, profile))
+        
+        try:
+            await ProfileRepository.bulk_create_profiles(db, [profile for _, profile in accepted])
+        except SQLAlchemyError as e:
+            await db.rollback()
+            for line_number, _ in accepted:
+                ProfileImportService._record_error(report, line_number, f"Database operation failed: {e.__class__.__name__}")
+            return
+        
+        report.created += len(accepted)
+    
+    @staticmethod
+    def _record_error(report: ProfileImportReport, line_number: int, message: str) -> None:
+        report.failed += 1
+        if len(report.errors) < settings.PROFILE_IMPORT_MAX_ERRORS:
+            report.errors.append(ProfileImportError(line=line_number, error=message))
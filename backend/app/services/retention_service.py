@@ -0,0 +1,120 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.db.upsert import dialect_name
+from app.repository import IPRepository
+
+logger = logging.getLogger(__name__)
+
+# SQLite ``auto_vacuum`` mode that lets freed pages be returned in steps
+SQLITE_AUTO_VACUUM_INCREMENTAL = 2
+
+class SightingRetentionService:
+    """
+    Service that keeps the raw IP sighting journal bounded.
+    """
+
+    @staticmethod
+    async def roll_up(
+        session_factory: async_sessionmaker,
+        cutoff: datetime,
+        batch_size: int = settings.RETENTION_BATCH_SIZE,
+    ) -> int:
+        """
+        Roll up every raw sighting seen before ``cutoff`` into the daily aggregates.
+
+        Each batch runs in its own short transaction, and the loop yields to
+        the event loop between batches, so writers (request handlers, other
+        workers running the same job) wait at most one batch for the lock.
+
+        Args:
+            session_factory: Factory for write sessions
+            cutoff: Sightings seen before this time are rolled up
+            batch_size: Raw sightings moved per transaction
+
+        Returns:
+            Number of raw sightings rolled up
+        """
+        total = 0
+        while True:
+            async with session_factory() as db:
+                moved = await IPRepository.roll_up_raw_sightings(db, cutoff, batch_size)
+                await db.commit()
+            total += moved
+            if moved < batch_size:
+                return total
+            await asyncio.sleep(0)
+
+    @staticmethod
+    async def incremental_vacuum(db: AsyncSession, pages: int = settings.SQLITE_INCREMENTAL_VACUUM_PAGES) -> bool:
+        """
+        Return up to ``pages`` free pages of a SQLite database to the file system.
+
+        Only databases created with ``auto_vacuum=INCREMENTAL`` (new databases
+        are) can shrink this way; older ones need a one-off ``VACUUM``. Other
+        dialects reclaim space on their own (autovacuum) and are skipped.
+
+        Args:
+            db: Database session
+            pages: Maximum number of pages to free; 0 frees them all
+
+        Returns:
+            True if pages were freed, False if the database cannot be vacuumed incrementally
+        """
+        if dialect_name(db) != "sqlite":
+            return False
+        mode = (await db.execute(text("PRAGMA auto_vacuum"))).scalar()
+        if mode != SQLITE_AUTO_VACUUM_INCREMENTAL:
+            logger.warning(
+                "SQLite database is not in incremental auto_vacuum mode; run "
+                "`PRAGMA auto_vacuum = INCREMENTAL; VACUUM;` once to let the retention job shrink it"
+            )
+            return False
+        # sqlite3's execute() steps a statement once, which frees a single page;
+        # executescript() runs it to completion
+        connection = await (await db.connection()).get_raw_connection()
+        await connection.driver_connection.executescript(f"PRAGMA incremental_vacuum({int(pages)})")
+        return True
+
+    @staticmethod
+    async def run(session_factory: async_sessionmaker, now: Optional[datetime] = None) -> int:
+        """
+        Roll up the sightings past the retention period, then reclaim the freed space.
+
+        Args:
+            session_factory: Factory for write sessions
+            now: Current UTC time; defaults to the clock
+
+        Returns:
+            Number of raw sightings rolled up
+        """
+        now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+        cutoff = now - timedelta(days=settings.IP_SIGHTING_RAW_RETENTION_DAYS)
+        moved = await SightingRetentionService.roll_up(session_factory, cutoff)
+        if moved:
+            async with session_factory() as db:
+                await SightingRetentionService.incremental_vacuum(db)
+            logger.info(f"Rolled up {moved} IP sightings seen before {cutoff:%Y-%m-%d %H:%M:%S}")
+        return moved
+
+    @staticmethod
+    async def run_periodically(session_factory: async_sessionmaker, interval: float) -> None:
+        """
+        Run the retention job until cancelled.
+
+        Args:
+            session_factory: Factory for write sessions
+            interval: Seconds between runs
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await SightingRetentionService.run(session_factory)
+            except Exception as e:
+                logger.error(f"Error running IP sighting retention: {e}")
@@ -1,9 +1,11 @@
 from typing import Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
-from app.schemas.user import UserSchema
-from app.services.auth.password_service import get_password_hash, verify_password
+from app.schemas.user import UserSchema, UserResponse, UserBatchResult, UserBatchReport
+from app.services.auth.password_service import hash_password_async, hash_passwords_async, verify_password_async
+from app.services.auth.token_cache import token_cache
 from app.repository import UserRepository
 from app.exceptions import UserAlreadyExistsException, InvalidCredentialsException, DatabaseOperationException, UserNotFoundException
 
@@ -13,7 +15,7 @@ class UserService:
     """
     
     @staticmethod
-    def create_user(db: Session, user_data: UserSchema) -> User:
+    async def create_user(db: AsyncSession, user_data: UserSchema) -> User:
         """
         Create a new user with a hashed password.
         
@@ -24,25 +26,83 @@ class UserService:
         Returns:
             Created user object
         """
-        existing_user = UserRepository.get_by_username(db, username=user_data.username)
+        existing_user = await UserRepository.get_by_username(db, username=user_data.username)
         if existing_user:
             raise UserAlreadyExistsException(username=user_data.username)
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await hash_password_async(user_data.password)
         
         try:
-            user = UserRepository.create_user(
+            user = await UserRepository.create_user(
                 db=db,
                 username=user_data.username,
                 hashed_password=hashed_password
             )
             return user
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             raise DatabaseOperationException(f"Error creating user: {str(e)}")
 
+    @staticmethod
+    async def create_users(db: AsyncSession, users: list[UserSchema]) -> UserBatchReport:
+        """
+        Create many users at once, reporting the outcome of each one.
+        
+        Taken usernames are found with a single query, the remaining
+        passwords are hashed in parallel across the hashing pool and the
+        new users are inserted in one transaction. Usernames that already
+        exist, or repeat an earlier entry of the batch, are rejected without
+        affecting the others.
+        
+        Args:
+            db: Database session
+            users: User data including username and password, in request order
+            
+        Returns:
+            Report with counters and one result per requested user
+            
+        Raises:
+            PasswordHashQueueFullException: If the hashing queue is full
+        """
+        results: list[Optional[UserBatchResult]] = [None] * len(users)
+        existing = await UserRepository.get_existing_usernames(db, {user.username for user in users})
+        
+        accepted: list[int] = []
+        seen: set[str] = set()
+        for index, user in enumerate(users):
+            if user.username in existing:
+                error = UserAlreadyExistsException(username=user.username).message
+            elif user.username in seen:
+                error = f"Username '{user.username}' is repeated in the batch"
+            else:
+                seen.add(user.username)
+                accepted.append(index)
+                continue
+            results[index] = UserBatchResult(index=index, username=user.username, created=False, error=error)
+        
+        hashed_passwords = await hash_passwords_async([users[index].password for index in accepted])
+        try:
+            created = await UserRepository.bulk_create_users(
+                db, [(users[index].username, hashed) for index, hashed in zip(accepted, hashed_passwords)]
+            )
+        except SQLAlchemyError as e:
+            await db.rollback()
+            error = f"Database operation failed: {e.__class__.__name__}"
+            for index in accepted:
+                results[index] = UserBatchResult(index=index, username=users[index].username, created=False, error=error)
+        else:
+            for index in accepted:
+                user = created[users[index].username]
+                results[index] = UserBatchResult(
+                    index=index, username=user.username, created=True, user=UserResponse.model_validate(user)
+                )
+        
+        report = UserBatchReport(results=results)
+        report.created = sum(result.created for result in report.results)
+        report.failed = len(report.results) - report.created
+        return report
 
     @staticmethod
-    def authenticate_user(db: Session, username: str, password: str) -> Optional[User]:
+    async def authenticate_user(db: AsyncSession, username: str, password: str) -> Optional[User]:
         """
         Authenticate a user by verifying the username and password.
         
@@ -54,14 +114,14 @@ class UserService:
         Returns:
             Authenticated user object if successful, None otherwise
         """
-        user = UserRepository.get_by_username(db, username=username)
-        if not user or not verify_password(password, user.hashed_password):
+        user = await UserRepository.get_by_username(db, username=username)
+        if not user or not await verify_password_async(password, user.hashed_password):
             raise InvalidCredentialsException()
         
         return user
     
     @staticmethod
-    def update_user(db: Session, user_id: int, user_data: UserSchema) -> User:
+    async def update_user(db: AsyncSession, user_id: int, user_data: UserSchema) -> User:
         """
         Update an existing user's information.
         
@@ -73,18 +133,21 @@ class UserService:
         Returns:
             Updated user object
         """
-        user = UserRepository.get_by_id(db, user_id=user_id)
+        user = await UserRepository.get_by_id(db, user_id=user_id)
         if not user:
             raise UserNotFoundException(user_id=user_id)
         
+        hashed_password = await hash_password_async(user_data.password)
+        
         try:
-            updated_user = UserRepository.update_user(
+            updated_user = await UserRepository.update_user(
                 db=db,
                 user=user,
                 username=user_data.username,
-                hashed_password=get_password_hash(user_data.password)
+                hashed_password=hashed_password
             )
+            token_cache.invalidate_user(user_id)
             return updated_user
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             raise DatabaseOperationException(f"Error updating user: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,19 @@
+from .ip import pack_ip_address, unpack_ip_address, parse_ip_network, parse_ip_query, parse_ip_prefix
+from .ip_trie import IPTrie
+from .disjoint_set import DisjointSet
+from .cursor import encode_cursor, decode_cursor
+from .etag import make_etag, etag_matches
+
+__all__ = [
+    "pack_ip_address",
+    "unpack_ip_address",
+    "parse_ip_network",
+    "parse_ip_query",
+    "parse_ip_prefix",
+    "IPTrie",
+    "DisjointSet",
+    "encode_cursor",
+    "decode_cursor",
+    "make_etag",
+    "etag_matches",
+]
@@ -0,0 +1,76 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+
+def encode_cursor(timestamp: datetime, row_id: int) -> str:
+    """
+    Build an opaque keyset cursor from the sort key of the last row of a page.
+
+    Args:
+        timestamp: Creation timestamp of the row
+        row_id: Primary key of the row, breaking ties between equal timestamps
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([timestamp.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Read the sort key back from a cursor built by ``encode_cursor``.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (timestamp, row ID)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        timestamp, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(row_id, int) or isinstance(row_id, bool):
+            raise TypeError
+        return datetime.fromisoformat(timestamp), row_id
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor '{cursor}'") from e
+
+def encode_day_cursor(day: date, key: str) -> str:
+    """
+    Build an opaque keyset cursor for listings ordered by day and a text key.
+
+    Args:
+        day: Day of the last row of the page
+        key: Text key of the row, breaking ties between equal days
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([day.isoformat(), key], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_day_cursor(cursor: str) -> tuple[date, str]:
+    """
+    Read the sort key back from a cursor built by ``encode_day_cursor``.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (day, text key)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        day, key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(key, str):
+            raise TypeError
+        return date.fromisoformat(day), key
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor '{cursor}'") from e
@@ -0,0 +1,73 @@
+from typing import Hashable, Iterable, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+class DisjointSet:
+    """
+    Union-find with path compression and union by size.
+
+    Elements are added implicitly the first time they are seen.
+    """
+
+    def __init__(self, elements: Iterable[T] = ()):
+        self._parent: dict[T, T] = {}
+        self._size: dict[T, int] = {}
+        for element in elements:
+            self.find(element)
+
+    def __len__(self) -> int:
+        return len(self._parent)
+
+    def find(self, element: T) -> T:
+        """
+        Return the representative of the set containing an element.
+
+        Args:
+            element: Element to look up (added as a singleton if unknown)
+
+        Returns:
+            The set's representative
+        """
+        parent = self._parent.setdefault(element, element)
+        if parent == element:
+            self._size.setdefault(element, 1)
+            return element
+
+        root = parent
+        while self._parent[root] != root:
+            root = self._parent[root]
+        while element != root:
+            self._parent[element], element = root, self._parent[element]
+        return root
+
+    def union(self, a: T, b: T) -> T:
+        """
+        Merge the sets containing two elements.
+
+        Args:
+            a: First element
+            b: Second element
+
+        Returns:
+            Representative of the merged set
+        """
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return root_a
+        if self._size[root_a] < self._size[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        self._size[root_a] += self._size.pop(root_b)
+        return root_a
+
+    def groups(self) -> list[list[T]]:
+        """
+        List the members of every set.
+
+        Returns:
+            One list of members per set
+        """
+        groups: dict[T, list[T]] = {}
+        for element in self._parent:
+            groups.setdefault(self.find(element), []).append(element)
+        return list(groups.values())
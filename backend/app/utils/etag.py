@@ -0,0 +1,36 @@
+from typing import Optional
+
+def make_etag(*parts: object) -> str:
+    """
+    Build a strong entity tag from the values that identify a representation.
+
+    Args:
+        parts: Identifying values, e.g. a row ID and its version
+
+    Returns:
+        Quoted entity tag such as ``"12-3"``
+    """
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Evaluate an ``If-None-Match`` header against the current entity tag.
+
+    Uses the weak comparison RFC 9110 prescribes for ``If-None-Match``:
+    ``W/`` prefixes are ignored and ``*`` matches any current representation.
+
+    Args:
+        if_none_match: Header value, None if absent
+        etag: Current entity tag
+
+    Returns:
+        True if the client's copy is current (respond with 304)
+    """
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
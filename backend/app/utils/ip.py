@@ -0,0 +1,104 @@
+import ipaddress
+from typing import Optional
+
+IP_NUMERIC_WIDTH = 16
+
+def _to_ipv6(address: ipaddress.IPv4Address | ipaddress.IPv6Address) -> ipaddress.IPv6Address:
+    if isinstance(address, ipaddress.IPv4Address):
+        return ipaddress.IPv6Address(f"::ffff:{address}")
+    return address
+
+def pack_ip_address(address: str) -> Optional[bytes]:
+    """
+    Encode an IP address as a fixed-width, order-preserving 16-byte integer.
+    
+    IPv4 addresses are stored as IPv4-mapped IPv6 addresses (``::ffff:a.b.c.d``),
+    so both families share one column and byte order matches numeric order.
+    
+    Args:
+        address: IPv4 or IPv6 address in text form
+        
+    Returns:
+        16 big-endian bytes, or None if the address is not valid
+    """
+    try:
+        parsed = ipaddress.ip_address(address.strip())
+    except (AttributeError, ValueError):
+        return None
+    return _to_ipv6(parsed).packed
+
+def unpack_ip_address(value: bytes) -> str:
+    """
+    Decode a value produced by pack_ip_address back to its text form.
+    
+    Args:
+        value: 16 big-endian bytes
+        
+    Returns:
+        The IP address in text form (IPv4 addresses are returned unmapped)
+    """
+    address = ipaddress.IPv6Address(value)
+    return str(address.ipv4_mapped or address)
+
+def parse_ip_network(query: str) -> ipaddress.IPv4Network | ipaddress.IPv6Network:
+    """
+    Parse an exact address, an IPv4 prefix or a CIDR block into a network.
+    
+    Accepted forms:
+        - ``177.12.4.2`` or ``2001:db8::1`` (exact)
+        - ``177.12.`` / ``177.12`` / ``177.12.*`` (IPv4 octet prefix)
+        - ``177.12.0.0/16`` or ``2001:db8::/32`` (CIDR)
+        
+    Args:
+        query: Lookup expression
+        
+    Returns:
+        The matching network (a single address is a /32 or /128)
+        
+    Raises:
+        ValueError: If the query is not a valid address, prefix or network
+    """
+    query = query.strip()
+    if "/" not in query and ":" not in query:
+        octets = [octet for octet in query.rstrip(".*").split(".") if octet]
+        if 0 < len(octets) < 4:
+            query = ".".join(octets + ["0"] * (4 - len(octets))) + f"/{8 * len(octets)}"
+    
+    return ipaddress.ip_network(query, strict=False)
+
+def parse_ip_query(query: str) -> tuple[bytes, bytes]:
+    """
+    Turn an exact address, an IPv4 prefix or a CIDR block into a packed range.
+    
+    Args:
+        query: Lookup expression (see parse_ip_network)
+        
+    Returns:
+        Tuple with the lowest and highest packed address in the range (inclusive)
+        
+    Raises:
+        ValueError: If the query is not a valid address, prefix or network
+    """
+    network = parse_ip_network(query)
+    return (
+        _to_ipv6(network.network_address).packed,
+        _to_ipv6(network.broadcast_address).packed,
+    )
+
+def parse_ip_prefix(query: str) -> tuple[int, int]:
+    """
+    Turn an exact address, an IPv4 prefix or a CIDR block into a 128-bit prefix.
+    
+    Args:
+        query: Lookup expression (see parse_ip_network)
+        
+    Returns:
+        Tuple of (packed network address as an integer, prefix length in bits),
+        with IPv4 prefixes shifted into the IPv4-mapped range
+        
+    Raises:
+        ValueError: If the query is not a valid address, prefix or network
+    """
+    network = parse_ip_network(query)
+    length = network.prefixlen + (96 if network.version == 4 else 0)
+    return int.from_bytes(_to_ipv6(network.network_address).packed, "big"), length
@@ -0,0 +1,196 @@
+import sys
+from typing import Iterator, Optional
+
+KEY_BITS = 128
+
+class _Node:
+    __slots__ = ("key", "length", "left", "right", "values")
+
+    def __init__(self, key: int, length: int):
+        self.key = key
+        self.length = length
+        self.left: Optional["_Node"] = None
+        self.right: Optional["_Node"] = None
+        self.values: Optional[set[int]] = None
+
+    def child(self, bit: int) -> Optional["_Node"]:
+        return self.right if bit else self.left
+
+    def set_child(self, bit: int, node: "_Node") -> None:
+        if bit:
+            self.right = node
+        else:
+            self.left = node
+
+def _mask(length: int) -> int:
+    return ((1 << length) - 1) << (KEY_BITS - length) if length else 0
+
+def _bit(key: int, position: int) -> int:
+    return (key >> (KEY_BITS - 1 - position)) & 1
+
+def _common_length(a: int, b: int, limit: int) -> int:
+    diff = a ^ b
+    common = KEY_BITS - diff.bit_length() if diff else KEY_BITS
+    return min(common, limit)
+
+class IPTrie:
+    """
+    Path-compressed binary (Patricia) trie over 128-bit keys.
+
+    Keys are packed addresses (see ``app.utils.ip.pack_ip_address``) read as
+    big-endian integers; each stored key carries a set of integer values
+    (profile IDs). Lookups walk at most one node per distinct prefix bit, so
+    both exact and subnet queries cost O(prefix length) plus the size of the
+    answer.
+
+    Node and memory counters are kept up to date on insertion, so size
+    reports never walk the trie.
+    """
+
+    def __init__(self):
+        self._root = _Node(0, 0)
+        self._keys = 0
+        self._entries = 0
+        self._nodes = 1
+        self._bytes = sys.getsizeof(self._root)
+
+    def __len__(self) -> int:
+        return self._keys
+
+    @property
+    def entries(self) -> int:
+        """Number of (key, value) pairs stored."""
+        return self._entries
+
+    def add(self, key: int, value: int, length: int = KEY_BITS) -> None:
+        """
+        Associate a value with a key (or prefix of ``length`` bits).
+
+        Args:
+            key: 128-bit key
+            value: Value to store (profile ID)
+            length: Prefix length in bits
+        """
+        key &= _mask(length)
+        node = self._root
+        while True:
+            if node.length == length:
+                self._store(node, value)
+                return
+
+            bit = _bit(key, node.length)
+            child = node.child(bit)
+            if child is None:
+                leaf = self._new_node(key, length)
+                node.set_child(bit, leaf)
+                self._store(leaf, value)
+                return
+
+            common = _common_length(key, child.key, min(length, child.length))
+            if common == child.length:
+                node = child
+                continue
+
+            middle = self._new_node(key & _mask(common), common)
+            middle.set_child(_bit(child.key, common), child)
+            node.set_child(bit, middle)
+            if common == length:
+                self._store(middle, value)
+            else:
+                leaf = self._new_node(key, length)
+                middle.set_child(_bit(key, common), leaf)
+                self._store(leaf, value)
+            return
+
+    def get(self, key: int) -> set[int]:
+        """
+        Retrieve the values stored under an exact key.
+
+        Args:
+            key: 128-bit key
+
+        Returns:
+            Set of values (empty if the key is not stored)
+        """
+        node = self._find(key, KEY_BITS)
+        if node is None or node.length != KEY_BITS or node.key != key:
+            return set()
+        return set(node.values or ())
+
+    def get_prefix(self, key: int, length: int) -> set[int]:
+        """
+        Retrieve every value stored under keys that start with a prefix.
+
+        Args:
+            key: 128-bit key holding the prefix
+            length: Prefix length in bits
+
+        Returns:
+            Union of the values of all matching keys
+        """
+        node = self._find(key & _mask(length), length)
+        result: set[int] = set()
+        if node is None:
+            return result
+        for values in self._iter_values(node):
+            result |= values
+        return result
+
+    def memory_bytes(self) -> int:
+        """
+        Estimate the memory held by the trie's nodes and value sets.
+
+        Returns:
+            Approximate size in bytes
+        """
+        return self._bytes
+
+    def node_count(self) -> int:
+        """
+        Count the trie's nodes.
+
+        Returns:
+            Number of nodes, including the root
+        """
+        return self._nodes
+
+    def _new_node(self, key: int, length: int) -> _Node:
+        node = _Node(key, length)
+        self._nodes += 1
+        self._bytes += sys.getsizeof(node)
+        return node
+
+    def _store(self, node: _Node, value: int) -> None:
+        if node.values is None:
+            node.values = set()
+            self._keys += 1
+            self._bytes += sys.getsizeof(node.values)
+        if value not in node.values:
+            size = sys.getsizeof(node.values)
+            node.values.add(value)
+            self._entries += 1
+            self._bytes += sys.getsizeof(node.values) - size
+
+    def _find(self, key: int, length: int) -> Optional[_Node]:
+        """
+        Find the highest node whose keys all start with the given prefix.
+        """
+        node = self._root
+        while node.length < length:
+            child = node.child(_bit(key, node.length))
+            if child is None:
+                return None
+            limit = min(length, child.length)
+            if _common_length(key, child.key, limit) < limit:
+                return None
+            node = child
+        return node
+
+    @staticmethod
+    def _iter_values(node: _Node) -> Iterator[set[int]]:
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.values:
+                yield current.values
+            stack.extend(child for child in (current.left, current.right) if child is not None)
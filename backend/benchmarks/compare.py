@@ -0,0 +1,60 @@
+"""
+Compare two benchmark result files.
+
+Usage:
+    python -m benchmarks.compare benchmarks/results/BASELINE.json benchmarks/results/CANDIDATE.json
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+METRICS = (
+    ("requests_per_second", "req/s"),
+    ("p50_ms", "p50 ms"),
+    ("p95_ms", "p95 ms"),
+    ("p99_ms", "p99 ms"),
+)
+COLUMN_WIDTH = 30
+
+def change(baseline: float, candidate: float) -> str:
+    """
+    Format the relative change between two measurements.
+
+    Args:
+        baseline: Baseline value
+        candidate: Candidate value
+
+    Returns:
+        Signed percentage, or "n/a" when the baseline is zero
+    """
+    if not baseline:
+        return "n/a"
+    return f"{(candidate - baseline) / baseline * 100:+.1f}%"
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument("baseline", type=Path, help="Result file of the reference commit")
+    parser.add_argument("candidate", type=Path, help="Result file of the commit under test")
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(args.baseline.read_text())
+    candidate = json.loads(args.candidate.read_text())
+    print(f"baseline  {baseline['commit']}{'+' if baseline.get('dirty') else ''} ({baseline['scale']}, {baseline['rows']:,} rows)")
+    print(f"candidate {candidate['commit']}{'+' if candidate.get('dirty') else ''} ({candidate['scale']}, {candidate['rows']:,} rows)")
+    if baseline["scale"] != candidate["scale"]:
+        print("warning: results were measured at different scales")
+
+    print(f"{'scenario':<10}" + "".join(f"{label:>{COLUMN_WIDTH}}" for _, label in METRICS))
+    for name, before in baseline["scenarios"].items():
+        after = candidate["scenarios"].get(name)
+        if after is None:
+            continue
+        cells = []
+        for metric, _ in METRICS:
+            cells.append(f"{before[metric]:.1f} -> {after[metric]:.1f} {change(before[metric], after[metric]):>7}")
+        print(f"{name:<10}" + "".join(f"{cell:>{COLUMN_WIDTH}}" for cell in cells))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
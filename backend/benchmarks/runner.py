@@ -0,0 +1,354 @@
+"""
+Endpoint benchmark suite.
+
+Seeds (once per scale) a SQLite database under ``benchmarks/data``, copies
+it so every run starts from identical data, and drives the real ASGI app
+in-process with httpx for each scenario:
+
+    login   POST /auth/token with a seeded user's password
+    read    GET  /profiles/{id} for random profiles
+    list    GET  /profiles, following next_cursor pages
+    create  POST /profiles/create with new usernames
+    search  GET  /profiles/search with substrings of seeded nicknames
+
+p50/p95/p99 latency and requests/sec are printed and saved as JSON under
+``benchmarks/results``, tagged with the current commit, for
+``python -m benchmarks.compare``.
+
+Usage:
+    python -m benchmarks.runner --scale 10k [--scenarios read,search] [--requests 1000] [--concurrency 16]
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+DATA_DIR = BENCHMARK_DIR / "data"
+RESULTS_DIR = BENCHMARK_DIR / "results"
+SCENARIOS = ("login", "read", "list", "create", "search")
+
+@dataclass
+class ScenarioResult:
+    requests: int
+    errors: int
+    seconds: float
+    requests_per_second: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    status_codes: dict[str, int] = field(default_factory=dict)
+
+@dataclass
+class BenchmarkContext:
+    client: Any
+    rng: random.Random
+    headers: dict[str, str]
+    profiles: int
+    users: int
+    search_terms: list[str]
+    run_id: str
+    cursor: Optional[str] = None
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+
+    Args:
+        sorted_values: Values in ascending order
+        fraction: Percentile as a fraction (0.95 for p95)
+
+    Returns:
+        The percentile, 0 for an empty list
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(fraction * len(sorted_values) + 0.5))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+def summarize(latencies: list[float], statuses: list[int], seconds: float) -> ScenarioResult:
+    """
+    Aggregate raw measurements of one scenario.
+
+    Args:
+        latencies: Per-request latency in seconds
+        statuses: Per-request HTTP status code
+        seconds: Wall-clock duration of the scenario
+
+    Returns:
+        Scenario summary in milliseconds and requests per second
+    """
+    ordered = sorted(latencies)
+    codes: dict[str, int] = {}
+    for code in statuses:
+        codes[str(code)] = codes.get(str(code), 0) + 1
+    return ScenarioResult(
+        requests=len(latencies),
+        errors=sum(1 for code in statuses if code >= 400),
+        seconds=seconds,
+        requests_per_second=len(latencies) / seconds if seconds else 0.0,
+        mean_ms=sum(ordered) / len(ordered) * 1000 if ordered else 0.0,
+        p50_ms=percentile(ordered, 0.50) * 1000,
+        p95_ms=percentile(ordered, 0.95) * 1000,
+        p99_ms=percentile(ordered, 0.99) * 1000,
+        max_ms=ordered[-1] * 1000 if ordered else 0.0,
+        status_codes=codes,
+    )
+
+async def scenario_login(ctx: BenchmarkContext, i: int):
+    from benchmarks.seed import BENCHMARK_PASSWORD, benchmark_username
+    return await ctx.client.post("/api/v1/auth/token", data={
+        "username": benchmark_username(ctx.rng.randrange(ctx.users)),
+        "password": BENCHMARK_PASSWORD,
+    })
+
+async def scenario_read(ctx: BenchmarkContext, i: int):
+    return await ctx.client.get(f"/api/v1/profiles/{ctx.rng.randint(1, ctx.profiles)}", headers=ctx.headers)
+
+async def scenario_list(ctx: BenchmarkContext, i: int):
+    params = {"limit": 50, **({"cursor": ctx.cursor} if ctx.cursor else {})}
+    response = await ctx.client.get("/api/v1/profiles", params=params, headers=ctx.headers)
+    if response.status_code == 200:
+        ctx.cursor = response.json()["next_cursor"]
+    return response
+
+async def scenario_create(ctx: BenchmarkContext, i: int):
+    return await ctx.client.post("/api/v1/profiles/create", headers=ctx.headers, json={
+        "username": f"n{ctx.run_id}{i:09d}",
+        "full_name": "Benchmark Profile",
+        "associated_accounts": [f"old{ctx.run_id}{i}"],
+        "ip_addresses": [f"172.{16 + (i >> 16 & 15)}.{i >> 8 & 255}.{i & 255}"],
+    })
+
+async def scenario_search(ctx: BenchmarkContext, i: int):
+    return await ctx.client.get(
+        "/api/v1/profiles/search",
+        params={"q": ctx.rng.choice(ctx.search_terms), "limit": 20},
+        headers=ctx.headers,
+    )
+
+SCENARIO_FUNCTIONS: dict[str, Callable[[BenchmarkContext, int], Awaitable[Any]]] = {
+    "login": scenario_login,
+    "read": scenario_read,
+    "list": scenario_list,
+    "create": scenario_create,
+    "search": scenario_search,
+}
+
+async def run_scenario(ctx: BenchmarkContext, name: str, requests: int, concurrency: int, warmup: int) -> ScenarioResult:
+    """
+    Run one scenario with a fixed number of concurrent workers.
+
+    Args:
+        ctx: Shared benchmark context
+        name: Scenario name
+        requests: Number of measured requests
+        concurrency: Number of concurrent workers
+        warmup: Number of unmeasured requests sent first
+
+    Returns:
+        Scenario summary
+    """
+    call = SCENARIO_FUNCTIONS[name]
+    for i in range(warmup):
+        await call(ctx, requests + i)
+
+    latencies: list[float] = []
+    statuses: list[int] = []
+    counter = iter(range(requests))
+
+    async def worker() -> None:
+        for i in counter:
+            started = time.perf_counter()
+            response = await call(ctx, i)
+            latencies.append(time.perf_counter() - started)
+            statuses.append(response.status_code)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, statuses, time.perf_counter() - started)
+
+def git_revision() -> tuple[str, bool]:
+    """
+    Identify the commit being benchmarked.
+
+    Returns:
+        Tuple of (short commit hash or "unknown", whether the tree has local changes)
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, cwd=BENCHMARK_DIR,
+        ).stdout.strip()
+        dirty = bool(subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True, check=True, cwd=BENCHMARK_DIR,
+        ).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+
+def prepare_database(scale: str, reseed: bool) -> tuple[Path, int]:
+    """
+    Seed the template database of a scale if needed and copy it for this run.
+
+    Must run before any ``app`` module is imported, since the database URL
+    is read from the environment at import time.
+
+    Args:
+        scale: Scale name or row count
+        reseed: Rebuild the template even if it exists
+
+    Returns:
+        Tuple of (path of the working copy, seeded row count)
+    """
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    template = DATA_DIR / f"siena-{scale}.db"
+    working = DATA_DIR / f"siena-{scale}.run.db"
+
+    if reseed or not template.exists():
+        for path in (template, Path(f"{template}-wal"), Path(f"{template}-shm")):
+            path.unlink(missing_ok=True)
+        os.environ["SQLITE_DATABASE_URL"] = f"sqlite:///{template}"
+        from benchmarks.seed import parse_scale, seed_database
+
+        print(f"Seeding {template.name} ({parse_scale(scale):,} rows)...")
+        asyncio.run(seed_database(parse_scale(scale), progress=lambda message: print(f"  {message}")))
+        with sqlite3.connect(template) as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    for path in (working, Path(f"{working}-wal"), Path(f"{working}-shm")):
+        path.unlink(missing_ok=True)
+    shutil.copyfile(template, working)
+    os.environ["SQLITE_DATABASE_URL"] = f"sqlite:///{working}"
+
+    with sqlite3.connect(working) as conn:
+        rows = sum(conn.execute(f"SELECT count(*) FROM {table}").fetchone()[0]
+                   for table in ("users", "profiles", "accounts", "ip_addresses"))
+    return working, rows
+
+async def run_benchmarks(scenarios: list[str], requests: int, concurrency: int, warmup: int, seed: int) -> dict[str, ScenarioResult]:
+    """
+    Drive the ASGI app in-process through every selected scenario.
+
+    Args:
+        scenarios: Scenario names, run in order
+        requests: Measured requests per scenario
+        concurrency: Concurrent workers per scenario
+        warmup: Unmeasured requests per scenario
+        seed: Random seed for request parameters
+
+    Returns:
+        Mapping of scenario name to its summary
+    """
+    from httpx import ASGITransport, AsyncClient
+    from sqlalchemy import func, select
+
+    from app.db.database import SessionLocal, engine, read_engine
+    from app.models import Account, Profile, User
+    from app.services.auth.password_service import shutdown_password_executor
+    from app.services.auth.token_service import create_access_token
+    from benchmarks.seed import benchmark_username
+    from main import app
+
+    rng = random.Random(seed)
+    async with SessionLocal() as db:
+        profiles = (await db.execute(select(func.max(Profile.id)))).scalar_one() or 1
+        users = (await db.execute(select(func.count(User.id)))).scalar_one() or 1
+        sample_ids = [rng.randint(1, profiles) for _ in range(200)]
+        nicknames = (await db.execute(select(Account.nickname).where(Account.profile_id.in_(sample_ids)))).scalars().all()
+    search_terms = [
+        nickname[start:start + 4]
+        for nickname in nicknames
+        for start in [rng.randrange(max(1, len(nickname) - 3))]
+    ] or ["bench"]
+
+    results = {}
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+            ctx = BenchmarkContext(
+                client=client,
+                rng=rng,
+                headers={"Authorization": f"Bearer {create_access_token({'sub': benchmark_username(0)})}"},
+                profiles=profiles,
+                users=users,
+                search_terms=search_terms,
+                run_id=f"{rng.randrange(16 ** 4):04x}",
+            )
+            for name in scenarios:
+                result = await run_scenario(ctx, name, requests, concurrency, warmup)
+                results[name] = result
+                print(
+                    f"{name:<8}{result.requests:>8}{result.errors:>8}{result.requests_per_second:>10.1f}"
+                    f"{result.p50_ms:>10.2f}{result.p95_ms:>10.2f}{result.p99_ms:>10.2f}"
+                )
+    finally:
+        shutdown_password_executor()
+        await engine.dispose()
+        await read_engine.dispose()
+    return results
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark API endpoints against seeded databases.")
+    parser.add_argument("--scale", default="10k", help="10k, 1m, 10m or a row count")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"Comma-separated subset of {','.join(SCENARIOS)}")
+    parser.add_argument("--requests", type=int, default=500, help="Measured requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent in-process clients")
+    parser.add_argument("--warmup", type=int, default=20, help="Unmeasured requests per scenario")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for request parameters")
+    parser.add_argument("--reseed", action="store_true", help="Rebuild the seeded database")
+    parser.add_argument("--output", default=None, help="Result file (default: benchmarks/results/<time>-<commit>-<scale>.json)")
+    args = parser.parse_args(argv)
+
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    # Measure the endpoints themselves: login admission control would turn
+    # the login scenario into a 429 benchmark, and per-request access logs
+    # would flood the console.
+    os.environ.setdefault("LOGIN_LIMIT_USERNAME_BURST", "0")
+    os.environ.setdefault("LOGIN_LIMIT_IP_BURST", "0")
+    os.environ.setdefault("IP_INDEX_ENABLED", "false")
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+    _, rows = prepare_database(args.scale, args.reseed)
+
+    print(f"{'scenario':<8}{'reqs':>8}{'errors':>8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    results = asyncio.run(run_benchmarks(scenarios, args.requests, args.concurrency, args.warmup, args.seed))
+
+    commit, dirty = git_revision()
+    finished = datetime.now(timezone.utc)
+    report = {
+        "commit": commit,
+        "dirty": dirty,
+        "timestamp": finished.isoformat(),
+        "scale": args.scale,
+        "rows": rows,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "scenarios": {name: asdict(result) for name, result in results.items()},
+    }
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{finished:%Y%m%d-%H%M%S}-{commit}-{args.scale}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Results saved to {output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
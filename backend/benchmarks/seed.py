@@ -0,0 +1,183 @@
+"""
+Deterministic seeding of large benchmark databases.
+
+A scale is the total number of rows written across ``users``, ``profiles``,
+``accounts`` and ``ip_addresses``: each profile gets one primary and one
+previous account and three IP address sightings (six rows per profile),
+and one user is created per thousand rows. IP addresses are drawn from a
+pool smaller than the number of sightings and nicknames are occasionally
+reused, so clusters and IP lookups have realistic fan-out.
+
+Import this module only after ``SQLITE_DATABASE_URL`` points at the
+benchmark database (see ``benchmarks.runner``).
+"""
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Iterator, Optional
+
+from sqlalchemy import insert, text
+
+from app.db.database import SessionLocal, engine
+from app.db.init_db import init_db
+from app.models import Account, AccountType, IPAddress, Profile, User
+from app.repository import ClusterRepository
+from app.services.auth.password_service import get_password_hash
+
+SCALES = {
+    "10k": 10_000,
+    "1m": 1_000_000,
+    "10m": 10_000_000,
+}
+
+ROWS_PER_PROFILE = 6
+ROWS_PER_USER = 1_000
+INSERT_BATCH_SIZE = 10_000
+BENCHMARK_PASSWORD = "Benchmark#2025"
+SYLLABLES = ("ka", "lo", "mi", "ra", "to", "ze", "vu", "ni", "sa", "do", "pe", "xi")
+
+def parse_scale(scale: str) -> int:
+    """
+    Translate a scale name (``10k``, ``1m``, ``10m``) or a row count into a row count.
+
+    Args:
+        scale: Scale name or integer
+
+    Returns:
+        Total number of rows to seed
+
+    Raises:
+        ValueError: If the scale is neither a known name nor a positive integer
+    """
+    if scale.lower() in SCALES:
+        return SCALES[scale.lower()]
+    rows = int(scale)
+    if rows < ROWS_PER_PROFILE:
+        raise ValueError(f"Scale must be at least {ROWS_PER_PROFILE} rows")
+    return rows
+
+def benchmark_username(index: int) -> str:
+    return f"bench{index:06d}"
+
+def profile_username(index: int) -> str:
+    return f"p{index:09d}"
+
+def _nickname(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 5))) + str(rng.randint(0, 999))
+
+def _ip_address(rng: random.Random, pool_size: int) -> str:
+    value = (1 << 24) + rng.randrange(pool_size)
+    return f"{value >> 24 & 255}.{value >> 16 & 255}.{value >> 8 & 255}.{value & 255}"
+
+def _batches(rows: Iterator[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+async def seed_database(
+    rows: int,
+    seed: int = 42,
+    progress: Optional[Callable[[str], None]] = None,
+) -> dict[str, int]:
+    """
+    Create the schema and fill it with a deterministic dataset.
+
+    Rows are written with multi-row Core inserts in batches of
+    INSERT_BATCH_SIZE; clusters are computed once at the end.
+
+    Args:
+        rows: Total number of rows across the four tables
+        seed: Random seed, so every run of a scale produces the same data
+        progress: Optional callback receiving progress messages
+
+    Returns:
+        Mapping of table name to the number of rows written
+    """
+    report = progress or (lambda message: None)
+    rng = random.Random(seed)
+    users = max(1, rows // ROWS_PER_USER)
+    profiles = max(1, (rows - users) // ROWS_PER_PROFILE)
+    # Sparse enough that clusters stay small (no giant component)
+    ip_pool = min(max(16, profiles * 20), (1 << 32) - (1 << 25))
+    started_at = datetime(2024, 1, 1)
+
+    await init_db()
+    password_hash = get_password_hash(BENCHMARK_PASSWORD)
+
+    def user_rows() -> Iterator[dict[str, Any]]:
+        for i in range(users):
+            yield {
+                "id": i + 1,
+                "username": benchmark_username(i),
+                "hashed_password": password_hash,
+                "is_active": True,
+                "is_admin": i == 0,
+                "timestamp": started_at + timedelta(seconds=i),
+            }
+
+    def profile_rows() -> Iterator[dict[str, Any]]:
+        for i in range(profiles):
+            yield {
+                "id": i + 1,
+                "username": profile_username(i),
+                "full_name": f"{_nickname(rng).title()} {_nickname(rng).title()}",
+                "city": rng.choice(("Rio de Janeiro", "Sao Paulo", "Recife", "Curitiba", "Manaus")),
+                "state": rng.choice(("RJ", "SP", "PE", "PR", "AM")),
+                "created_at": started_at + timedelta(seconds=i),
+            }
+
+    def account_rows() -> Iterator[dict[str, Any]]:
+        for i in range(profiles):
+            yield {
+                "profile_id": i + 1,
+                "nickname": profile_username(i),
+                "is_active": True,
+                "account_type": AccountType.PRIMARY.value,
+            }
+            yield {
+                "profile_id": i + 1,
+                "nickname": _nickname(rng),
+                "is_active": True,
+                "account_type": AccountType.PREVIOUS.value,
+            }
+
+    def ip_rows() -> Iterator[dict[str, Any]]:
+        for i in range(profiles):
+            seen_at = started_at + timedelta(seconds=i)
+            # (profile_id, ip_address) is unique
+            for ip_address in dict.fromkeys(_ip_address(rng, ip_pool) for _ in range(3)):
+                yield {
+                    "profile_id": i + 1,
+                    "ip_address": ip_address,
+                    "timestamp": seen_at,
+                    "first_seen": seen_at,
+                    "last_seen": seen_at,
+                }
+
+    counts = {}
+    try:
+        for model, generate in ((User, user_rows), (Profile, profile_rows), (Account, account_rows), (IPAddress, ip_rows)):
+            table_started = time.perf_counter()
+            written = 0
+            async with engine.begin() as conn:
+                for batch in _batches(generate(), INSERT_BATCH_SIZE):
+                    await conn.execute(insert(model), batch)
+                    written += len(batch)
+            counts[model.__tablename__] = written
+            report(f"{model.__tablename__}: {written} rows in {time.perf_counter() - table_started:.1f}s")
+
+        clustering_started = time.perf_counter()
+        async with SessionLocal() as db:
+            clusters = await ClusterRepository.rebuild(db)
+        report(f"clusters: {clusters} in {time.perf_counter() - clustering_started:.1f}s")
+
+        async with engine.begin() as conn:
+            await conn.execute(text("ANALYZE"))
+    finally:
+        await engine.dispose()
+    return counts
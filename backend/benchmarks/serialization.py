@@ -0,0 +1,115 @@
+"""
+Serialization throughput on large profile lists.
+
+Compares FastAPI's legacy ``jsonable_encoder`` + ``json.dumps`` path with
+orjson, pydantic-core's direct JSON serialization (used by
+``app.api.responses.negotiate`` and FastAPI's response model fast path) and
+MessagePack.
+
+Usage:
+    python -m benchmarks.serialization [--profiles 500] [--repeat 20]
+"""
+import argparse
+import json
+import time
+from datetime import datetime
+from typing import Callable
+
+from fastapi.encoders import jsonable_encoder
+
+from app.schemas.pagination import Page
+from app.schemas.profile_schema import ProfileDetail
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+def build_page(profiles: int, accounts: int = 3, ip_addresses: int = 5) -> Page[ProfileDetail]:
+    """
+    Build a page of synthetic, fully populated profile documents.
+
+    Args:
+        profiles: Number of profiles
+        accounts: Previous accounts per profile
+        ip_addresses: IP address sightings per profile
+
+    Returns:
+        Page of ProfileDetail documents
+    """
+    now = datetime.now()
+    return Page[ProfileDetail](items=[
+        ProfileDetail(
+            id=i,
+            username=f"actor{i}",
+            full_name="John Doe",
+            email=f"actor{i}@example.com",
+            city="Rio de Janeiro",
+            state="RJ",
+            created_at=now,
+            cluster_id=i,
+            current_account={"id": i, "nickname": f"actor{i}", "is_active": True, "account_type": "primary"},
+            previous_accounts=[
+                {"id": i * 100 + k, "nickname": f"old{i}_{k}", "is_active": True, "account_type": "previous"}
+                for k in range(accounts)
+            ],
+            ip_addresses=[
+                {"id": i * 100 + k, "profile_id": i, "ip_address": f"10.{k}.{i // 250 % 250}.{i % 250}", "timestamp": now}
+                for k in range(ip_addresses)
+            ],
+        )
+        for i in range(profiles)
+    ])
+
+def measure(serialize: Callable[[], bytes], repeat: int) -> tuple[float, int]:
+    """
+    Time a serializer.
+
+    Args:
+        serialize: Function producing the encoded payload
+        repeat: Number of timed runs
+
+    Returns:
+        Tuple of (best seconds per run, payload size in bytes)
+    """
+    size = len(serialize())
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        serialize()
+        best = min(best, time.perf_counter() - started)
+    return best, size
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark response serialization of profile lists.")
+    parser.add_argument("--profiles", type=int, default=500, help="Profiles per page")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per serializer")
+    args = parser.parse_args(argv)
+
+    page = build_page(args.profiles)
+    serializers: dict[str, Callable[[], bytes]] = {
+        "jsonable_encoder + json": lambda: json.dumps(jsonable_encoder(page)).encode(),
+        "pydantic-core JSON": page.model_dump_json,
+    }
+    if orjson is not None:
+        serializers["model_dump + orjson"] = lambda: orjson.dumps(page.model_dump(mode="json"))
+    if msgpack is not None:
+        serializers["model_dump + msgpack"] = lambda: msgpack.packb(page.model_dump(mode="json"))
+
+    print(f"{args.profiles} profiles, best of {args.repeat}")
+    print(f"{'serializer':<26}{'ms':>10}{'profiles/s':>14}{'MB/s':>10}{'size KB':>10}")
+    for name, serialize in serializers.items():
+        seconds, size = measure(serialize, args.repeat)
+        print(
+            f"{name:<26}{seconds * 1000:>10.2f}{args.profiles / seconds:>14,.0f}"
+            f"{size / seconds / 1_000_000:>10.1f}{size / 1024:>10.0f}"
+        )
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,11 +1,43 @@
-import uvicorn
-from fastapi import FastAPI
+import os
+import time
+
+# Measured first so the startup report includes module imports
+IMPORTS_STARTED_AT = time.perf_counter()
+
+import asyncio
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from app.api.api_v1.router import api_router
+from app.api.middleware import MetricsMiddleware, RequestContextMiddleware
+from app.core.config import settings
 from app.core.logging_config import logger
+from app.core.metrics import CONTENT_TYPE, REGISTRY, startup_duration_seconds
+from app.db.database import ReadSessionLocal, SessionLocal
 from app.db.init_db import init_db
+from app.services.auth.password_service import shutdown_password_executor
+from app.services.ip_index_service import ip_index
+from app.services.retention_service import SightingRetentionService
+
+IMPORTS_SECONDS = time.perf_counter() - IMPORTS_STARTED_AT
+# Workers forked by app.cli.serve inherit the imports instead of paying for them
+IMPORTS_PID = os.getpid()
+
+def report_startup(phases: dict[str, float]) -> None:
+    """
+    Log how long each startup phase took and expose it as a metric.
+
+    Args:
+        phases: Seconds spent per phase, in order
+    """
+    for phase, seconds in phases.items():
+        startup_duration_seconds.labels(phase).set(seconds)
+    breakdown = ", ".join(f"{phase} {seconds * 1000:.0f} ms" for phase, seconds in phases.items())
+    logger.info(
+        f"Startup complete in {sum(phases.values()) * 1000:.0f} ms ({breakdown})",
+        extra={"startup_ms": {phase: round(seconds * 1000, 1) for phase, seconds in phases.items()}},
+    )
 
 @asynccontextmanager
 async def lifespan(app):
@@ -15,10 +47,41 @@ async def lifespan(app):
     """
     # Startup logic
     logger.info("Starting up the S.I.E.N.A API...")
-    init_db()
+    phases = {"imports": IMPORTS_SECONDS} if os.getpid() == IMPORTS_PID else {}
+    started = time.perf_counter()
+    await init_db()
+    phases["schema_check"] = time.perf_counter() - started
+    refresh_task = None
+    if settings.IP_INDEX_ENABLED:
+        started = time.perf_counter()
+        async with ReadSessionLocal() as db:
+            if ip_index.ready:
+                # Built by the launcher before forking; only catch up
+                await ip_index.sync(db)
+            else:
+                await ip_index.rebuild(db)
+        phases["ip_index"] = time.perf_counter() - started
+        if settings.IP_INDEX_REFRESH_SECONDS > 0:
+            refresh_task = asyncio.create_task(
+                ip_index.refresh_periodically(ReadSessionLocal, settings.IP_INDEX_REFRESH_SECONDS)
+            )
+    retention_task = None
+    if settings.RETENTION_INTERVAL_SECONDS > 0:
+        retention_task = asyncio.create_task(
+            SightingRetentionService.run_periodically(SessionLocal, settings.RETENTION_INTERVAL_SECONDS)
+        )
+    report_startup(phases)
     yield
     # Shutdown logic
     logger.info("Shutting down the S.I.E.N.A API...")
+    # Wait for the background tasks to unwind, so an interrupted retention
+    # batch has rolled back before the engine goes away
+    for task in (refresh_task, retention_task):
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+    shutdown_password_executor()
 
 # Create the FastAPI application (only once)
 app = FastAPI(
@@ -43,6 +106,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+app.add_middleware(RequestContextMiddleware)
+
 # Include API router after app is defined
 app.include_router(api_router, prefix="/api/v1")
 
@@ -54,5 +121,17 @@ def root():
     """
     return {"message": "Welcome to the S.I.E.N.A API!"}
 
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        """
+        Prometheus scrape endpoint.
+        Returns request, query and pool metrics of this process in the text format.
+        """
+        return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    import uvicorn
+
+    # Uvicorn's own loggers propagate to the queue handler; requests are logged by RequestContextMiddleware
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True, log_config=None, access_log=False)
\ No newline at end of file
@@ -1,5 +1,6 @@
 import pytest
-from sqlalchemy.orm import Session
+
+pytestmark = pytest.mark.anyio
 
 user = {
   "id": 1,
@@ -7,8 +8,8 @@ user = {
   "is_active": True
 }
 
-def test_get_token(client, test_user):
-    response = client.post(
+async def test_get_token(client, test_user):
+    response = await client.post(
         "/api/v1/auth/token",
         data={
             "username": test_user.username,
@@ -19,4 +20,36 @@ def test_get_token(client, test_user):
     
     assert response.status_code == 200
     assert token['token_type'] == 'bearer'
-    assert 'access_token' in token
\ No newline at end of file
+    assert 'access_token' in token
+
+async def test_get_token_rate_limited(client, test_user):
+    credentials = {"username": test_user.username, "password": "wrong-password"}
+    for _ in range(5):
+        response = await client.post("/api/v1/auth/token", data=credentials)
+        assert response.status_code == 401
+    
+    response = await client.post(
+        "/api/v1/auth/token",
+        data={"username": test_user.username, "password": test_user.clean_password},
+    )
+    
+    assert response.status_code == 429
+    assert int(response.headers["retry-after"]) > 0
+
+async def test_metrics(client, token_for_user):
+    await client.get("/api/v1/profiles/999", headers={"Authorization": f"Bearer {token_for_user}"})
+    
+    response = await client.get("/metrics")
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'siena_http_requests_total{method="GET",route="/api/v1/profiles/{profile_id}",status="404"}' in response.text
+    assert 'siena_http_request_duration_seconds_count{method="GET",route="/api/v1/profiles/{profile_id}"}' in response.text
+    assert 'siena_http_requests_in_progress{method="GET"} 1.0' in response.text
+
+async def test_request_id(client):
+    response = await client.get("/", headers={"X-Request-ID": "proxy-42"})
+    generated = await client.get("/", headers={"X-Request-ID": "not a valid id"})
+    
+    assert response.headers["x-request-id"] == "proxy-42"
+    assert len(generated.headers["x-request-id"]) == 32
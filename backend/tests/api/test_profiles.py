@@ -0,0 +1,236 @@
+import gzip
+import json
+
+import msgpack
+import pytest
+
+from app.repository import ProfileRepository
+from app.schemas.profile_schema import ProfileSchema
+
+pytestmark = pytest.mark.anyio
+
+profile = {
+    "username": "johndoe",
+    "full_name": "John Doe",
+    "city": "Rio de Janeiro",
+    "state": "RJ",
+    "associated_accounts": ["OldAccountJohn", "DoeTrampolin"],
+    "ip_addresses": ["192.168.1.1", "10.0.0.1"],
+}
+
+async def test_create_profile(client, token_for_user):
+    headers = {"Authorization": f"Bearer {token_for_user}"}
+
+    response = await client.post("/api/v1/profiles/create", json=profile, headers=headers)
+
+    assert response.status_code == 201
+    assert response.json()["username"] == profile["username"]
+
+async def test_create_profile_duplicate_username(client, token_for_user):
+    headers = {"Authorization": f"Bearer {token_for_user}"}
+
+    await client.post("/api/v1/profiles/create", json=profile, headers=headers)
+    response = await client.post("/api/v1/profiles/create", json=profile, headers=headers)
+
+    assert response.status_code == 409
+
+async def test_get_profile(client, token_for_user):
+    headers = {"Authorization": f"Bearer {token_for_user}"}
+    created = await client.post("/api/v1/profiles/create", json=profile, headers=headers)
+
+    response = await client.get(f"/api/v1/profiles/{created.json()['id']}", headers=headers)
+    body = response.json()
+
+    assert response.status_code == 200
+    assert body["current_account"]["nickname"] == profile["username"]
+    assert [account["nickname"] for account in body["previous_accounts"]] == profile["associated_accounts"]
+    assert body["fake_accounts"] == []
+    assert [ip["ip_address"] for ip in body["ip_addresses"]] == profile["ip_addresses"]
+
+async def test_get_profile_not_found(client, token_for_user):
+    headers = {"Authorization": f"Bearer {token_for_user}"}
+
+    response = await client.get("/api/v1/profiles/999", headers=headers)
+
+    assert response.status_code == 404
+
+async def test_list_profiles_query_count_is_constant(client, db, token_for_user, query_budget):
+    headers = {"Authorization": f"Bearer {token_for_user}"}
+
+    async def list_profiles_queries(total: int) -> int:
+        with query_budget(5) as queries:
+            response = await client.get("/api/v1/profiles", params={"limit": 500}, headers=headers)
+        assert len(response.json()["items"]) == total
+        return queries.count
+
+    await ProfileRepository.bulk_create_profiles(db, [
+        ProfileSchema(username=f"actor{i}", associated_accounts=[f"old{i}"], ip_addresses=[f"10.0.0.{i}"])
+        for i in range(2)
+    ])
+    await client.get("/api/v1/profiles", headers=headers)
+    small = await list_profiles_queries(2)
+
+    await ProfileRepository.bulk_create_profiles(db, [
+        ProfileSchema(username=f"actor{i}", associated_accounts=[f"old{i}"], ip_addresses=[f"10.0.0.{i}"])
+        for i in range(2, 40)
+    ])
+    large = await list_profiles_queries(40)
+
+    assert small == large == 5
+
+async def test_list_profiles_keyset_pagination(client, db, token_for_user):
+    headers = {"Authorization": f"Bearer {token_for_user}"}
+    await ProfileRepository.bulk_create_profiles(db, [ProfileSchema(username=f"actor{i}") for i in range(5)])
+
+    usernames, cursor = [], None
+    for _ in range(5):
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        body = (await client.get("/api/v1/profiles", params=params, headers=headers)).json()
+        usernames.extend(item["username"] for item in body["items"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert usernames == [f"actor{i}" for i in reversed(range(5))]
+
+async def test_list_profiles_invalid_cursor(client, token_for_user):
+    headers = {"Authorization": f"Bearer {token_for_user}"}
+
+    response = await client.get("/api/v1/profiles", params={"cursor": "not-a-cursor"}, headers=headers)
+
+    assert response.status_code == 400
+
+async def test_list_profile_ip_addresses(client, token_for_user):
+    headers = {"Authorization": f"Bearer {token_for_user}"}
+    created = await client.post("/api/v1/profiles/create", json=profile, headers=headers)
+    url = f"/api/v1/profiles/{created.json()['id']}/ip-addresses"
+
+    first = (await client.get(url, params={"limit": 1}, headers=headers)).json()
+    second = (await client.get(url, params={"limit": 1, "cursor": first["next_cursor"]}, headers=headers)).json()
+
+    assert [ip["ip_address"] for ip in first["items"] + second["items"]] == list(reversed(profile["ip_addresses"]))
+    assert second["next_cursor"] is None
+
+async def test_record_ip_sightings(client, token_for_user):
+    headers = {"Authorization": f"Bearer {token_for_user}"}
+    created = (await client.post("/api/v1/profiles/create", json=profile, headers=headers)).json()
+    sightings = [
+        {"profile_id": created["id"], "ip_address": "10.0.0.1", "seen_at": "2030-01-01T00:00:00Z"},
+        {"profile_id": created["id"], "ip_address": "10.0.0.1"},
+        {"profile_id": created["id"] + 1, "ip_address": "10.0.0.1"},
+    ]
+
+    response = await client.post("/api/v1/ip-addresses/sightings", json={"sightings": sightings}, headers=headers)
+    history = (await client.get(f"/api/v1/profiles/{created['id']}/ip-addresses", headers=headers)).json()
+
+    assert response.json() == {"received": 3, "recorded": 1, "unknown_profile_ids": [created["id"] + 1]}
+    assert [(ip["ip_address"], ip["hit_count"]) for ip in history["items"]] == [("10.0.0.1", 3), ("192.168.1.1", 1)]
+    assert history["items"][0]["last_seen"] == "2030-01-01T00:00:00"
+
+async def test_list_profile_ip_addresses_per_day(client, token_for_user):
+    headers = {"Authorization": f"Bearer {token_for_user}"}
+    created = (await client.post("/api/v1/profiles/create", json=profile, headers=headers)).json()
+    sightings = [
+        {"profile_id": created["id"], "ip_address": "10.0.0.1", "seen_at": "2024-01-01T08:00:00Z"},
+        {"profile_id": created["id"], "ip_address": "10.0.0.1", "seen_at": "2024-01-01T20:00:00Z"},
+        {"profile_id": created["id"], "ip_address": "10.0.0.2", "seen_at": "2024-01-02T09:00:00Z"},
+    ]
+    await client.post("/api/v1/ip-addresses/sightings", json={"sightings": sightings}, headers=headers)
+    url = f"/api/v1/profiles/{created['id']}/ip-addresses"
+
+    first = (await client.get(url, params={"granularity": "day", "limit": 3}, headers=headers)).json()
+    second = (await client.get(
+        url, params={"granularity": "day", "limit": 3, "cursor": first["next_cursor"]}, headers=headers
+    )).json()
+    filtered = await client.get(url, params={"granularity": "day", "ip_address": "10.0.0.1"}, headers=headers)
+    invalid = await client.get(url, params={"granularity": "day", "ip_address": "10.0.0"}, headers=headers)
+
+    days = [(day["day"], day["ip_address"], day["hit_count"]) for day in first["items"] + second["items"]]
+    # The addresses given at creation were seen today
+    assert [day[1:] for day in days[:2]] == [("192.168.1.1", 1), ("10.0.0.1", 1)]
+    assert days[2:] == [("2024-01-02", "10.0.0.2", 1), ("2024-01-01", "10.0.0.1", 2)]
+    assert second["next_cursor"] is None
+    assert filtered.json()["items"][1:] == [{
+        "ip_address": "10.0.0.1",
+        "day": "2024-01-01",
+        "first_seen": "2024-01-01T08:00:00",
+        "last_seen": "2024-01-01T20:00:00",
+        "hit_count": 2,
+    }]
+    assert invalid.status_code == 400
+
+async def test_search_profiles_short_query(client, token_for_user):
+    headers = {"Authorization": f"Bearer {token_for_user}"}
+
+    response = await client.get("/api/v1/profiles/search", params={"q": "  ab ", "fuzzy": "true"}, headers=headers)
+
+    assert response.status_code == 400
+
+async def test_get_profile_cluster(client, token_for_user):
+    headers = {"Authorization": f"Bearer {token_for_user}"}
+    first = await client.post("/api/v1/profiles/create", json=profile, headers=headers)
+    await client.post("/api/v1/profiles/create", json={"username": "janedoe", "ip_addresses": ["10.0.0.1"]}, headers=headers)
+
+    response = await client.get(f"/api/v1/profiles/{first.json()['id']}/cluster", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["cluster_id"] == first.json()["id"]
+    assert [member["username"] for member in response.json()["profiles"]] == ["johndoe", "janedoe"]
+
+async def test_read_endpoints_query_budget(client, db, token_for_user, query_budget):
+    headers = {"Authorization": f"Bearer {token_for_user}"}
+    await ProfileRepository.bulk_create_profiles(db, [
+        ProfileSchema(username=f"actor{i}", associated_accounts=[f"old{i}"], ip_addresses=["10.0.0.1"])
+        for i in range(10)
+    ])
+    await client.get("/api/v1/profiles/1", headers=headers)
+
+    for url, budget in (
+        ("/api/v1/profiles/1", 5),
+        ("/api/v1/profiles/1/cluster", 2),
+        ("/api/v1/profiles/1/ip-addresses", 1),
+    ):
+        with query_budget(budget):
+            response = await client.get(url, headers=headers)
+        assert response.status_code == 200
+
+async def test_export_profiles_gzip(client, token_for_user):
+    headers = {"Authorization": f"Bearer {token_for_user}"}
+    await client.post("/api/v1/profiles/create", json=profile, headers=headers)
+
+    response = await client.get("/api/v1/profiles/export", params={"compression": "gzip"}, headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/gzip"
+    assert 'filename="profiles.ndjson.gz"' in response.headers["content-disposition"]
+    assert json.loads(gzip.decompress(response.content))["username"] == profile["username"]
+
+async def test_get_profile_conditional(client, db, token_for_user):
+    headers = {"Authorization": f"Bearer {token_for_user}"}
+    created = await client.post("/api/v1/profiles/create", json=profile, headers=headers)
+    url = f"/api/v1/profiles/{created.json()['id']}"
+    etag = (await client.get(url, headers=headers)).headers["etag"]
+
+    not_modified = await client.get(url, headers={**headers, "If-None-Match": f"W/{etag}"})
+    await ProfileRepository.bump_versions(db, [created.json()["id"]])
+    await db.commit()
+    modified = await client.get(url, headers={**headers, "If-None-Match": etag})
+
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+    assert not_modified.content == b""
+    assert modified.status_code == 200
+    assert modified.headers["etag"] != etag
+
+async def test_get_profile_msgpack(client, token_for_user):
+    headers = {"Authorization": f"Bearer {token_for_user}"}
+    created = await client.post("/api/v1/profiles/create", json=profile, headers=headers)
+    url = f"/api/v1/profiles/{created.json()['id']}"
+
+    as_json = await client.get(url, headers=headers)
+    as_msgpack = await client.get(url, headers={**headers, "Accept": "application/msgpack"})
+
+    assert as_msgpack.headers["content-type"] == "application/msgpack"
+    assert "Accept" in as_msgpack.headers["vary"]
+    assert msgpack.unpackb(as_msgpack.content) == as_json.json()
+    assert as_msgpack.headers["etag"] != as_json.headers["etag"]
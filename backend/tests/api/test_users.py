@@ -0,0 +1,59 @@
+import pytest
+
+from app.models import User
+
+pytestmark = pytest.mark.anyio
+
+async def test_list_users_requires_admin(client, token_for_user):
+    headers = {"Authorization": f"Bearer {token_for_user}"}
+
+    response = await client.get("/api/v1/users", headers=headers)
+
+    assert response.status_code == 403
+
+async def test_list_users_keyset_pagination(client, db, token_for_admin):
+    headers = {"Authorization": f"Bearer {token_for_admin}"}
+    db.add_all([User(username=f"user{i}", hashed_password="hashed") for i in range(3)])
+    await db.commit()
+
+    first = (await client.get("/api/v1/users", params={"limit": 2}, headers=headers)).json()
+    second = (await client.get("/api/v1/users", params={"limit": 2, "cursor": first["next_cursor"]}, headers=headers)).json()
+
+    assert [user["username"] for user in first["items"]] == ["user2", "user1"]
+    assert [user["username"] for user in second["items"]] == ["user0", "adminuser"]
+    assert second["next_cursor"] is None
+
+async def test_create_users_batch(client, db, token_for_admin, query_budget):
+    headers = {"Authorization": f"Bearer {token_for_admin}"}
+    users = [
+        {"username": "analyst1", "password": "S3cret!pwd"},
+        {"username": "adminuser", "password": "S3cret!pwd"},
+        {"username": "analyst2", "password": "S3cret!pwd"},
+        {"username": "analyst1", "password": "S3cret!pwd"},
+    ]
+
+    # Token lookup, one IN query for taken usernames and one multi-row insert
+    with query_budget(3):
+        response = await client.post("/api/v1/users/batch", json={"users": users}, headers=headers)
+
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["created"], report["failed"]) == (2, 2)
+    assert [result["created"] for result in report["results"]] == [True, False, True, False]
+    assert "already exists" in report["results"][1]["error"]
+    assert "repeated" in report["results"][3]["error"]
+    assert report["results"][2]["user"]["username"] == "analyst2"
+
+    login = await client.post("/api/v1/auth/token", data={"username": "analyst2", "password": "S3cret!pwd"})
+    assert login.status_code == 200
+
+async def test_create_users_batch_requires_admin(client, token_for_user):
+    headers = {"Authorization": f"Bearer {token_for_user}"}
+
+    response = await client.post(
+        "/api/v1/users/batch",
+        json={"users": [{"username": "analyst1", "password": "S3cret!pwd"}]},
+        headers=headers,
+    )
+
+    assert response.status_code == 403
@@ -0,0 +1,42 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.api.middleware import MetricsMiddleware, route_template
+from app.core.config import settings
+from app.core.metrics import http_requests_repeated_queries_total, request_database_stats
+
+pytestmark = pytest.mark.anyio
+
+def test_route_template():
+    def scope(path, template):
+        return {"path": path, "route": SimpleNamespace(path=template)}
+    
+    assert route_template(scope("/api/v1/profiles/5", "/{profile_id}")) == "/api/v1/profiles/{profile_id}"
+    assert route_template(scope("/api/v1/profiles/5/ip-addresses", "/{profile_id}/ip-addresses")) == "/api/v1/profiles/{profile_id}/ip-addresses"
+    assert route_template(scope("/api/v1/profiles/", "/")) == "/api/v1/profiles/"
+    assert route_template(scope("/", "/")) == "/"
+    assert route_template(scope("/metrics", "/metrics")) == "/metrics"
+    assert route_template({"path": "/nowhere"}) == "unmatched"
+
+async def test_repeated_statements_are_reported(caplog):
+    async def app(scope, receive, send):
+        for _ in range(settings.N_PLUS_ONE_THRESHOLD):
+            request_database_stats.get().statements["SELECT * FROM accounts WHERE profile_id = ?"] += 1
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+    
+    async def receive():
+        return {"type": "http.request", "body": b""}
+    
+    async def send(message):
+        pass
+    
+    repeated = http_requests_repeated_queries_total.labels("GET", "unmatched")
+    before = repeated.value
+    
+    await MetricsMiddleware(app)({"type": "http", "method": "GET", "path": "/loop"}, receive, send)
+    
+    assert repeated.value == before + 1
+    assert "Possible N+1 in GET unmatched" in caplog.text
+    assert f"ran {settings.N_PLUS_ONE_THRESHOLD} times" in caplog.text
@@ -0,0 +1,20 @@
+import pytest
+from starlette.requests import Request
+
+from app.api.responses import JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, preferred_media_type
+
+def make_request(accept: str | None) -> Request:
+    headers = [(b"accept", accept.encode())] if accept is not None else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+@pytest.mark.parametrize("accept, expected", [
+    (None, JSON_MEDIA_TYPE),
+    ("*/*", JSON_MEDIA_TYPE),
+    ("application/json", JSON_MEDIA_TYPE),
+    ("application/msgpack", MSGPACK_MEDIA_TYPE),
+    ("application/x-msgpack, */*;q=0.1", MSGPACK_MEDIA_TYPE),
+    ("application/json, application/msgpack;q=0.5", JSON_MEDIA_TYPE),
+    ("application/msgpack;q=0", JSON_MEDIA_TYPE),
+])
+def test_preferred_media_type(accept, expected):
+    assert preferred_media_type(make_request(accept)) == expected
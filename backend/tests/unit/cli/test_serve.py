@@ -0,0 +1,68 @@
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[3]
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def wait_until_serving(url: str, timeout: float = 20) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(url, timeout=1)
+            return
+        except httpx.TransportError:
+            time.sleep(0.1)
+    raise TimeoutError(f"Server at {url} did not start")
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="The launcher needs fork()")
+def test_workers_are_recycled_and_drained(tmp_path):
+    """
+    Test that workers are replaced after their request budget and that SIGTERM drains them.
+    """
+    port = free_port()
+    env = {
+        **os.environ,
+        "SQLITE_DATABASE_URL": f"sqlite:///{tmp_path / 'siena.db'}",
+        "LOG_FORMAT": "text",
+        "WEB_WORKER_MAX_REQUESTS": "2",
+        "WEB_WORKER_MAX_REQUESTS_JITTER": "0",
+        "WEB_GRACEFUL_TIMEOUT_SECONDS": "5",
+    }
+    process = subprocess.Popen(
+        [sys.executable, "-m", "app.cli.serve", "--host", "127.0.0.1", "--port", str(port), "--workers", "1"],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    try:
+        url = f"http://127.0.0.1:{port}/"
+        wait_until_serving(url)
+        # The master keeps the listening socket open, so requests sent while a
+        # worker is being replaced wait in the backlog instead of failing
+        statuses = [httpx.get(url, headers={"Connection": "close"}, timeout=5).status_code for _ in range(5)]
+        
+        process.send_signal(signal.SIGTERM)
+        output, _ = process.communicate(timeout=20)
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.communicate()
+    
+    assert statuses == [200] * 5
+    assert process.returncode == 0
+    assert "starting a replacement" in output
+    assert "All workers stopped" in output
@@ -0,0 +1,81 @@
+import json
+import logging
+import queue
+import sys
+from logging.handlers import QueueListener, RotatingFileHandler, WatchedFileHandler
+
+from app.core import logging_config
+from app.core.logging_config import JsonFormatter, NonBlockingQueueHandler, request_id_var
+from app.core.metrics import log_records_dropped_total
+
+def make_record(message: str, *args, **extra) -> logging.LogRecord:
+    record = logging.getLogger("test").makeRecord("test", logging.INFO, __file__, 1, message, args, None)
+    record.__dict__.update(extra)
+    return record
+
+def test_json_formatter():
+    record = make_record("GET %s", "/profiles", request_id="abc", duration_ms=1.5)
+    
+    entry = json.loads(JsonFormatter().format(record))
+    
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "test"
+    assert entry["message"] == "GET /profiles"
+    assert entry["request_id"] == "abc"
+    assert entry["duration_ms"] == 1.5
+    assert entry["timestamp"].endswith("+00:00")
+
+def test_queue_handler_prepares_records_on_caller():
+    handler = NonBlockingQueueHandler(queue.Queue())
+    token = request_id_var.set("req-1")
+    try:
+        try:
+            raise ValueError("bad value")
+        except ValueError:
+            record = make_record("failed %d", 3)
+            record.exc_info = sys.exc_info()
+            handler.handle(record)
+    finally:
+        request_id_var.reset(token)
+    
+    queued = handler.queue.get_nowait()
+    
+    assert queued.getMessage() == "failed 3"
+    assert queued.args is None
+    assert queued.exc_info is None
+    assert "ValueError: bad value" in queued.exc_text
+    assert queued.request_id == "req-1"
+    assert "ValueError: bad value" in json.loads(JsonFormatter().format(queued))["exception"]
+
+def test_queue_handler_drops_when_full():
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+    dropped = log_records_dropped_total.labels("INFO")
+    before = dropped.value
+    
+    handler.handle(make_record("first"))
+    handler.handle(make_record("second"))
+    
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == 1
+    assert dropped.value == before + 1
+
+def test_use_watched_log_file(tmp_path, monkeypatch):
+    # A private queue and listener, so the process-wide ones are never touched
+    log_file = str(tmp_path / "app.log")
+    log_queue = queue.Queue()
+    monkeypatch.setattr(logging_config, "log_queue", log_queue)
+    monkeypatch.setattr(logging_config, "listener", QueueListener(log_queue, RotatingFileHandler(log_file)))
+    logging_config.listener.start()
+    
+    logging_config.use_watched_log_file()
+    listener = logging_config.listener
+    try:
+        log_queue.put_nowait(make_record("after the switch"))
+    finally:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+    
+    assert [type(handler) for handler in listener.handlers] == [WatchedFileHandler]
+    assert listener.handlers[0].baseFilename == log_file
+    assert (tmp_path / "app.log").read_text() == "after the switch\n"
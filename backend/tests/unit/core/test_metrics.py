@@ -0,0 +1,58 @@
+import pytest
+
+from app.core.metrics import Counter, Gauge, Histogram, MetricsRegistry, RequestDatabaseStats
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    return MetricsRegistry()
+
+def test_counter_render(registry):
+    requests = Counter("requests_total", "Requests.", ("route",), registry=registry)
+    requests.labels("/a").inc()
+    requests.labels("/a").inc(2)
+    requests.labels('/b"\n').inc()
+    
+    text = registry.render()
+    
+    assert "# TYPE requests_total counter" in text
+    assert 'requests_total{route="/a"} 3.0' in text
+    assert 'requests_total{route="/b\\"\\n"} 1.0' in text
+    assert text.endswith("\n")
+
+def test_histogram_buckets_are_cumulative(registry):
+    latency = Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0), registry=registry)
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.labels().observe(value)
+    
+    text = registry.render()
+    
+    assert 'latency_seconds_bucket{le="0.1"} 2' in text
+    assert 'latency_seconds_bucket{le="1.0"} 3' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 4' in text
+    assert "latency_seconds_sum 3.65" in text
+    assert "latency_seconds_count 4" in text
+
+def test_labels_must_match(registry):
+    requests = Counter("requests_total", "Requests.", ("method", "route"), registry=registry)
+    
+    with pytest.raises(ValueError):
+        requests.labels("GET")
+
+def test_duplicate_metric_rejected(registry):
+    Counter("requests_total", "Requests.", registry=registry)
+    
+    with pytest.raises(ValueError):
+        Gauge("requests_total", "Requests.", registry=registry)
+
+def test_collectors_run_on_render(registry):
+    connections = Gauge("connections", "Connections.", registry=registry)
+    registry.add_collector("pool", lambda: connections.labels().set(4))
+    registry.add_collector("pool", lambda: connections.labels().set(7))
+    
+    assert "connections 7.0" in registry.render()
+
+def test_request_database_stats_repeated():
+    stats = RequestDatabaseStats()
+    stats.statements.update(["SELECT a"] * 3 + ["SELECT b"] * 5 + ["SELECT c"])
+    
+    assert stats.repeated(3) == [("SELECT b", 5), ("SELECT a", 3)]
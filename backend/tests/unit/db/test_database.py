@@ -0,0 +1,52 @@
+import pytest
+from sqlalchemy import text
+
+from app.db import database
+from app.db.database import build_engine, get_async_database_url, is_sqlite_file
+
+pytestmark = pytest.mark.anyio
+
+def test_get_async_database_url():
+    assert get_async_database_url("sqlite:///app/database.db") == "sqlite+aiosqlite:///app/database.db"
+    assert get_async_database_url("postgresql://u:p@host/siena") == "postgresql+asyncpg://u:p@host/siena"
+    assert get_async_database_url("sqlite+aiosqlite:///:memory:") == "sqlite+aiosqlite:///:memory:"
+
+def test_is_sqlite_file():
+    assert is_sqlite_file("sqlite+aiosqlite:///app/database.db")
+    assert not is_sqlite_file("sqlite+aiosqlite:///:memory:")
+    assert not is_sqlite_file("postgresql+asyncpg://u:p@host/siena")
+
+async def test_sqlite_pragmas(tmp_path):
+    """
+    Test that file-backed SQLite connections are tuned and readers are query-only.
+    """
+    url = f"sqlite+aiosqlite:///{tmp_path / 'siena.db'}"
+    writer = build_engine(url)
+    reader = build_engine(url, read_only=True)
+    
+    try:
+        async with writer.connect() as conn:
+            assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+            assert (await conn.execute(text("PRAGMA synchronous"))).scalar() == 1
+            assert (await conn.execute(text("PRAGMA query_only"))).scalar() == 0
+        
+        async with reader.connect() as conn:
+            assert (await conn.execute(text("PRAGMA query_only"))).scalar() == 1
+    finally:
+        await writer.dispose()
+        await reader.dispose()
+
+def test_server_engine_pool_options(monkeypatch):
+    """
+    Test that server databases get the tuned queue pool.
+    """
+    captured = {}
+    monkeypatch.setattr(database, "create_async_engine", lambda url, **kwargs: captured.update(kwargs))
+    monkeypatch.setattr(database.settings, "DB_POOL_SIZE", 20)
+    
+    build_engine("postgresql+asyncpg://u:p@host/siena")
+    
+    assert captured["pool_size"] == 20
+    assert captured["pool_pre_ping"] is True
+    assert captured["pool_recycle"] == database.settings.DB_POOL_RECYCLE_SECONDS
+    assert "connect_args" not in captured
@@ -0,0 +1,76 @@
+import logging
+
+import pytest
+from sqlalchemy import inspect, text
+
+import app.db.database as database
+from app.db.database import build_engine
+from app.db.init_db import get_head_revision, init_db
+from app.exceptions import DatabaseSchemaException
+
+pytestmark = pytest.mark.anyio
+
+def write_revision(directory, revision, down_revision):
+    (directory / f"{revision}_step.py").write_text(
+        f"revision: str = '{revision}'\ndown_revision: Union[str, None] = {down_revision!r}\n"
+    )
+
+def test_get_head_revision(tmp_path):
+    write_revision(tmp_path, "aaa111", None)
+    write_revision(tmp_path, "bbb222", "aaa111")
+    write_revision(tmp_path, "ccc333", "aaa111")
+    
+    with pytest.raises(RuntimeError):
+        get_head_revision(tmp_path)
+    
+    write_revision(tmp_path, "ddd444", ("bbb222", "ccc333"))
+    
+    assert get_head_revision(tmp_path) == "ddd444"
+
+def test_get_head_revision_of_repository():
+    assert get_head_revision()
+
+@pytest.fixture
+async def file_engine(tmp_path, monkeypatch):
+    engine = build_engine(f"sqlite+aiosqlite:///{tmp_path / 'siena.db'}")
+    monkeypatch.setattr(database, "engine", engine)
+    yield engine
+    await engine.dispose()
+
+async def stored_revision(engine):
+    async with engine.connect() as conn:
+        return (await conn.execute(text("SELECT version_num FROM alembic_version"))).scalar()
+
+async def test_init_db_creates_and_stamps_empty_database(file_engine, caplog):
+    caplog.set_level(logging.INFO, logger="app.db.init_db")
+    await init_db()
+    
+    assert await stored_revision(file_engine) == get_head_revision()
+    
+    caplog.clear()
+    await init_db()
+    
+    assert "Database schema is up to date" in caplog.text
+
+async def test_init_db_refuses_unversioned_database(file_engine):
+    async with file_engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY)"))
+    
+    with pytest.raises(DatabaseSchemaException, match="alembic upgrade head"):
+        await init_db()
+    
+    async with file_engine.connect() as conn:
+        tables = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names())
+    assert tables == ["users"]
+
+async def test_init_db_refuses_outdated_schema(file_engine):
+    async with file_engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)"))
+        await conn.execute(text("INSERT INTO alembic_version VALUES ('a3f1c9e2b7d4')"))
+    
+    with pytest.raises(DatabaseSchemaException, match="revision a3f1c9e2b7d4"):
+        await init_db()
+    
+    async with file_engine.connect() as conn:
+        tables = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names())
+    assert tables == ["alembic_version"]
@@ -0,0 +1,81 @@
+import pytest
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.metrics import (
+    REGISTRY,
+    RequestDatabaseStats,
+    db_pool_checkout_seconds,
+    db_queries_total,
+    request_database_stats,
+)
+from app.db.database import build_engine
+from app.db.instrumentation import InstrumentedAsyncQueuePool, QueryCounter, instrument_engine
+
+pytestmark = pytest.mark.anyio
+
+async def test_queries_are_counted_per_request(tmp_path):
+    """
+    Test that queries are counted per engine and attributed to the current request.
+    """
+    engine = build_engine(f"sqlite+aiosqlite:///{tmp_path / 'siena.db'}", read_only=True)
+    instrument_engine(engine, "test")
+    queries = db_queries_total.labels("test")
+    checkouts = db_pool_checkout_seconds.labels("reader")
+    queries_before, checkouts_before = queries.value, sum(checkouts.counts)
+    
+    stats = RequestDatabaseStats()
+    token = request_database_stats.set(stats)
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            await conn.execute(text("SELECT 2"))
+            with pytest.raises(Exception):
+                await conn.execute(text("SELECT * FROM missing_table"))
+    finally:
+        request_database_stats.reset(token)
+        await engine.dispose()
+    
+    assert isinstance(engine.sync_engine.pool, InstrumentedAsyncQueuePool)
+    assert engine.sync_engine.pool.metrics_label == "reader"
+    assert stats.queries == 2
+    assert stats.seconds > 0
+    assert queries.value - queries_before == 2
+    assert sum(checkouts.counts) > checkouts_before
+    assert 'siena_db_pool_connections{engine="test",state="checked_out"} 0.0' in REGISTRY.render()
+
+async def test_slow_queries_are_logged_with_plan(tmp_path, monkeypatch, caplog):
+    """
+    Test that queries over the threshold are logged with their query plan.
+    """
+    monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 1e-9)
+    engine = build_engine(f"sqlite+aiosqlite:///{tmp_path / 'siena.db'}")
+    instrument_engine(engine, "slow")
+    
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+            caplog.clear()
+            await conn.execute(text("SELECT name FROM items WHERE id = :id"), {"id": 1})
+    finally:
+        await engine.dispose()
+    
+    assert "Slow query on slow engine" in caplog.text
+    assert "SELECT name FROM items WHERE id = ?" in caplog.text
+    assert "SEARCH items USING INTEGER PRIMARY KEY" in caplog.text
+
+async def test_query_counter(tmp_path):
+    engine = build_engine(f"sqlite+aiosqlite:///{tmp_path / 'siena.db'}")
+    
+    try:
+        async with engine.connect() as conn:
+            with QueryCounter(engine) as queries:
+                for i in range(3):
+                    await conn.execute(text("SELECT :i"), {"i": i})
+                await conn.execute(text("SELECT 1"))
+            await conn.execute(text("SELECT 2"))
+    finally:
+        await engine.dispose()
+    
+    assert queries.count == 4
+    assert queries.repeated() == {"SELECT ?": 3}
@@ -0,0 +1,77 @@
+from pathlib import Path
+
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, text
+
+import app.models  # noqa: F401
+from app.core.config import settings
+from app.db.database import Base
+from app.db.init_db import get_head_revision
+
+ALEMBIC_DIR = Path(__file__).resolve().parents[3] / "alembic"
+
+# Schema of the original models, before any migration existed
+BASELINE_SCHEMA = [
+    """CREATE TABLE users (
+        id INTEGER NOT NULL, username VARCHAR(16) NOT NULL, hashed_password VARCHAR(128) NOT NULL,
+        is_active BOOLEAN NOT NULL, is_admin BOOLEAN NOT NULL, core_tag INTEGER NOT NULL,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, PRIMARY KEY (id)
+    )""",
+    "CREATE UNIQUE INDEX ix_users_username ON users (username)",
+    "CREATE INDEX ix_users_id ON users (id)",
+    """CREATE TABLE profiles (
+        id INTEGER NOT NULL, full_name VARCHAR(128), city VARCHAR(100), state VARCHAR(2),
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, PRIMARY KEY (id)
+    )""",
+    "CREATE INDEX ix_profiles_id ON profiles (id)",
+    """CREATE TABLE ip_addresses (
+        id INTEGER NOT NULL, profile_id INTEGER NOT NULL, ip_address VARCHAR(45) NOT NULL,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, PRIMARY KEY (id),
+        FOREIGN KEY(profile_id) REFERENCES profiles (id) ON DELETE CASCADE
+    )""",
+    "CREATE INDEX ix_ip_addresses_id ON ip_addresses (id)",
+    "CREATE INDEX ix_ip_addresses_profile_id ON ip_addresses (profile_id)",
+    """CREATE TABLE accounts (
+        id INTEGER NOT NULL, profile_id INTEGER NOT NULL, nickname VARCHAR(16) NOT NULL,
+        is_active BOOLEAN NOT NULL, account_type VARCHAR(10) NOT NULL, PRIMARY KEY (id),
+        FOREIGN KEY(profile_id) REFERENCES profiles (id)
+    )""",
+    "CREATE INDEX ix_accounts_id ON accounts (id)",
+    "INSERT INTO profiles (id, full_name) VALUES (1, 'John Doe'), (2, 'Jane Doe')",
+    "INSERT INTO accounts (profile_id, nickname, is_active, account_type) VALUES (1, 'shadow', 1, 'primary')",
+    "INSERT INTO ip_addresses (profile_id, ip_address) VALUES (1, '10.0.0.1'), (1, '10.0.0.1'), (2, '10.0.0.1')",
+]
+
+def test_upgrade_baseline_database_to_head(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'siena.db'}"
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        for statement in BASELINE_SCHEMA:
+            conn.execute(text(statement))
+    monkeypatch.setattr(settings, "DATABASE_URL", url)
+    # No config file, so env.py leaves the application's logging alone
+    config = Config()
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+
+    command.upgrade(config, "head")
+
+    with engine.connect() as conn:
+        differences = compare_metadata(MigrationContext.configure(conn), Base.metadata)
+        revision = conn.execute(text("SELECT version_num FROM alembic_version")).scalar()
+        usernames = conn.execute(text("SELECT username FROM profiles ORDER BY id")).scalars().all()
+        matches = conn.execute(text("SELECT rowid FROM profiles_fts WHERE profiles_fts MATCH 'profile1'")).scalars().all()
+        sightings = conn.execute(text("SELECT profile_id, hit_count FROM ip_addresses ORDER BY profile_id")).all()
+    engine.dispose()
+
+    # Only the FTS5 tables, which the models do not declare, differ
+    assert [
+        diff for diff in differences
+        if not (diff[0] == "remove_table" and diff[1].name.startswith(("profiles_fts", "accounts_fts")))
+    ] == []
+    assert revision == get_head_revision()
+    assert usernames == ["profile1", "profile2"]
+    assert matches == [1]
+    assert sightings == [(1, 2), (2, 1)]
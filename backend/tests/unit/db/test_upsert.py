@@ -0,0 +1,36 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.upsert import dialect_name, upsert_insert
+from app.models import User
+
+pytestmark = pytest.mark.anyio
+
+def _upsert_user(bind, username: str, hashed_password: str):
+    statement = upsert_insert(bind, User).values(username=username, hashed_password=hashed_password)
+    return statement.on_conflict_do_update(
+        index_elements=[User.username],
+        set_={"hashed_password": statement.excluded.hashed_password},
+    )
+
+async def test_upsert_insert_updates_on_conflict(db: AsyncSession):
+    await db.execute(_upsert_user(db, "analyst", "first"))
+    await db.execute(_upsert_user(db, "analyst", "second"))
+    await db.commit()
+    
+    rows = (await db.execute(select(User.username, User.hashed_password))).all()
+    
+    assert rows == [("analyst", "second")]
+
+def test_upsert_insert_compiles_for_postgresql():
+    sql = str(_upsert_user("postgresql", "analyst", "hash").compile(dialect=postgresql.dialect()))
+    
+    assert "ON CONFLICT (username) DO UPDATE SET hashed_password = excluded.hashed_password" in sql
+
+async def test_upsert_insert_unsupported_dialect(db: AsyncSession):
+    assert dialect_name(db) in ("sqlite", "postgresql")
+    
+    with pytest.raises(NotImplementedError):
+        upsert_insert("mssql", User)
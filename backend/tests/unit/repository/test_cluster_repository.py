@@ -0,0 +1,72 @@
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Profile
+from app.repository import ClusterRepository, ProfileRepository
+from app.schemas.profile_schema import ProfileSchema
+
+pytestmark = pytest.mark.anyio
+
+async def clusters(db: AsyncSession) -> dict[str, int]:
+    result = await db.execute(select(Profile.username, Profile.cluster_id))
+    return dict(result.all())
+
+async def test_incremental_clustering(db: AsyncSession):
+    ids = await ProfileRepository.bulk_create_profiles(db, [
+        ProfileSchema(username="actor1", ip_addresses=["10.0.0.1"]),
+        ProfileSchema(username="actor2", ip_addresses=["10.0.0.1"]),
+        ProfileSchema(username="actor3", associated_accounts=["ghost99"]),
+        ProfileSchema(username="actor4", ip_addresses=["10.0.0.9"]),
+    ])
+    
+    assert await clusters(db) == {
+        "actor1": ids["actor1"],
+        "actor2": ids["actor1"],
+        "actor3": ids["actor3"],
+        "actor4": ids["actor4"],
+    }
+    
+    # A new profile bridging two existing clusters merges them.
+    await ProfileRepository.create_profile(
+        db, ProfileSchema(username="bridge", associated_accounts=["ghost99"], ip_addresses=["10.0.0.1"])
+    )
+    
+    result = await clusters(db)
+    assert {result[name] for name in ("actor1", "actor2", "actor3", "bridge")} == {ids["actor1"]}
+    assert result["actor4"] == ids["actor4"]
+    
+    cluster_id, members = await ClusterRepository.get_cluster_members(db, ids["actor3"])
+    assert cluster_id == ids["actor1"]
+    assert [member.username for member in members] == ["actor1", "actor2", "actor3", "bridge"]
+
+async def test_rebuild(db: AsyncSession):
+    ids = await ProfileRepository.bulk_create_profiles(db, [
+        ProfileSchema(username="actor1", ip_addresses=["10.0.0.1"]),
+        ProfileSchema(username="actor2", ip_addresses=["10.0.0.1"], associated_accounts=["ghost99"]),
+        ProfileSchema(username="actor3", associated_accounts=["ghost99"]),
+        ProfileSchema(username="actor4"),
+    ])
+    await db.execute(update(Profile).values(cluster_id=None))
+    
+    assert await ClusterRepository.rebuild(db) == 2
+    assert await clusters(db) == {
+        "actor1": ids["actor1"],
+        "actor2": ids["actor1"],
+        "actor3": ids["actor1"],
+        "actor4": ids["actor4"],
+    }
+
+async def test_relabelling_bumps_versions(db: AsyncSession):
+    ids = await ProfileRepository.bulk_create_profiles(db, [
+        ProfileSchema(username="actor1", ip_addresses=["10.0.0.1"]),
+        ProfileSchema(username="actor2", associated_accounts=["ghost99"]),
+    ])
+    before = {name: await ProfileRepository.get_version(db, profile_id) for name, profile_id in ids.items()}
+    
+    await ProfileRepository.create_profile(
+        db, ProfileSchema(username="bridge", associated_accounts=["ghost99"], ip_addresses=["10.0.0.1"])
+    )
+    
+    assert await ProfileRepository.get_version(db, ids["actor1"]) == before["actor1"]
+    assert await ProfileRepository.get_version(db, ids["actor2"]) == before["actor2"] + 1
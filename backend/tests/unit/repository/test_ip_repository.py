@@ -0,0 +1,91 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import IPAddress
+from app.repository import IPRepository, ProfileRepository
+from app.schemas.ip_address_schema import IPSighting
+from app.schemas.profile_schema import ProfileSchema
+
+pytestmark = pytest.mark.anyio
+
+@pytest.fixture
+async def profiles(db: AsyncSession):
+    await ProfileRepository.bulk_create_profiles(db, [
+        ProfileSchema(username="actor1", ip_addresses=["177.12.4.2", "10.0.0.1"]),
+        ProfileSchema(username="actor2", ip_addresses=["177.12.200.9"]),
+        ProfileSchema(username="actor3", ip_addresses=["177.13.0.1", "2001:db8::1"]),
+    ])
+
+async def test_search_exact(db: AsyncSession, profiles):
+    result = await IPRepository.search(db, "10.0.0.1")
+    
+    assert [ip.ip_address for ip in result] == ["10.0.0.1"]
+
+async def test_search_cidr_and_prefix(db: AsyncSession, profiles):
+    cidr = await IPRepository.search(db, "177.12.0.0/16")
+    prefix = await IPRepository.search(db, "177.12.")
+    
+    assert [ip.ip_address for ip in cidr] == ["177.12.4.2", "177.12.200.9"]
+    assert [ip.id for ip in prefix] == [ip.id for ip in cidr]
+
+async def test_get_profile_ids(db: AsyncSession, profiles):
+    actor1 = await ProfileRepository.get_by_username(db, "actor1")
+    actor2 = await ProfileRepository.get_by_username(db, "actor2")
+    actor3 = await ProfileRepository.get_by_username(db, "actor3")
+    
+    assert await IPRepository.get_profile_ids(db, "2001:db8::/32") == [actor3.id]
+    assert await IPRepository.get_profile_ids(db, "0.0.0.0/0") == sorted([actor1.id, actor2.id, actor3.id])
+
+async def test_record_sightings_aggregates(db: AsyncSession, profiles):
+    actor1 = await ProfileRepository.get_by_username(db, "actor1")
+    version = await ProfileRepository.get_version(db, actor1.id)
+    sightings = [
+        IPSighting(profile_id=actor1.id, ip_address="10.9.9.9", seen_at=datetime(2024, 1, 1, 12)),
+        IPSighting(profile_id=actor1.id, ip_address="10.9.9.9", seen_at=datetime(2023, 6, 1)),
+        IPSighting(profile_id=actor1.id, ip_address="192.168.0.7", seen_at=datetime(2024, 2, 1)),
+        IPSighting(profile_id=9999, ip_address="192.168.0.7"),
+    ]
+    
+    report = await IPRepository.record_sightings(db, sightings)
+    await IPRepository.record_sightings(db, [IPSighting(profile_id=actor1.id, ip_address="10.9.9.9", seen_at=datetime(2025, 3, 1))])
+    
+    assert (report.received, report.recorded, report.unknown_profile_ids) == (4, 2, [9999])
+    rows = (await db.execute(
+        select(IPAddress.ip_address, IPAddress.first_seen, IPAddress.last_seen, IPAddress.hit_count)
+        .where(IPAddress.profile_id == actor1.id, IPAddress.ip_address.in_(["10.9.9.9", "192.168.0.7"]))
+        .order_by(IPAddress.ip_address)
+    )).all()
+    assert rows == [
+        ("10.9.9.9", datetime(2023, 6, 1), datetime(2025, 3, 1), 3),
+        ("192.168.0.7", datetime(2024, 2, 1), datetime(2024, 2, 1), 1),
+    ]
+    assert await ProfileRepository.get_version(db, actor1.id) > version
+    assert await IPRepository.get_profile_ids(db, "192.168.0.7") == [actor1.id]
+
+async def test_upsert_sightings_batch(db: AsyncSession, profiles, query_budget):
+    actor2 = await ProfileRepository.get_by_username(db, "actor2")
+    sightings = [IPSighting(profile_id=actor2.id, ip_address=f"10.1.{i % 50}.1") for i in range(5000)]
+    
+    with query_budget(1):
+        rows = await IPRepository.upsert_sightings(db, sightings)
+    await db.commit()
+    
+    assert len(rows) == 50
+    assert all(row["hit_count"] == 100 for row in rows)
+
+async def test_list_for_profile_is_stable_under_sightings(db: AsyncSession):
+    addresses = [f"10.2.0.{i}" for i in range(5)]
+    ids = await ProfileRepository.bulk_create_profiles(db, [ProfileSchema(username="actor1", ip_addresses=addresses)])
+    
+    first, cursor = await IPRepository.list_for_profile(db, ids["actor1"], limit=2)
+    # Seeing a not yet listed address again must not move it before the cursor
+    await IPRepository.record_sightings(db, [IPSighting(profile_id=ids["actor1"], ip_address="10.2.0.0", seen_at=datetime(2030, 1, 1))])
+    rest = []
+    while cursor is not None:
+        page, cursor = await IPRepository.list_for_profile(db, ids["actor1"], limit=2, cursor=cursor)
+        rest.extend(page)
+    
+    assert sorted(ip.ip_address for ip in first + rest) == addresses
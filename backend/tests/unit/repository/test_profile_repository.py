@@ -0,0 +1,97 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.fulltext import search_matches
+from app.models import IPAddress, Profile, RawSighting
+from app.repository import ProfileRepository
+from app.schemas.profile_schema import ProfileSchema
+
+pytestmark = pytest.mark.anyio
+
+@pytest.fixture
+async def profiles(db: AsyncSession):
+    await ProfileRepository.bulk_create_profiles(db, [
+        ProfileSchema(username="darklord", full_name="John Smith"),
+        ProfileSchema(username="phantom", full_name="Maria Lordes", associated_accounts=["ghost99"]),
+        ProfileSchema(username="zeroday", full_name="Carlos Silva", associated_accounts=["darkstar"]),
+    ])
+
+async def test_search_substring(db: AsyncSession, profiles):
+    results = await ProfileRepository.search(db, "lord")
+    
+    assert sorted(profile.username for profile, _ in results) == ["darklord", "phantom"]
+
+async def test_search_account_nickname(db: AsyncSession, profiles):
+    results = await ProfileRepository.search(db, "GHOST")
+    
+    assert [profile.username for profile, _ in results] == ["phantom"]
+
+async def test_search_fuzzy(db: AsyncSession, profiles):
+    assert await ProfileRepository.search(db, "darkl0rd") == []
+    
+    results = await ProfileRepository.search(db, "darkl0rd", fuzzy=True)
+    
+    assert results[0][0].username == "darklord"
+
+async def test_search_pagination(db: AsyncSession, profiles):
+    first = await ProfileRepository.search(db, "dark", limit=1)
+    second = await ProfileRepository.search(db, "dark", limit=1, offset=1)
+    
+    assert len(first) == len(second) == 1
+    assert first[0][0].id != second[0][0].id
+
+async def test_search_like_fallback(db: AsyncSession, profiles):
+    """
+    Test the LIKE search used on databases without FTS5; it is portable SQL, so it runs on SQLite too.
+    """
+    async def search(query: str, fuzzy: bool = False) -> list[str]:
+        matches = search_matches("postgresql", query, fuzzy=fuzzy)
+        result = await db.execute(
+            select(Profile.username).join(matches, Profile.id == matches.c.profile_id).order_by(matches.c.score, Profile.id)
+        )
+        return list(result.scalars().all())
+    
+    assert await search("LORD") == ["darklord", "phantom"]
+    assert await search("ghost") == ["phantom"]
+    assert await search("darkl0rd") == []
+    assert (await search("darkl0rd", fuzzy=True))[0] == "darklord"
+
+async def test_search_rejects_short_normalized_query(db: AsyncSession, profiles):
+    for fuzzy in (False, True):
+        with pytest.raises(ValueError, match="at least 3 characters"):
+            await ProfileRepository.search(db, "  ab ", fuzzy=fuzzy)
+        with pytest.raises(ValueError, match="at least 3 characters"):
+            search_matches("postgresql", "  ab ", fuzzy=fuzzy)
+
+async def test_list_details_pages_through_equal_timestamps(db: AsyncSession):
+    await ProfileRepository.bulk_create_profiles(db, [ProfileSchema(username=f"actor{i}") for i in range(7)])
+    
+    seen, cursor = [], None
+    for _ in range(5):
+        page, cursor = await ProfileRepository.list_details(db, limit=3, cursor=cursor)
+        seen.extend(profile.id for profile in page)
+        if cursor is None:
+            break
+    
+    assert seen == sorted(seen, reverse=True)
+    assert len(seen) == len(set(seen)) == 7
+
+async def test_created_ip_addresses_reach_the_sighting_journal(db: AsyncSession):
+    ids = await ProfileRepository.bulk_create_profiles(db, [
+        ProfileSchema(username="darklord", ip_addresses=["10.0.0.1", "10.0.0.1"]),
+    ])
+    created = await ProfileRepository.create_profile(db, ProfileSchema(username="phantom", ip_addresses=["10.0.0.2"]))
+    
+    journal = (await db.execute(
+        select(RawSighting.profile_id, RawSighting.ip_address).order_by(RawSighting.id)
+    )).all()
+    pairs = (await db.execute(
+        select(IPAddress.profile_id, IPAddress.hit_count, IPAddress.first_seen == RawSighting.seen_at)
+        .join(RawSighting, RawSighting.profile_id == IPAddress.profile_id)
+        .distinct()
+        .order_by(IPAddress.profile_id)
+    )).all()
+    
+    assert journal == [(ids["darklord"], "10.0.0.1"), (ids["darklord"], "10.0.0.1"), (created.id, "10.0.0.2")]
+    assert pairs == [(ids["darklord"], 2, True), (created.id, 1, True)]
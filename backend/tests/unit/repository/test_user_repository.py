@@ -1,33 +1,36 @@
 import pytest
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repository.user_repository import UserRepository
 from app.models import User
 
-def test_get_by_username_existing_user(db: Session, test_user: User):
+pytestmark = pytest.mark.anyio
+
+async def test_get_by_username_existing_user(db: AsyncSession, test_user: User):
     # Act
-    result = UserRepository.get_by_username(db, test_user.username)
+    result = await UserRepository.get_by_username(db, test_user.username)
     
     # Assert
     assert result is not None
     assert result.username == test_user.username
     
-def test_get_by_username_nonexistent_user(db: Session):
+async def test_get_by_username_nonexistent_user(db: AsyncSession):
     """Test retrieving a non-existent user by username."""
     # Act
-    result = UserRepository.get_by_username(db, "nonexistent")
+    result = await UserRepository.get_by_username(db, "nonexistent")
     
     # Assert
     assert result is None
     
-def test_create_user(db: Session):
+async def test_create_user(db: AsyncSession):
     """Test creating a new user."""
     # Arrange
     username = "newuser"
     hashed_password = "hashed_password_value"
     
     # Act
-    result = UserRepository.create_user(db, username, hashed_password)
+    result = await UserRepository.create_user(db, username, hashed_password)
     
     # Assert
     assert result is not None
@@ -35,7 +38,18 @@ def test_create_user(db: Session):
     assert result.hashed_password == hashed_password
     
     # Verify user was added to DB
-    retrieved = db.query(User).filter(User.username == username).first()
+    retrieved = (await db.execute(select(User).where(User.username == username))).scalars().first()
     assert retrieved is not None
     assert retrieved.username == username
-    assert retrieved.hashed_password == hashed_password
\ No newline at end of file
+    assert retrieved.hashed_password == hashed_password
+    
+async def test_bulk_create_users(db: AsyncSession, test_user: User):
+    """Test creating several users at once and finding taken usernames."""
+    # Act
+    users = await UserRepository.bulk_create_users(db, [("alpha", "hash-a"), ("bravo", "hash-b")])
+    existing = await UserRepository.get_existing_usernames(db, ["alpha", "bravo", "charlie", test_user.username])
+    
+    # Assert
+    assert sorted(users) == ["alpha", "bravo"]
+    assert all(user.id is not None and user.is_active for user in users.values())
+    assert existing == {"alpha", "bravo", test_user.username}
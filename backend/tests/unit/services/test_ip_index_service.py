@@ -0,0 +1,62 @@
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import IPAddress
+from app.repository import IPRepository, ProfileRepository
+from app.schemas.ip_address_schema import IPSighting
+from app.schemas.profile_schema import ProfileSchema
+from app.services.ip_index_service import IPIndex, ip_index
+
+pytestmark = pytest.mark.anyio
+
+async def test_rebuild_and_sync(db: AsyncSession):
+    ids = await ProfileRepository.bulk_create_profiles(db, [
+        ProfileSchema(username="actor1", ip_addresses=["177.12.4.2"]),
+        ProfileSchema(username="actor2", ip_addresses=["177.12.200.9", "10.0.0.1"]),
+    ])
+    index = IPIndex()
+    await index.rebuild(db)
+    
+    assert index.ready
+    assert index.lookup("177.12.0.0/16") == sorted(ids.values())
+    assert index.lookup("10.0.0.1") == [ids["actor2"]]
+    
+    more = await ProfileRepository.bulk_create_profiles(db, [
+        ProfileSchema(username="actor3", ip_addresses=["10.0.0.1"]),
+    ])
+    await index.sync(db)
+    
+    assert index.lookup("10.0.0.0/8") == sorted([ids["actor2"], more["actor3"]])
+    assert index.stats()["entries"] == 4
+
+async def test_sync_picks_up_ids_committed_out_of_order(db: AsyncSession):
+    ids = await ProfileRepository.bulk_create_profiles(db, [
+        ProfileSchema(username="actor1", ip_addresses=[]),
+        ProfileSchema(username="actor2", ip_addresses=[]),
+    ])
+    index = IPIndex()
+    await index.rebuild(db)
+    
+    # A later transaction commits first and moves the watermark to 1000
+    await db.execute(insert(IPAddress).values(id=1000, profile_id=ids["actor1"], ip_address="10.0.0.1"))
+    await db.commit()
+    await index.sync(db)
+    # The transaction that was handed ID 500 commits afterwards
+    await db.execute(insert(IPAddress).values(id=500, profile_id=ids["actor2"], ip_address="10.0.0.2"))
+    await db.commit()
+    await index.sync(db)
+    
+    assert index.lookup("10.0.0.0/24") == sorted(ids.values())
+
+async def test_committed_sightings_reach_the_index(db: AsyncSession):
+    ids = await ProfileRepository.bulk_create_profiles(db, [
+        ProfileSchema(username="actor1", ip_addresses=["203.0.113.7"]),
+    ])
+    await IPRepository.record_sightings(db, [IPSighting(profile_id=ids["actor1"], ip_address="203.0.113.8")])
+    await db.execute(insert(IPAddress), [{"profile_id": ids["actor1"], "ip_address": "203.0.113.9"}])
+    await db.rollback()
+    
+    assert ip_index.lookup("203.0.113.7") == [ids["actor1"]]
+    assert ip_index.lookup("203.0.113.8") == [ids["actor1"]]
+    assert ip_index.lookup("203.0.113.9") == []
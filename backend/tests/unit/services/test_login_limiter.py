@@ -0,0 +1,81 @@
+import time
+
+import pytest
+
+from app.services.auth.login_limiter import LoginRateLimiter
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(time, "monotonic", clock)
+    return clock
+
+def make_limiter(**overrides) -> LoginRateLimiter:
+    options = dict(username_burst=3, username_per_minute=6, ip_burst=10, ip_per_minute=60, max_keys=100)
+    options.update(overrides)
+    return LoginRateLimiter(**options)
+
+def test_username_burst_then_refill(clock):
+    """
+    Test that a username is limited after its burst and regains one attempt per refill interval.
+    """
+    limiter = make_limiter()
+    
+    assert [limiter.acquire("alice", "10.0.0.1") for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.acquire("alice", "10.0.0.2") == pytest.approx(10.0)
+    assert limiter.acquire("bob", "10.0.0.1") == 0.0
+    
+    clock.now += 10
+    assert limiter.acquire("alice", "10.0.0.3") == 0.0
+
+def test_ip_limit_spans_usernames(clock):
+    """
+    Test that one client address cannot spray attempts across many usernames.
+    """
+    limiter = make_limiter(ip_burst=2)
+    
+    assert limiter.acquire("alice", "10.0.0.1") == 0.0
+    assert limiter.acquire("bob", "10.0.0.1") == 0.0
+    assert limiter.acquire("carol", "10.0.0.1") > 0
+    # The rejected attempt did not spend carol's tokens.
+    assert limiter.acquire("carol", "10.0.0.2") == 0.0
+
+def test_reset_username(clock):
+    """
+    Test that a successful login refills the username's bucket.
+    """
+    limiter = make_limiter(username_burst=1)
+    limiter.acquire("alice", None)
+    limiter.reset_username("alice")
+    
+    assert limiter.acquire("alice", None) == 0.0
+
+def test_refilled_buckets_expire(clock):
+    """
+    Test that buckets are dropped once full again and the key count is capped.
+    """
+    limiter = make_limiter(max_keys=4)
+    for i in range(10):
+        limiter.acquire(f"user{i}", None)
+    
+    assert len(limiter) == 4
+    
+    clock.now += 10
+    limiter.acquire("fresh", None)
+    assert len(limiter) == 1
+
+def test_disabled_scope(clock):
+    """
+    Test that a zero burst disables a scope.
+    """
+    limiter = make_limiter(username_burst=0, ip_burst=0)
+    
+    assert all(limiter.acquire("alice", "10.0.0.1") == 0.0 for _ in range(50))
+    assert len(limiter) == 0
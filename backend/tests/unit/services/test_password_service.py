@@ -0,0 +1,41 @@
+import threading
+
+import pytest
+
+from app.exceptions import PasswordHashQueueFullException
+from app.services.auth import password_service
+from app.services.auth.password_service import hash_password_async, hash_passwords_async, verify_password, verify_password_async
+
+pytestmark = pytest.mark.anyio
+
+async def test_hash_password_async():
+    """
+    Test hashing and verifying a password through the process pool.
+    """
+    hashed = await hash_password_async("S3cret!pwd")
+    
+    assert verify_password("S3cret!pwd", hashed)
+    assert await verify_password_async("S3cret!pwd", hashed)
+    assert not await verify_password_async("wrong", hashed)
+
+async def test_hash_passwords_async(monkeypatch):
+    """
+    Test hashing a batch of passwords in chunks, keeping their order.
+    """
+    monkeypatch.setattr(password_service.settings, "PASSWORD_HASH_WORKERS", 2)
+    passwords = [f"S3cret!pwd{i}" for i in range(3)]
+    
+    hashed = await hash_passwords_async(passwords)
+    
+    assert len(hashed) == 3
+    assert all(verify_password(password, value) for password, value in zip(passwords, hashed))
+
+async def test_hash_password_async_queue_full(monkeypatch):
+    """
+    Test that hashing is rejected immediately when the queue is full.
+    """
+    monkeypatch.setattr(password_service, "_hash_slots", threading.BoundedSemaphore(1))
+    password_service._hash_slots.acquire()
+    
+    with pytest.raises(PasswordHashQueueFullException):
+        await hash_password_async("S3cret!pwd")
@@ -0,0 +1,63 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repository import ProfileRepository
+from app.schemas.profile_schema import ProfileSchema
+from app.services.profile_export_service import CSV_COLUMNS, ProfileExportService
+
+pytestmark = pytest.mark.anyio
+
+@pytest.fixture
+async def profiles(db: AsyncSession):
+    await ProfileRepository.bulk_create_profiles(db, [
+        ProfileSchema(username=f"actor{i}", city="Recife", associated_accounts=[f"old{i}", f"older{i}"], ip_addresses=[f"10.0.0.{i}"])
+        for i in range(5)
+    ])
+
+async def collect(stream) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+async def test_export_ndjson(db: AsyncSession, profiles):
+    body = await collect(ProfileExportService.export(db, "ndjson", batch_size=2))
+    records = [json.loads(line) for line in body.splitlines()]
+    
+    assert [record["username"] for record in records] == [f"actor{i}" for i in range(5)]
+    assert records[0]["associated_accounts"] == ["old0", "older0"]
+    assert records[0]["ip_addresses"] == ["10.0.0.0"]
+    assert ProfileSchema.model_validate(records[1]).username == "actor1"
+
+async def test_export_csv_gzip(db: AsyncSession, profiles):
+    body = await collect(ProfileExportService.export(db, "csv", compression="gzip", batch_size=2))
+    rows = list(csv.DictReader(io.StringIO(gzip.decompress(body).decode())))
+    
+    assert len(rows) == 5
+    assert rows[4]["username"] == "actor4"
+    assert rows[4]["associated_accounts"] == "old4,older4"
+
+async def test_export_zstd(db: AsyncSession, profiles):
+    zstandard = pytest.importorskip("zstandard")
+    body = await collect(ProfileExportService.export(db, "ndjson", compression="zstd"))
+    
+    assert len(zstandard.ZstdDecompressor().decompressobj().decompress(body).splitlines()) == 5
+
+async def test_export_releases_batches(db: AsyncSession, profiles):
+    db.expunge_all()
+    sizes = []
+    async for _ in ProfileExportService.iter_record_batches(db, batch_size=2):
+        sizes.append(len(db.identity_map))
+    
+    assert sizes == [0, 0, 0]
+
+async def test_export_empty_csv_has_header(db: AsyncSession):
+    body = await collect(ProfileExportService.export(db, "csv"))
+    
+    assert body.decode().splitlines() == [",".join(CSV_COLUMNS)]
+
+async def test_export_rejects_unknown_format(db: AsyncSession):
+    with pytest.raises(ValueError):
+        ProfileExportService.export(db, "xml")
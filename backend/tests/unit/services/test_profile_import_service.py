@@ -0,0 +1,58 @@
+import json
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models import Account, IPAddress, Profile
+from app.services.profile_import_service import ProfileImportService, iter_ndjson_lines
+
+pytestmark = pytest.mark.anyio
+
+async def as_chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+async def test_iter_ndjson_lines_across_chunks():
+    data = b'{"a": 1}\n\n{"b": 2}\n{"c": 3}'
+    
+    lines = [line async for line in iter_ndjson_lines(as_chunks(data, 3))]
+    
+    assert lines == [(1, b'{"a": 1}'), (3, b'{"b": 2}'), (4, b'{"c": 3}')]
+
+async def test_iter_ndjson_lines_skips_long_lines():
+    data = b'{"a": 1}\n' + b"x" * 100 + b'\n{"b": 2}\n' + b"y" * 100
+    
+    lines = [line async for line in iter_ndjson_lines(as_chunks(data, 7), max_line_bytes=8)]
+    
+    assert lines == [(1, b'{"a": 1}'), (2, None), (3, b'{"b": 2}'), (4, None)]
+
+async def test_import_ndjson(db: AsyncSession):
+    rows = [
+        {"username": "actor1", "associated_accounts": ["old1"], "ip_addresses": ["10.0.0.1"]},
+        {"username": "actor2", "ip_addresses": ["10.0.0.2", "10.0.0.3"]},
+        {"username": "a"},
+        {"username": "actor1"},
+        {"username": "actor3"},
+    ]
+    data = "\n".join(json.dumps(row) for row in rows).encode() + b"\nnot json\n"
+    
+    report = await ProfileImportService.import_ndjson(db, as_chunks(data, 16), batch_size=2)
+    
+    assert report.processed == 6
+    assert report.created == 3
+    assert report.failed == 3
+    assert [error.line for error in report.errors] == [3, 4, 6]
+    assert await db.scalar(select(func.count()).select_from(Profile)) == 3
+    assert await db.scalar(select(func.count()).select_from(Account)) == 4
+    assert await db.scalar(select(func.count()).select_from(IPAddress)) == 3
+
+async def test_import_ndjson_reports_long_lines(db: AsyncSession, monkeypatch):
+    monkeypatch.setattr(settings, "PROFILE_IMPORT_MAX_LINE_BYTES", 64)
+    data = b'{"username": "actor1"}\n{"username": "' + b"a" * 1000 + b'"}\n{"username": "actor2"}'
+    
+    report = await ProfileImportService.import_ndjson(db, as_chunks(data, 16))
+    
+    assert report.created == 2
+    assert [(error.line, error.error) for error in report.errors] == [(2, "Line exceeds 64 bytes")]
@@ -0,0 +1,86 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+import app.db.database as database
+from app.db.database import build_engine
+from app.db.init_db import init_db
+from app.models import DailySighting, RawSighting
+from app.repository import IPRepository, ProfileRepository
+from app.schemas.ip_address_schema import IPSighting
+from app.schemas.profile_schema import ProfileSchema
+from app.services.retention_service import SightingRetentionService
+
+pytestmark = pytest.mark.anyio
+
+@pytest.fixture
+async def session_factory(tmp_path, monkeypatch):
+    engine = build_engine(f"sqlite+aiosqlite:///{tmp_path / 'siena.db'}")
+    monkeypatch.setattr(database, "engine", engine)
+    await init_db()
+    yield async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    await engine.dispose()
+
+async def test_roll_up_keeps_daily_activity(session_factory):
+    async with session_factory() as db:
+        ids = await ProfileRepository.bulk_create_profiles(db, [ProfileSchema(username="actor1")])
+        actor = ids["actor1"]
+        await IPRepository.record_sightings(db, [
+            IPSighting(profile_id=actor, ip_address="10.0.0.1", seen_at=datetime(2024, 1, 1, 8)),
+            IPSighting(profile_id=actor, ip_address="10.0.0.1", seen_at=datetime(2024, 1, 1, 20)),
+            IPSighting(profile_id=actor, ip_address="10.0.0.1", seen_at=datetime(2024, 1, 2, 9)),
+            IPSighting(profile_id=actor, ip_address="10.0.0.2", seen_at=datetime(2024, 1, 1, 12)),
+            IPSighting(profile_id=actor, ip_address="10.0.0.1", seen_at=datetime(2024, 3, 1)),
+        ])
+        before = await IPRepository.list_daily_for_profile(db, actor)
+    
+    moved = await SightingRetentionService.roll_up(session_factory, datetime(2024, 2, 1), batch_size=2)
+    
+    async with session_factory() as db:
+        after = await IPRepository.list_daily_for_profile(db, actor)
+        raw = (await db.execute(select(func.count()).select_from(RawSighting))).scalar()
+        daily = (await db.execute(
+            select(DailySighting.ip_address, DailySighting.day, DailySighting.hit_count)
+            .order_by(DailySighting.day, DailySighting.ip_address)
+        )).all()
+        page, cursor = await IPRepository.list_daily_for_profile(db, actor, ip_address="10.0.0.1", limit=2)
+        rest, _ = await IPRepository.list_daily_for_profile(db, actor, ip_address="10.0.0.1", cursor=cursor)
+    
+    assert moved == 4
+    assert raw == 1
+    assert [(row[0], row[1].isoformat(), row[2]) for row in daily] == [
+        ("10.0.0.1", "2024-01-01", 2), ("10.0.0.2", "2024-01-01", 1), ("10.0.0.1", "2024-01-02", 1),
+    ]
+    assert after == before
+    assert [(entry.day.isoformat(), entry.hit_count) for entry in page + rest] == [
+        ("2024-03-01", 1), ("2024-01-02", 1), ("2024-01-01", 2),
+    ]
+    assert after[0][-1].first_seen == datetime(2024, 1, 1, 8) and after[0][-1].last_seen == datetime(2024, 1, 1, 20)
+
+async def test_run_rolls_up_and_vacuums(session_factory):
+    async with session_factory() as db:
+        ids = await ProfileRepository.bulk_create_profiles(db, [ProfileSchema(username="actor1")])
+        await IPRepository.record_sightings(db, [
+            IPSighting(profile_id=ids["actor1"], ip_address="10.0.0.1", seen_at=datetime(2024, 1, 1, i // 3600, i // 60 % 60, i % 60))
+            for i in range(3000)
+        ])
+        await IPRepository.record_sightings(db, [
+            IPSighting(profile_id=ids["actor1"], ip_address="10.0.0.2", seen_at=datetime(2024, 6, 30)),
+        ])
+        pages = (await db.execute(text("PRAGMA page_count"))).scalar()
+    
+    moved = await SightingRetentionService.run(session_factory, now=datetime(2024, 7, 1))
+    
+    async with session_factory() as db:
+        remaining = (await db.execute(select(RawSighting.ip_address))).scalars().all()
+        daily = (await db.execute(select(DailySighting.hit_count))).scalars().all()
+        assert (await db.execute(text("PRAGMA freelist_count"))).scalar() == 0
+        assert (await db.execute(text("PRAGMA page_count"))).scalar() < pages
+    assert moved == 3000
+    assert remaining == ["10.0.0.2"]
+    assert daily == [3000]
+
+async def test_incremental_vacuum_skips_databases_without_incremental_mode(db: AsyncSession):
+    assert not await SightingRetentionService.incremental_vacuum(db)
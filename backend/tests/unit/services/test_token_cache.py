@@ -0,0 +1,57 @@
+import time
+
+from app.schemas.user import UserPublic
+from app.services.auth.token_cache import TokenCache
+
+def make_user(user_id: int) -> UserPublic:
+    return UserPublic(id=user_id, username=f"user{user_id}", is_active=True)
+
+def test_get_cached_token():
+    """
+    Test that a cached token returns its claims and user snapshot.
+    """
+    cache = TokenCache(max_size=10, ttl_seconds=60)
+    claims = {"sub": "user1", "exp": time.time() + 600}
+    cache.set("token", claims, make_user(1))
+    
+    assert cache.get("token") == (claims, make_user(1))
+    assert cache.get("other") is None
+
+def test_token_expiry_bounds_ttl():
+    """
+    Test that an entry never outlives the token's exp claim.
+    """
+    cache = TokenCache(max_size=10, ttl_seconds=60)
+    cache.set("expired", {"sub": "user1", "exp": time.time() - 1}, make_user(1))
+    
+    assert cache.get("expired") is None
+    assert len(cache) == 0
+
+def test_least_recently_used_is_evicted():
+    """
+    Test that the least recently used token is evicted when full.
+    """
+    cache = TokenCache(max_size=2, ttl_seconds=60)
+    cache.set("a", {"sub": "user1"}, make_user(1))
+    cache.set("b", {"sub": "user2"}, make_user(2))
+    cache.get("a")
+    cache.set("c", {"sub": "user3"}, make_user(3))
+    
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+def test_invalidate_user():
+    """
+    Test that invalidating a user drops all of its tokens.
+    """
+    cache = TokenCache(max_size=10, ttl_seconds=60)
+    cache.set("a", {"sub": "user1"}, make_user(1))
+    cache.set("b", {"sub": "user1"}, make_user(1))
+    cache.set("c", {"sub": "user2"}, make_user(2))
+    
+    cache.invalidate_user(1)
+    
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
@@ -0,0 +1,22 @@
+from datetime import date, datetime
+
+import pytest
+
+from app.utils.cursor import decode_cursor, decode_day_cursor, encode_cursor, encode_day_cursor
+
+def test_cursor_round_trip():
+    timestamp = datetime(2025, 5, 24, 12, 30, 15)
+    
+    assert decode_cursor(encode_cursor(timestamp, 42)) == (timestamp, 42)
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "WzEsMl0", "WyIyMDI1LTA1LTI0IiwiMSJd"])
+def test_decode_invalid_cursor(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+def test_day_cursor_round_trip():
+    cursor = encode_day_cursor(date(2024, 1, 2), "10.0.0.1")
+    
+    assert decode_day_cursor(cursor) == (date(2024, 1, 2), "10.0.0.1")
+    with pytest.raises(ValueError):
+        decode_day_cursor(encode_cursor(datetime(2024, 1, 2), 42))
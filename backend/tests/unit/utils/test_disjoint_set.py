@@ -0,0 +1,11 @@
+from app.utils.disjoint_set import DisjointSet
+
+def test_union_and_find():
+    sets = DisjointSet([1, 2, 3, 4, 5])
+    sets.union(1, 2)
+    sets.union(4, 5)
+    sets.union(2, 5)
+    
+    assert sets.find(1) == sets.find(4)
+    assert sets.find(3) != sets.find(1)
+    assert sorted(sorted(group) for group in sets.groups()) == [[1, 2, 4, 5], [3]]
@@ -0,0 +1,22 @@
+import pytest
+
+from app.utils.ip import pack_ip_address, parse_ip_query, unpack_ip_address
+
+def test_pack_ip_address_round_trip():
+    assert unpack_ip_address(pack_ip_address("177.12.4.2")) == "177.12.4.2"
+    assert unpack_ip_address(pack_ip_address("2001:db8::1")) == "2001:db8::1"
+    assert pack_ip_address("not an ip") is None
+
+def test_pack_ip_address_preserves_order():
+    assert pack_ip_address("9.255.255.255") < pack_ip_address("10.0.0.0") < pack_ip_address("2001:db8::")
+
+def test_parse_ip_query():
+    assert parse_ip_query("177.12.") == parse_ip_query("177.12.0.0/16") == parse_ip_query("177.12.*")
+    low, high = parse_ip_query("177.12.0.0/16")
+    assert low == pack_ip_address("177.12.0.0")
+    assert high == pack_ip_address("177.12.255.255")
+    assert parse_ip_query("10.0.0.1") == (pack_ip_address("10.0.0.1"), pack_ip_address("10.0.0.1"))
+
+def test_parse_ip_query_invalid():
+    with pytest.raises(ValueError):
+        parse_ip_query("not an ip")
@@ -0,0 +1,56 @@
+import sys
+
+from app.utils.ip import pack_ip_address, parse_ip_prefix
+from app.utils.ip_trie import IPTrie
+
+def key(address: str) -> int:
+    return int.from_bytes(pack_ip_address(address), "big")
+
+def build(sightings: list[tuple[str, int]]) -> IPTrie:
+    trie = IPTrie()
+    for address, profile_id in sightings:
+        trie.add(key(address), profile_id)
+    return trie
+
+def test_exact_lookup():
+    trie = build([("10.0.0.1", 1), ("10.0.0.1", 2), ("10.0.0.2", 3)])
+    
+    assert trie.get(key("10.0.0.1")) == {1, 2}
+    assert trie.get(key("10.0.0.3")) == set()
+    assert len(trie) == 2
+    assert trie.entries == 3
+
+def test_subnet_lookup():
+    trie = build([
+        ("177.12.4.2", 1),
+        ("177.12.200.9", 2),
+        ("177.13.0.1", 3),
+        ("2001:db8::1", 4),
+        ("2001:db9::1", 5),
+    ])
+    
+    assert trie.get_prefix(*parse_ip_prefix("177.12.0.0/16")) == {1, 2}
+    assert trie.get_prefix(*parse_ip_prefix("177.0.0.0/8")) == {1, 2, 3}
+    assert trie.get_prefix(*parse_ip_prefix("2001:db8::/32")) == {4}
+    assert trie.get_prefix(*parse_ip_prefix("0.0.0.0/0")) == {1, 2, 3}
+    assert trie.get_prefix(*parse_ip_prefix("::/0")) == {1, 2, 3, 4, 5}
+    assert trie.get_prefix(*parse_ip_prefix("10.0.0.0/8")) == set()
+
+def test_memory_report():
+    trie = build([("10.0.0.1", 1), ("10.0.0.2", 2)])
+    
+    assert trie.node_count() == 4
+    assert trie.memory_bytes() > 0
+
+def test_counters_match_a_full_walk():
+    trie = build([(f"10.0.{i % 7}.{i % 50}", i % 13) for i in range(500)] + [("2001:db8::1", 1)])
+    
+    nodes, size, stack = 0, 0, [trie._root]
+    while stack:
+        node = stack.pop()
+        nodes += 1
+        size += sys.getsizeof(node) + (sys.getsizeof(node.values) if node.values is not None else 0)
+        stack.extend(child for child in (node.left, node.right) if child is not None)
+    
+    assert trie.node_count() == nodes
+    assert trie.memory_bytes() == size